@@ -0,0 +1,42 @@
+"""Benchmarks the conversion functions on every script mix they're meant for.
+
+    python benchmarks/bench_conversion.py -o conversion.json [--sizes all]"""
+from runner import run_cases
+
+import wanakana
+from wanakana import ROMANISATIONS
+
+HEPBURN = {"romanisation": ROMANISATIONS["HEPBURN"]}
+KUNREI = {"romanisation": ROMANISATIONS["KUNREI"]}
+
+CASES = [
+    ("to_kana", wanakana.to_kana, "romaji", {}),
+    ("to_kana", wanakana.to_kana, "mixed", {}),
+    ("to_romaji[hepburn]", wanakana.to_romaji, "kana", HEPBURN),
+    ("to_romaji[hepburn]", wanakana.to_romaji, "mixed", HEPBURN),
+    ("to_romaji[kunrei]", wanakana.to_romaji, "kana", KUNREI),
+    ("to_romaji[kunrei]", wanakana.to_romaji, "mixed", KUNREI),
+    ("to_hiragana", wanakana.to_hiragana, "romaji", {}),
+    ("to_hiragana", wanakana.to_hiragana, "katakana", {}),
+    ("to_hiragana", wanakana.to_hiragana, "mixed", {}),
+    ("to_katakana", wanakana.to_katakana, "romaji", {}),
+    ("to_katakana", wanakana.to_katakana, "hiragana", {}),
+    ("to_katakana", wanakana.to_katakana, "mixed", {}),
+    (
+        "normalise_romaji[kunrei]",
+        wanakana.normalise_romaji,
+        "romaji",
+        {"destination_romanisation": ROMANISATIONS["KUNREI"]},
+    ),
+    (
+        "normalise_romaji[kunrei,kana]",
+        wanakana.normalise_romaji,
+        "mixed",
+        {"destination_romanisation": ROMANISATIONS["KUNREI"], "ignore_kana": False},
+    ),
+    ("strip_okurigana", wanakana.strip_okurigana, "okurigana", {}),
+    ("strip_okurigana[leading]", wanakana.strip_okurigana, "kana", {"leading": True}),
+]
+
+if __name__ == "__main__":
+    run_cases(CASES)
@@ -0,0 +1,66 @@
+"""Benchmarks importing wanakana in a fresh interpreter, and cold starts: the first
+use of parts of the API, which is where the lazily imported modules and the mapping
+tables are loaded.
+
+    python benchmarks/bench_import.py -o import.json
+
+Each value is the time taken by the statement itself in a new process, so the
+interpreter's own start-up isn't included"""
+import os
+import subprocess
+import sys
+
+from runner import ROOT
+
+import pyperf
+
+CASES = {
+    "import": "import wanakana",
+    "import *": "from wanakana import *",
+    "cold is_kana": "import wanakana; wanakana.is_kana('かな')",
+    "cold tokenise": "import wanakana; wanakana.tokenise('かなカナkana')",
+    "cold to_kana": "import wanakana; wanakana.to_kana('kana')",
+    "cold to_romaji": "import wanakana; wanakana.to_romaji('かなカーナ')",
+    "cold to_hiragana": "import wanakana; wanakana.to_hiragana('カーナ')",
+}
+
+TIMER = """\
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+# bytecode is cached for installed packages, so it should be here too
+ENVIRONMENT = {
+    name: value
+    for name, value in os.environ.items()
+    if name != "PYTHONDONTWRITEBYTECODE"
+}
+
+
+def time_statement(loops: int, statement: str) -> float:
+    total = 0.0
+    for _ in range(loops):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            check=True,
+            stdout=subprocess.PIPE,
+            # -c puts the working directory first on the path
+            cwd=ROOT,
+            env=ENVIRONMENT,
+            universal_newlines=True,
+        ).stdout
+        total += float(output)
+    return total
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    args = runner.parse_args()
+    if not args.worker:
+        # the first runs write the bytecode cache
+        for statement in CASES.values():
+            time_statement(1, statement)
+    for name, statement in CASES.items():
+        runner.bench_time_func(name, time_statement, statement)
@@ -0,0 +1,103 @@
+"""Measures the memory taken by the mapping tables: the nested dict trees they're
+built from, the automata made of them (a dict per state) and the compact automata
+(flat arrays, see `use_compact_tables`).
+
+    python benchmarks/bench_memory.py
+
+"deep size" adds up `sys.getsizeof` of every object reachable from the table
+(counting shared objects once), and "allocated" is what tracemalloc saw being
+allocated (and kept) while building the table, which leaves out the strings that
+are shared with the code it was built from"""
+import os
+import sys
+import tracemalloc
+from array import array
+from typing import Any, Callable, Tuple
+
+# measure the checkout rather than an installed copy. The runner does the same, but
+# importing it needs pyperf, which this doesn't use
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wanakana import ROMANISATIONS, create_romaji_to_kana_map
+from wanakana.utils import (
+    CompactMappingAutomaton,
+    MappingAutomaton,
+    get_kana_to_romaji_tree,
+)
+from wanakana.utils.snapshot import load_snapshot
+
+# imported up front, so that the module isn't counted as part of the first table
+import wanakana.utils.snapshot_tables
+
+TABLES = {
+    "romaji_to_kana": ("romaji_to_kana", False, False),
+    "romaji_to_kana[obsolete]": ("romaji_to_kana", True, False),
+    "romaji_to_kana[IME]": ("romaji_to_kana", False, True),
+    "kana_to_romaji[hepburn]": ("kana_to_romaji", ROMANISATIONS["HEPBURN"]),
+    "kana_to_romaji[kunrei]": ("kana_to_romaji", ROMANISATIONS["KUNREI"]),
+}
+TREES = {
+    "romaji_to_kana": create_romaji_to_kana_map,
+    "kana_to_romaji[hepburn]": lambda: get_kana_to_romaji_tree(
+        romanisation=ROMANISATIONS["HEPBURN"]
+    ),
+}
+
+
+def deep_size(value: Any, seen: set = None) -> int:
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += deep_size(key, seen) + deep_size(item, seen)
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            size += deep_size(item, seen)
+    elif isinstance(value, MappingAutomaton):
+        slots = type(value).__slots__ + MappingAutomaton.__slots__
+        for name in slots:
+            if name != "_regex" and hasattr(value, name):
+                size += deep_size(getattr(value, name), seen)
+    return size
+
+
+def allocated(build: Callable[[], Any]) -> Tuple[Any, int]:
+    tracemalloc.start()
+    try:
+        table = build()
+        return table, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def row(name: str, *columns: Any) -> str:
+    return f"{name:<28}" + "".join(f"{column:>14}" for column in columns)
+
+
+if __name__ == "__main__":
+    print(row("tree", "deep size"))
+    for name, build in TREES.items():
+        print(row(name, deep_size(build())))
+
+    print()
+    print(row("automaton", "dict deep", "compact deep", "dict alloc", "compact alloc"))
+    totals = array("q", [0, 0, 0, 0])
+    for name, key in TABLES.items():
+        automaton, dict_allocated = allocated(lambda: load_snapshot(key))
+        compact, compact_allocated = allocated(
+            lambda: CompactMappingAutomaton.from_automaton(automaton)
+        )
+        sizes = (
+            deep_size(automaton),
+            deep_size(compact),
+            dict_allocated,
+            compact_allocated,
+        )
+        for index, size in enumerate(sizes):
+            totals[index] += size
+        print(row(name, *sizes))
+    print(row("total", *totals))
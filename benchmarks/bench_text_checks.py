@@ -0,0 +1,31 @@
+"""Benchmarks tokenise and the is_* predicates, on text that passes each predicate
+(so the whole text is checked).
+
+    python benchmarks/bench_text_checks.py -o text_checks.json [--sizes all]"""
+from runner import run_cases
+
+import wanakana
+
+CASES = [
+    ("tokenise", wanakana.tokenise, "japanese", {}),
+    ("tokenise", wanakana.tokenise, "mixed", {}),
+    ("tokenise[compact]", wanakana.tokenise, "mixed", {"compact": True}),
+    ("tokenise[detailed]", wanakana.tokenise, "mixed", {"detailed": True}),
+    (
+        "tokenise[compact,detailed]",
+        wanakana.tokenise,
+        "mixed",
+        {"compact": True, "detailed": True},
+    ),
+    ("is_hiragana", wanakana.is_hiragana, "hiragana", {}),
+    ("is_katakana", wanakana.is_katakana, "katakana", {}),
+    ("is_kana", wanakana.is_kana, "kana", {}),
+    ("is_kanji", wanakana.is_kanji, "kanji", {}),
+    ("is_japanese", wanakana.is_japanese, "japanese", {}),
+    ("is_romaji", wanakana.is_romaji, "romaji", {}),
+    ("is_mixed", wanakana.is_mixed, "mixed", {}),
+    ("is_mixed", wanakana.is_mixed, "japanese", {}),
+]
+
+if __name__ == "__main__":
+    run_cases(CASES)
@@ -0,0 +1,77 @@
+"""Benchmarks conversions running on several threads at once, to see how throughput
+scales with the number of threads.
+
+    python benchmarks/bench_threads.py -o threads.json [--sizes 1k] [--filter x4]
+
+Each value is the wall time per conversion with every thread converting the same
+text in a loop, so perfect scaling divides it by the number of threads. That only
+happens on free-threaded builds of CPython (3.13t and later, the `gil_enabled`
+metadata says which build was used); with the GIL the threads take turns and the
+value stays about the same"""
+import sys
+import threading
+import time
+from typing import Callable
+
+from runner import make_runner, selected_sizes
+from corpus import SIZES, make_corpus
+
+import wanakana
+
+THREADS = [1, 2, 4, 8]
+
+# (name, function, script)
+CASES = [
+    ("to_kana", wanakana.to_kana, "romaji"),
+    ("to_romaji", wanakana.to_romaji, "kana"),
+    ("to_hiragana", wanakana.to_hiragana, "mixed"),
+    ("to_katakana", wanakana.to_katakana, "mixed"),
+    ("tokenise", wanakana.tokenise, "japanese"),
+]
+
+
+def time_threads(loops: int, function: Callable, text: str, threads: int) -> float:
+    # the threads are started before the clock is, and all begin together
+    barrier = threading.Barrier(threads + 1)
+
+    def convert():
+        barrier.wait()
+        for _ in range(loops):
+            function(text)
+
+    workers = [threading.Thread(target=convert) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - start) / threads
+
+
+if __name__ == "__main__":
+    runner = make_runner()
+    runner.parse_args()
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    for name, function, script in CASES:
+        for size in selected_sizes(runner):
+            text = make_corpus(script, SIZES[size])
+            # the first conversion builds the tables, which isn't what's measured
+            function(text)
+            for threads in THREADS:
+                benchmark_name = f"{name}/{script}/{size}/x{threads}"
+                if runner.args.filter not in benchmark_name:
+                    continue
+                runner.bench_time_func(
+                    benchmark_name,
+                    time_threads,
+                    function,
+                    text,
+                    threads,
+                    metadata={
+                        "script": script,
+                        "characters": len(text),
+                        "threads": threads,
+                        "gil_enabled": is_gil_enabled(),
+                    },
+                )
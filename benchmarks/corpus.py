@@ -0,0 +1,116 @@
+"""Synthetic text for the benchmarks, the same on every run so that results can be
+compared across commits"""
+import random
+from functools import lru_cache
+
+# sizes in characters, by name
+SIZES = {
+    "10": 10,
+    "1k": 1_000,
+    "100k": 100_000,
+    "1M": 1_000_000,
+    "10M": 10_000_000,
+}
+DEFAULT_SIZES = ["10", "1k", "100k"]
+
+# larger texts are this much text repeated
+BLOCK_SIZE = 1 << 16
+
+ROMAJI_WORDS = [
+    "kyou",
+    "wa",
+    "ii",
+    "tenki",
+    "desu",
+    "ne",
+    "sensei",
+    "gakkou",
+    "shinbun",
+    "kitte",
+    "ryokou",
+    "onna",
+    "chotto",
+    "matte",
+    "kudasai",
+    "konpyu-ta-",
+    "jisho",
+    "nihongo",
+]
+HIRAGANA_WORDS = [
+    "きょう",
+    "は",
+    "いい",
+    "てんき",
+    "です",
+    "ね",
+    "がっこう",
+    "しんぶん",
+    "きって",
+    "りょこう",
+    "ちょっと",
+    "まって",
+    "ください",
+    "じしょ",
+]
+KATAKANA_WORDS = [
+    "コンピューター",
+    "スーパー",
+    "ラーメン",
+    "テレビ",
+    "パーティー",
+    "カード",
+    "メール",
+    "ゲーム",
+    "ヴァイオリン",
+    "チョコレート",
+    "シャツ",
+]
+KANJI_WORDS = ["日本語", "漢字", "勉強", "学校", "先生", "新聞", "天気", "旅行"]
+OKURIGANA_WORDS = ["踏み込む", "お祝い", "申し込み", "食べる", "話す", "美しい"]
+
+EN_SEPARATORS = [" ", " ", " ", ", ", ". ", "! ", "? "]
+JA_SEPARATORS = ["", "", "", "、", "。", "！", "？", "　"]
+
+# the words and separators of each script mix (the single script mixes are only
+# that script, so that they pass the is_* predicates)
+SCRIPTS = {
+    "romaji": (ROMAJI_WORDS, EN_SEPARATORS),
+    "hiragana": (HIRAGANA_WORDS, [""]),
+    "katakana": (KATAKANA_WORDS, [""]),
+    "kana": (HIRAGANA_WORDS + KATAKANA_WORDS, [""]),
+    "kanji": (KANJI_WORDS, [""]),
+    "japanese": (
+        HIRAGANA_WORDS + KATAKANA_WORDS + KANJI_WORDS + OKURIGANA_WORDS,
+        JA_SEPARATORS,
+    ),
+    "okurigana": (OKURIGANA_WORDS, ["、", ""]),
+    "mixed": (
+        ROMAJI_WORDS + HIRAGANA_WORDS + KATAKANA_WORDS + KANJI_WORDS,
+        EN_SEPARATORS + JA_SEPARATORS,
+    ),
+}
+
+
+def _words(script: str, size: int, seed: int) -> str:
+    words, separators = SCRIPTS[script]
+    rng = random.Random(f"{script}/{seed}")
+    pieces = [rng.choice(words)]
+    length = len(pieces[0])
+    while length < size:
+        piece = rng.choice(separators) + rng.choice(words)
+        pieces.append(piece)
+        length += len(piece)
+    return "".join(pieces)
+
+
+@lru_cache(maxsize=None)
+def make_corpus(script: str, size: int, seed: int = 0) -> str:
+    """Returns about `size` characters of `script` text (see SCRIPTS), made of whole
+    words so that it always ends with a complete word"""
+    if size <= BLOCK_SIZE:
+        return _words(script, size, seed)
+    block = _words(script, BLOCK_SIZE, seed)
+    # join the copies like any other two words
+    separator = SCRIPTS[script][1][0]
+    copies = -(-size // (len(block) + len(separator)))
+    return separator.join([block] * copies)
@@ -0,0 +1,67 @@
+"""The pyperf runner shared by the benchmark scripts.
+
+Every script takes pyperf's usual options (such as `-o results.json`, `--fast` or
+`--rigorous`), plus `--sizes` to choose the corpus sizes and `--filter` to only run
+the benchmarks whose names contain the given text"""
+import os
+import sys
+from functools import partial
+from typing import Callable, Iterable, Tuple
+
+import pyperf
+
+# benchmark the checkout these scripts are in, rather than an installed copy
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from corpus import DEFAULT_SIZES, SIZES, make_corpus
+
+# (name, function, script, keyword arguments)
+Case = Tuple[str, Callable, str, dict]
+
+
+def _forward_arguments(cmd: list, args):
+    # the worker processes need the same options to run the same benchmarks
+    cmd.extend(["--sizes", args.sizes, "--filter", args.filter])
+
+
+def make_runner() -> pyperf.Runner:
+    runner = pyperf.Runner(add_cmdline_args=_forward_arguments)
+    runner.argparser.add_argument(
+        "--sizes",
+        default=",".join(DEFAULT_SIZES),
+        help=f"comma-separated corpus sizes, out of {', '.join(SIZES)} "
+        "(or 'all'; default: %(default)s)",
+    )
+    runner.argparser.add_argument(
+        "--filter", default="", help="only run benchmarks whose names contain this"
+    )
+    return runner
+
+
+def selected_sizes(runner: pyperf.Runner) -> Iterable[str]:
+    sizes = runner.args.sizes
+    if sizes == "all":
+        return list(SIZES)
+    return [size.strip() for size in sizes.split(",") if size.strip()]
+
+
+def run_cases(cases: Iterable[Case], runner: pyperf.Runner = None):
+    """Benchmarks every case on every selected size of its script's corpus"""
+    if runner is None:
+        runner = make_runner()
+    runner.parse_args()
+    sizes = selected_sizes(runner)
+
+    for name, function, script, kwargs in cases:
+        for size in sizes:
+            benchmark_name = f"{name}/{script}/{size}"
+            if runner.args.filter not in benchmark_name:
+                continue
+            text = make_corpus(script, SIZES[size])
+            runner.bench_func(
+                benchmark_name,
+                partial(function, **kwargs),
+                text,
+                metadata={"script": script, "characters": len(text)},
+            )
@@ -26,6 +26,12 @@ setup(
     license="MPL-2.0",
     packages=find_packages(),
     include_package_data=True,
-    classifiers=["Programming Language :: Python :: 3.6"],
+    extras_require={"vectorized": ["numpy"], "benchmarks": ["pyperf"]},
+    python_requires=">=3.7",
+    classifiers=[
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
+        "Programming Language :: Python :: 3.7",
+    ],
 )
 
@@ -0,0 +1,45 @@
+from wanakana import (
+    create_kana_to_romaji_automaton,
+    create_romaji_to_kana_automaton,
+    to_hiragana,
+    to_kana,
+    to_katakana,
+    to_romaji,
+    use_compact_tables,
+)
+from wanakana.utils import CompactMappingAutomaton
+
+ROMAJI = ["onaji buttsuuji", "kinnyuu nyan", "WaNaKaNa desu!", "wiwe xtsu", "kk n"]
+KANA = ["おなじ ぶっつうじ", "シンブン、ワナカナです!", "ゲーム だっ", "ヴァイオリン ー"]
+CUSTOM_KANA = {"na": "に", "ka": "Bana"}
+CUSTOM_ROMAJI = {"じ": "zi", "ふ": "hu"}
+
+
+def convert_all():
+    results = []
+    for convert_ending in (True, False):
+        for input in ROMAJI:
+            results.append(to_kana(input, convert_ending=convert_ending))
+            results.append(to_kana(input, use_obsolete_kana=True))
+            results.append(to_kana(input, custom_kana_mapping=CUSTOM_KANA))
+            results.append(to_hiragana(input, convert_ending=convert_ending))
+            results.append(to_katakana(input, convert_ending=convert_ending))
+        for input in KANA:
+            results.append(to_romaji(input, convert_ending=convert_ending))
+            results.append(to_romaji(input, romanisation="kunrei"))
+            results.append(to_romaji(input, custom_romaji_mapping=CUSTOM_ROMAJI))
+            results.append(to_hiragana(input, convert_ending=convert_ending))
+            results.append(to_katakana(input, convert_ending=convert_ending))
+    return results
+
+
+def test_compact_tables_convert_the_same():
+    expected = convert_all()
+    use_compact_tables(True)
+    try:
+        assert isinstance(create_romaji_to_kana_automaton(), CompactMappingAutomaton)
+        assert isinstance(create_kana_to_romaji_automaton(), CompactMappingAutomaton)
+        assert convert_all() == expected
+    finally:
+        use_compact_tables(False)
+    assert not isinstance(create_romaji_to_kana_automaton(), CompactMappingAutomaton)
@@ -0,0 +1,89 @@
+import pytest
+
+from wanakana import to_hiragana, to_kana, to_katakana, to_romaji
+
+ROMAJI = [
+    "",
+    "onaji buttsuuji",
+    "kinnyuu n nn nyan",
+    "shinbun, WaNaKaNa desu!",
+    "KANA to kana",
+    "chotto matte... sugoi!!",
+    "xtsu ltsu vu wi we di",
+    "kyakuMAKU",
+    "tsun",
+    "n",
+    "kk",
+]
+KANA = [
+    "",
+    "おなじ ぶっつうじ",
+    "きんにゅう にゃん",
+    "シンブン、ワナカナです!",
+    "ゲーム ゲーム だっ",
+    "ファイル ヴァイオリン",
+    "きゃく カタカナ ひらがな ー",
+    "っ",
+    "ん",
+]
+CUSTOM_KANA = {"na": "に", "ka": "Bana"}
+CUSTOM_ROMAJI = {"じ": "zi", "ふ": "hu"}
+
+
+@pytest.mark.parametrize("input", ROMAJI)
+@pytest.mark.parametrize("convert_ending", [True, False])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"use_obsolete_kana": True},
+        {"custom_kana_mapping": CUSTOM_KANA},
+        {"enforce": "hira"},
+        {"enforce": "kata"},
+    ],
+)
+def test_to_kana_regex_matches_trie(input, convert_ending, options):
+    assert to_kana(
+        input, convert_ending=convert_ending, backend="regex", **options
+    ) == to_kana(input, convert_ending=convert_ending, **options)
+
+
+@pytest.mark.parametrize("input", KANA)
+@pytest.mark.parametrize("convert_ending", [True, False])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"uppercase_katakana": True},
+        {"romanisation": "kunrei"},
+        {"custom_romaji_mapping": CUSTOM_ROMAJI},
+    ],
+)
+def test_to_romaji_regex_matches_trie(input, convert_ending, options):
+    assert to_romaji(
+        input, convert_ending=convert_ending, backend="regex", **options
+    ) == to_romaji(input, convert_ending=convert_ending, **options)
+
+
+@pytest.mark.parametrize("convert", [to_hiragana, to_katakana])
+@pytest.mark.parametrize("input", ROMAJI + KANA)
+@pytest.mark.parametrize("convert_ending", [True, False])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"ignore_romaji": True},
+        {"use_obsolete_kana": True},
+        {"custom_kana_mapping": CUSTOM_KANA},
+    ],
+)
+def test_kana_scripts_regex_matches_trie(convert, input, convert_ending, options):
+    assert convert(
+        input, convert_ending=convert_ending, backend="regex", **options
+    ) == convert(input, convert_ending=convert_ending, **options)
+
+
+@pytest.mark.parametrize("convert", [to_kana, to_romaji, to_hiragana, to_katakana])
+def test_unknown_backend_is_rejected(convert):
+    with pytest.raises(ValueError):
+        convert("kana", backend="REGEX")
@@ -0,0 +1,6 @@
+from wanakana.utils.generate_snapshot import stale_snapshots
+
+
+def test_snapshots_match_mapping_trees():
+    # regenerate with `python -m wanakana.utils.generate_snapshot` if this fails
+    assert stale_snapshots() == []
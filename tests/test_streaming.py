@@ -0,0 +1,56 @@
+import pytest
+
+from wanakana import create_romaji_to_kana_automaton, to_kana, to_romaji
+from wanakana.streaming import stream_to_kana, stream_to_romaji
+
+ROMAJI = ["onaji buttsuuji", "kinnyuu n nyan", "WaNaKaNa desu!", "xtsu wi tsun", "kk"]
+KANA = ["おなじ ぶっつうじ", "シンブン、ワナカナです!", "ゲーム だっ", "ヴァイオリン きゃっ"]
+
+
+def splits(input):
+    for position in range(len(input) + 1):
+        yield [input[:position], input[position:]]
+    yield list(input)
+
+
+@pytest.mark.parametrize("input", ROMAJI)
+@pytest.mark.parametrize("convert_ending", [True, False])
+def test_scan_in_pieces_matches_whole(input, convert_ending):
+    automaton = create_romaji_to_kana_automaton()
+    expected, consumed = automaton.scan(input.lower(), convert_ending)
+    assert consumed == len(input)
+    for pieces in splits(input.lower()):
+        chunks = []
+        # the chunks' positions are relative to where each scan started
+        start = 0
+        pending = ""
+        for piece in pieces + [None]:
+            final = piece is None
+            pending += piece or ""
+            piece_chunks, consumed = automaton.scan(pending, convert_ending, final)
+            chunks += [(start + i, start + j, kana) for i, j, kana in piece_chunks]
+            start += consumed
+            pending = pending[consumed:]
+        assert pending == ""
+        assert chunks == expected
+
+
+@pytest.mark.parametrize("input", ROMAJI)
+@pytest.mark.parametrize("convert_ending", [True, False])
+def test_stream_to_kana_matches_to_kana(input, convert_ending):
+    expected = to_kana(input, convert_ending=convert_ending)
+    for pieces in splits(input):
+        assert (
+            "".join(stream_to_kana(pieces, convert_ending=convert_ending)) == expected
+        )
+
+
+@pytest.mark.parametrize("input", KANA)
+@pytest.mark.parametrize("convert_ending", [True, False])
+def test_stream_to_romaji_matches_to_romaji(input, convert_ending):
+    expected = to_romaji(input, convert_ending=convert_ending)
+    for pieces in splits(input):
+        assert (
+            "".join(stream_to_romaji(pieces, convert_ending=convert_ending))
+            == expected
+        )
@@ -1,4 +1,125 @@
-from .utils import *
-from .constants import *
-from .common import *
-from .japanese import *
+from importlib import import_module
+from . import utils
+from .utils import _find_reexport
+
+# as in wanakana.utils, the submodules are only imported when one of their names is
+# first used (PEP 562), with later submodules taking precedence
+_submodules = {
+    "utils": utils.__all__,
+    "constants": [
+        "TO_KANA_METHODS",
+        "ROMANISATIONS",
+        "CONVERSION_BACKENDS",
+        "MAPPING_DIRECTIONS",
+        "DEFAULT_OPTIONS",
+        "LATIN_LOWERCASE_START",
+        "LATIN_LOWERCASE_END",
+        "LATIN_UPPERCASE_START",
+        "LATIN_UPPERCASE_END",
+        "LOWERCASE_ZENKAKU_START",
+        "LOWERCASE_ZENKAKU_END",
+        "UPPERCASE_ZENKAKU_START",
+        "UPPERCASE_ZENKAKU_END",
+        "HIRAGANA_START",
+        "HIRAGANA_END",
+        "KATAKANA_START",
+        "KATAKANA_END",
+        "KANJI_START",
+        "KANJI_END",
+        "PROLONGED_SOUND_MARK",
+        "KANA_SLASH_DOT",
+        "ZENKAKU_NUMBERS",
+        "ZENKAKU_UPPERCASE",
+        "ZENKAKU_LOWERCASE",
+        "ZENKAKU_PUNCTUATION_1",
+        "ZENKAKU_PUNCTUATION_2",
+        "ZENKAKU_PUNCTUATION_3",
+        "ZENKAKU_PUNCTUATION_4",
+        "ZENKAKU_SYMBOLS_CURRENCY",
+        "HIRAGANA_CHARS",
+        "KATAKANA_CHARS",
+        "HANKAKU_KATAKANA",
+        "KATAKANA_PUNCTUATION",
+        "KANA_PUNCTUATION",
+        "CJK_SYMBOLS_PUNCTUATION",
+        "COMMON_CJK",
+        "RARE_CJK",
+        "KANA_RANGES",
+        "JA_PUNCTUATION_RANGES",
+        "JAPANESE_RANGES",
+        "MODERN_ENGLISH",
+        "HEPBURN_MACRON_RANGES",
+        "SMART_QUOTE_RANGES",
+        "ROMAJI_RANGES",
+        "EN_PUNCTUATION_RANGES",
+    ],
+    "common": [
+        "is_hiragana",
+        "is_katakana",
+        "is_japanese",
+        "is_kana",
+        "is_kanji",
+        "is_mixed",
+        "is_romaji",
+        "is_char_en_space",
+        "is_char_ja_space",
+        "is_char_en_num",
+        "is_char_ja_num",
+        "TOKEN_TYPES",
+        "get_type",
+        "iter_tokens",
+        "tokenise",
+    ],
+    "japanese": [
+        "is_leading_without_initial_kana",
+        "is_trailing_without_final_kana",
+        "is_invalid_matcher",
+        "strip_okurigana",
+        "custom_mapping_cache",
+        "conversion_cache",
+        "configure_conversion_cache",
+        "set_conversion_backend",
+        "get_conversion_backend",
+        "use_compact_tables",
+        "compile_mapping",
+        "CompiledMapping",
+        "create_romaji_to_kana_map",
+        "create_romaji_to_kana_automaton",
+        "create_kana_to_romaji_automaton",
+        "to_kana",
+        "to_kana_with_offsets",
+        "to_kana_many",
+        "split_into_romaji",
+        "to_romaji",
+        "to_romaji_with_offsets",
+        "to_romaji_many",
+        "to_hiragana",
+        "to_katakana",
+        "normalise_romaji",
+    ],
+}
+_lazy_names = {
+    name: module for module, names in _submodules.items() for name in names
+}
+
+__all__ = list(_lazy_names)
+
+
+def __getattr__(name: str):
+    if name in _submodules:
+        return import_module(f".{name}", __name__)
+    if name in _lazy_names:
+        value = getattr(import_module(f".{_lazy_names[name]}", __name__), name)
+    else:
+        try:
+            value = _find_reexport(name, __name__, ["constants", "common", "japanese"])
+        except AttributeError:
+            if not hasattr(utils, name):
+                raise
+            value = getattr(utils, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted({*globals(), *_submodules, *_lazy_names})
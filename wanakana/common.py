@@ -1,7 +1,19 @@
-from typing import Iterable, Union, List
-from collections import deque
+from typing import Iterable, Iterator, Union, List, Tuple
 import re
 from .utils import (
+    char_flags,
+    BMP_SIZE,
+    CHAR_ROMAJI,
+    CHAR_ENGLISH_PUNCTUATION,
+    CHAR_JAPANESE,
+    CHAR_JAPANESE_PUNCTUATION,
+    CHAR_HIRAGANA,
+    CHAR_KATAKANA,
+    CHAR_KANJI,
+    CHAR_ENGLISH_NUMERAL,
+    CHAR_JAPANESE_NUMERAL,
+    CHAR_ENGLISH_SPACE,
+    CHAR_JAPANESE_SPACE,
     is_empty,
     is_char_hiragana,
     is_char_katakana,
@@ -9,8 +21,6 @@ from .utils import (
     is_char_kana,
     is_char_kanji,
     is_char_romaji,
-    is_char_english_punctuation,
-    is_char_japanese_punctuation,
 )
 
 
@@ -79,86 +89,112 @@ TOKEN_TYPES = {
 }
 
 
-def get_type(input: str, compact: bool = False) -> str:
-    EN = "en"
-    JA = "ja"
-    EN_NUM = "english_numeral"
-    JA_NUM = "japanese_numeral"
-    EN_PUNC = "english_punctuation"
-    JA_PUNC = "japanese_punctuation"
-    KANJI = "kanji"
-    HIRAGANA = "hiragana"
-    KATAKANA = "katakana"
-    SPACE = "space"
-    OTHER = "other"
+def _get_type_of_flags(flags: int, compact: bool = False) -> str:
     if compact:
-        if is_char_ja_num(input) or is_char_en_num(input):
-            return OTHER
-        if is_char_en_space(input):
-            return EN
-        if is_char_english_punctuation(input):
-            return OTHER
-        if is_char_ja_space(input):
-            return JA
-        if is_char_japanese_punctuation(input):
-            return OTHER
-        if is_char_japanese(input):
-            return JA
-        if is_char_romaji(input):
-            return EN
-        return OTHER
+        if flags & (CHAR_JAPANESE_NUMERAL | CHAR_ENGLISH_NUMERAL):
+            return TOKEN_TYPES["OTHER"]
+        if flags & CHAR_ENGLISH_SPACE:
+            return TOKEN_TYPES["EN"]
+        if flags & CHAR_ENGLISH_PUNCTUATION:
+            return TOKEN_TYPES["OTHER"]
+        if flags & CHAR_JAPANESE_SPACE:
+            return TOKEN_TYPES["JA"]
+        if flags & CHAR_JAPANESE_PUNCTUATION:
+            return TOKEN_TYPES["OTHER"]
+        if flags & CHAR_JAPANESE:
+            return TOKEN_TYPES["JA"]
+        if flags & CHAR_ROMAJI:
+            return TOKEN_TYPES["EN"]
+        return TOKEN_TYPES["OTHER"]
     else:
-        if is_char_ja_num(input):
-            return JA_NUM
-        if is_char_en_num(input):
-            return EN_NUM
-        if is_char_en_space(input):
-            return SPACE
-        if is_char_english_punctuation(input):
-            return EN_PUNC
-        if is_char_ja_space(input):
-            return SPACE
-        if is_char_japanese_punctuation(input):
-            return JA_PUNC
-        if is_char_kanji(input):
-            return KANJI
-        if is_char_hiragana(input):
-            return HIRAGANA
-        if is_char_katakana(input):
-            return KATAKANA
-        if is_char_japanese(input):
-            return JA
-        if is_char_romaji(input):
-            return EN
-        return OTHER
+        if flags & CHAR_JAPANESE_NUMERAL:
+            return TOKEN_TYPES["JA_NUM"]
+        if flags & CHAR_ENGLISH_NUMERAL:
+            return TOKEN_TYPES["EN_NUM"]
+        if flags & CHAR_ENGLISH_SPACE:
+            return TOKEN_TYPES["SPACE"]
+        if flags & CHAR_ENGLISH_PUNCTUATION:
+            return TOKEN_TYPES["EN_PUNC"]
+        if flags & CHAR_JAPANESE_SPACE:
+            return TOKEN_TYPES["SPACE"]
+        if flags & CHAR_JAPANESE_PUNCTUATION:
+            return TOKEN_TYPES["JA_PUNC"]
+        if flags & CHAR_KANJI:
+            return TOKEN_TYPES["KANJI"]
+        if flags & CHAR_HIRAGANA:
+            return TOKEN_TYPES["HIRAGANA"]
+        if flags & CHAR_KATAKANA:
+            return TOKEN_TYPES["KATAKANA"]
+        if flags & CHAR_JAPANESE:
+            return TOKEN_TYPES["JA"]
+        if flags & CHAR_ROMAJI:
+            return TOKEN_TYPES["EN"]
+        return TOKEN_TYPES["OTHER"]
+
+
+# token types of each combination of character categories, filled in as they are seen
+_types_by_flags = ({}, {})
+
+
+def get_type(input: str, compact: bool = False) -> str:
+    flags = char_flags(input)
+    types = _types_by_flags[bool(compact)]
+    type = types.get(flags)
+    if type is None:
+        type = types[flags] = _get_type_of_flags(flags, compact)
+    return type
+
+
+# token types of each character, filled in as they are seen (only for the Basic
+# Multilingual Plane, so that they can't grow without bound)
+_types_by_char = ({}, {})
+
+
+def _iter_token_spans(input: str, compact: bool) -> Iterator[Tuple[str, int, int]]:
+    types = _types_by_char[bool(compact)]
+    run_type = None
+    run_start = 0
+    for index, char in enumerate(input):
+        type = types.get(char)
+        if type is None:
+            type = get_type(char, compact)
+            if ord(char) < BMP_SIZE:
+                types[char] = type
+        # the types are shared strings, so identity is enough
+        if type is not run_type:
+            if run_type is not None:
+                yield run_type, run_start, index
+            run_type = type
+            run_start = index
+    if run_type is not None:
+        yield run_type, run_start, len(input)
+
+
+def iter_tokens(
+    input: str, compact: bool = False, detailed: bool = False, spans: bool = False
+) -> Iterator[Union[str, List[str], Tuple[str, int, int]]]:
+    """Yields the tokens of `input` one at a time, like `tokenise`, so that large
+    documents can be tokenised lazily"""
+    if is_empty(input):
+        return iter(())
+    token_spans = _iter_token_spans(input, compact)
+    if spans:
+        return token_spans
+    if detailed:
+        return ([type, input[start:end]] for type, start, end in token_spans)
+    return (input[start:end] for _, start, end in token_spans)
 
 
 def tokenise(
-    input: str, compact: bool = False, detailed: bool = False
-) -> Union[List[str], List[List[str]]]:
+    input: str, compact: bool = False, detailed: bool = False, spans: bool = False
+) -> Union[List[str], List[List[str]], List[Tuple[str, int, int]]]:
     """Splits input into list of strings separated by opinionated token types
     `'en', 'ja', 'english_numeral', 'japanese_numeral', 'english_punctuation',
     'japanese_punctuation', 'kanji', 'hiragana', 'katakana', 'space', 'other'`
     If `compact` is set then many same-language tokens are combined (spaces + text,
     kanji + kana, numeral + punctuation)
     If `detailed` is set then returned list will contain `[type, value]` instead of
-    `value`"""
-    if is_empty(input):
-        return []
-    chars = deque(input)
-    initial = chars.popleft()
-    prev_type = get_type(initial, compact)
-    initial = [prev_type, initial] if detailed else initial
-
-    tokens = [initial]
-    for char in chars:
-        curr_type = get_type(char, compact)
-        same_type = curr_type == prev_type
-        prev_type = curr_type
-        new_value = char
-
-        if same_type:
-            new_value = (tokens.pop()[1] if detailed else tokens.pop()) + new_value
-
-        tokens.append([curr_type, new_value] if detailed else new_value)
-    return tokens
+    `value`
+    If `spans` is set then returned list will contain `(type, start, end)` instead,
+    where `input[start:end]` is the value"""
+    return list(iter_tokens(input, compact, detailed, spans))
@@ -2,6 +2,12 @@ TO_KANA_METHODS = {"HIRAGANA": "to_hiragana", "KATAKANA": "to_katakana"}
 
 ROMANISATIONS = {"HEPBURN": "hepburn", "KUNREI": "kunrei"}
 
+# how to_kana, to_romaji, to_hiragana and to_katakana apply the mappings
+CONVERSION_BACKENDS = {"TRIE": "trie", "REGEX": "regex"}
+
+# which way a mapping made by compile_mapping converts
+MAPPING_DIRECTIONS = {"TO_KANA": "to_kana", "TO_ROMAJI": "to_romaji"}
+
 DEFAULT_OPTIONS = {
     "use_obsolete_kana": False,
     "pass_romaji": False,
@@ -0,0 +1,108 @@
+"""Conversions with their options bound once, for hot loops.
+
+The module-level functions check and resolve their options (and look up the mapping)
+on every call. A `Converter` does all of that when it's made, so each call only
+scans its input: build one per set of options (e.g. per tenant) and reuse it."""
+from functools import partial
+from typing import List, Union
+
+from .common import tokenise
+from .constants import ROMANISATIONS, CONVERSION_BACKENDS
+from .japanese import (
+    _check_backend,
+    _converted_to_hiragana,
+    _converted_to_katakana,
+    _hiragana_route,
+    _kana_converter,
+    _katakana_route,
+    _romaji_converter,
+    create_kana_to_romaji_automaton,
+    create_romaji_to_kana_automaton,
+    get_conversion_backend,
+)
+
+
+class Converter:
+    """Converts like `to_kana`, `to_romaji`, `to_hiragana` and `to_katakana` (and
+    tokenises like `tokenise`) with the options given here, which can't be changed
+    afterwards. The conversions aren't memoised by `configure_conversion_cache`, and
+    the `backend` is the default one when the converter is made unless it is
+    given"""
+
+    __slots__ = ("_to_kana", "_to_romaji", "_to_hiragana", "_to_katakana", "_tokenise")
+
+    def __init__(
+        self,
+        use_obsolete_kana: bool = False,
+        custom_kana_mapping: dict = None,
+        convert_ending: bool = True,
+        enforce: Union[None, "hira", "kata"] = None,
+        ignore_romaji: bool = False,
+        uppercase_katakana: bool = False,
+        custom_romaji_mapping: dict = None,
+        romanisation: ROMANISATIONS = ROMANISATIONS["HEPBURN"],
+        compact: bool = False,
+        detailed: bool = False,
+        backend: CONVERSION_BACKENDS = None,
+    ):
+        if enforce not in [None, "hira", "kata"]:
+            enforce = None
+        if backend is not None:
+            _check_backend(backend)
+        backend = backend or get_conversion_backend()
+        kana_map = create_romaji_to_kana_automaton(
+            use_obsolete_kana=use_obsolete_kana,
+            custom_kana_mapping=custom_kana_mapping,
+        )
+        romaji_map = create_kana_to_romaji_automaton(
+            romanisation=romanisation, custom_romaji_mapping=custom_romaji_mapping
+        )
+        converted_to_hiragana = partial(
+            _converted_to_hiragana,
+            convert_ending=convert_ending,
+            backend=backend,
+            kana_map=kana_map,
+        )
+        converted_to_katakana = partial(
+            _converted_to_katakana,
+            convert_ending=convert_ending,
+            backend=backend,
+            kana_map=kana_map,
+        )
+
+        def to_hiragana(input: str) -> str:
+            return converted_to_hiragana(input, _hiragana_route(input, ignore_romaji))
+
+        def to_katakana(input: str) -> str:
+            return converted_to_katakana(input, _katakana_route(input, ignore_romaji))
+
+        assign = partial(object.__setattr__, self)
+        assign("_to_kana", _kana_converter(kana_map, convert_ending, enforce, backend))
+        assign(
+            "_to_romaji",
+            _romaji_converter(romaji_map, uppercase_katakana, convert_ending, backend),
+        )
+        assign("_to_hiragana", to_hiragana)
+        assign("_to_katakana", to_katakana)
+        assign("_tokenise", partial(tokenise, compact=compact, detailed=detailed))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def to_kana(self, input: str = "") -> str:
+        return self._to_kana(input)
+
+    def to_romaji(self, input: str = "") -> str:
+        return self._to_romaji(input)
+
+    def to_hiragana(self, input: str = "") -> str:
+        return self._to_hiragana(input)
+
+    def to_katakana(self, input: str = "") -> str:
+        return self._to_katakana(input)
+
+    def tokenise(self, input: str = "") -> Union[List[str], List[List[str]]]:
+        return self._tokenise(input)
@@ -0,0 +1,108 @@
+"""Converts Romaji to Kana keystroke by keystroke, for input method backends.
+
+Rather than converting the whole buffer on every keypress, `IMEConverter` keeps the
+kana committed so far and the Romaji of the mapping still being typed, so each
+keystroke only converts the few characters that are still pending."""
+from typing import List, Tuple, Union
+
+from .japanese import _join_kana, create_romaji_to_kana_automaton
+
+
+def _difference(old: str, new: str) -> Tuple[int, str]:
+    """Returns how many characters to delete from the end of `old`, and the text to
+    insert after that, to turn `old` into `new`"""
+    common = 0
+    for old_char, new_char in zip(old, new):
+        if old_char != new_char:
+            break
+        common += 1
+    return len(old) - common, new[common:]
+
+
+class IMEConverter:
+    """Converts Romaji to Kana (like `to_kana`) as it is typed.
+
+    `append` and `delete` return the change to the displayed text as a
+    `(deleted, inserted)` pair: the number of characters to remove from the end of
+    the display, followed by the text to add. Romaji that could still become part of
+    a longer mapping (for example "k", "ky" or "n") is displayed as typed, which is
+    the same as `to_kana` with `convert_ending` unset, and a single n only becomes ん
+    once the next character is typed (or "nn" is typed)"""
+
+    def __init__(
+        self,
+        use_obsolete_kana: bool = False,
+        custom_kana_mapping: dict = None,
+        enforce: Union[None, "hira", "kata"] = None,
+    ):
+        if enforce not in [None, "hira", "kata"]:
+            enforce = None
+        self._kana_map = create_romaji_to_kana_automaton(
+            use_obsolete_kana=use_obsolete_kana,
+            custom_kana_mapping=custom_kana_mapping,
+            IME_mode=True,
+        )
+        self._enforce = enforce
+        # the kana committed by each keystroke, and what was pending before it
+        self._committed: List[str] = []
+        self._history: List[str] = []
+        # romaji typed since the last committed kana, and how it is displayed
+        self._pending = ""
+        self._pending_display = ""
+
+    def __len__(self) -> int:
+        """The number of characters typed"""
+        return len(self._history)
+
+    @property
+    def value(self) -> str:
+        """The text currently displayed"""
+        return "".join(self._committed) + self._pending_display
+
+    def _display(self, pending: str) -> str:
+        return _join_kana(
+            pending, self._kana_map.apply(pending.lower(), False), self._enforce
+        )
+
+    def append(self, text: str) -> Tuple[int, str]:
+        """Types `text` one character at a time"""
+        old_display = self._pending_display
+        committed = []
+        for char in text:
+            input = self._pending + char
+            kana_tokens, consumed = self._kana_map.scan(input.lower(), False, False)
+            kana = _join_kana(input, kana_tokens, self._enforce)
+            self._history.append(self._pending)
+            self._committed.append(kana)
+            committed.append(kana)
+            self._pending = input[consumed:]
+        self._pending_display = self._display(self._pending)
+        return _difference(old_display, "".join(committed) + self._pending_display)
+
+    def delete(self, count: int = 1) -> Tuple[int, str]:
+        """Removes the last `count` characters typed"""
+        deleted = []
+        for _ in range(min(count, len(self._history))):
+            deleted.append(self._committed.pop())
+            self._pending = self._history.pop()
+        old_display = "".join(reversed(deleted)) + self._pending_display
+        self._pending_display = self._display(self._pending)
+        return _difference(old_display, self._pending_display)
+
+    def commit(self) -> str:
+        """Converts any pending Romaji (so a final n becomes ん) and returns the
+        finished text, leaving the converter empty"""
+        pending = _join_kana(
+            self._pending,
+            self._kana_map.apply(self._pending.lower(), True),
+            self._enforce,
+        )
+        value = "".join(self._committed) + pending
+        self.clear()
+        return value
+
+    def clear(self):
+        self._committed.clear()
+        self._history.clear()
+        self._pending = ""
+        self._pending_display = ""
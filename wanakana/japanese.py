@@ -1,5 +1,8 @@
 import re
-from typing import List, Union, Tuple
+from array import array
+from collections import namedtuple
+from itertools import repeat
+from typing import Callable, Hashable, Iterable, Iterator, List, Union, Tuple
 from .common import (
     is_japanese,
     is_kana,
@@ -8,21 +11,42 @@ from .common import (
     tokenise,
     is_char_kana,
     is_char_kanji,
-    is_mixed,
-    is_romaji,
-    is_char_english_punctuation,
 )
-from .constants import TO_KANA_METHODS, ROMANISATIONS
+from .constants import (
+    TO_KANA_METHODS,
+    ROMANISATIONS,
+    CONVERSION_BACKENDS,
+    MAPPING_DIRECTIONS,
+    HIRAGANA_START,
+    HIRAGANA_END,
+    KATAKANA_START,
+    KATAKANA_END,
+)
 from .utils import (
+    CHAR_ENGLISH_PUNCTUATION,
+    CHAR_KANA,
+    CHAR_ROMAJI,
+    char_flags,
+    is_empty,
+    LRUCache,
+    MappingAutomaton,
+    compacted,
+    RegexMapping,
+    mapping_key,
     get_romaji_to_kana_tree,
+    get_romaji_to_kana_automaton,
     get_kana_to_romaji_tree,
+    get_kana_to_romaji_automaton,
     USE_OBSOLETE_KANA_MAP,
-    apply_mapping,
+    IME_MODE_MAP,
     merge_custom_mapping,
-    is_char_uppercase,
     hiragana_to_katakana,
     katakana_to_hiragana,
+    kana_to_romaji_automata,
+    romaji_to_kana_automata,
 )
+from .utils import automaton as automaton_module
+from .utils import kana_to_romaji_map, romaji_to_kana_map
 
 is_leading_without_initial_kana = lambda input, leading: leading and (
     not is_kana(input[0])
@@ -55,38 +79,368 @@ def strip_okurigana(
     return okurigana_regex.sub("", input)
 
 
-custom_roma_to_kana = None
+# finds a character that hiragana_to_katakana or katakana_to_hiragana would change (or
+# might, in the case of 'ー')
+_hiragana_char = re.compile(f"[{chr(HIRAGANA_START)}-{chr(HIRAGANA_END)}]")
+_katakana_char = re.compile(f"[{chr(KATAKANA_START)}-{chr(KATAKANA_END)}]")
+
+# compiled custom mappings, keyed by mapping content
+custom_mapping_cache = LRUCache(maxsize=128)
+
+# results of to_kana, to_romaji, to_hiragana and to_katakana, keyed by input and
+# options. Nothing is memoised until configure_conversion_cache is called
+conversion_cache = LRUCache(maxsize=0)
+# the longest input that is memoised (-1 while memoisation is off), so that the cache
+# doesn't keep large strings alive
+_memo_max_length = -1
+
+
+def configure_conversion_cache(
+    maxsize: int = 4096, ttl: float = None, max_length: int = 64
+):
+    """Memoises the results of `to_kana`, `to_romaji`, `to_hiragana` and `to_katakana`
+    for inputs of up to `max_length` characters, keeping the `maxsize` most recently
+    used results (for at most `ttl` seconds each, if it's set). A `maxsize` of 0
+    turns memoisation off. `conversion_cache.clear()` forgets the results, and
+    `conversion_cache.info()` counts the hits and misses"""
+    global _memo_max_length
+    conversion_cache.set_ttl(ttl)
+    conversion_cache.resize(maxsize)
+    _memo_max_length = max_length if maxsize > 0 else -1
+
+
+# how the conversions apply the mappings when they aren't given a backend
+_conversion_backend = CONVERSION_BACKENDS["TRIE"]
+
+
+def _check_backend(backend: CONVERSION_BACKENDS):
+    if backend not in CONVERSION_BACKENDS.values():
+        raise ValueError(
+            f"unknown backend {backend!r}, expected one of "
+            f"{', '.join(CONVERSION_BACKENDS.values())}"
+        )
+
+
+def set_conversion_backend(backend: CONVERSION_BACKENDS):
+    """Chooses how `to_kana`, `to_romaji`, `to_hiragana` and `to_katakana` apply the
+    mappings when they aren't given a `backend`: "trie" (the default) walks the
+    mapping one character at a time, and "regex" matches each chunk with a regular
+    expression instead (see `RegexMapping`), which is faster on longer text. Either
+    way the results are the same"""
+    global _conversion_backend
+    _check_backend(backend)
+    _conversion_backend = backend
+
+
+def get_conversion_backend() -> CONVERSION_BACKENDS:
+    return _conversion_backend
+
+
+def _uses_regex(backend: CONVERSION_BACKENDS, convert_ending: bool) -> bool:
+    # only the automaton can leave the ending unconverted
+    return bool(convert_ending) and (
+        backend or _conversion_backend
+    ) == CONVERSION_BACKENDS["REGEX"]
+
+
+def use_compact_tables(compact: bool = True):
+    """Keeps the mapping tables built from now on in flat arrays (see
+    `CompactMappingAutomaton`) rather than a dict per state, which takes far less
+    memory (e.g. when running many worker processes) but converts up to a third
+    slower. The tables built so far are dropped and rebuilt in the new form when
+    they're next used, so call it before converting anything. Handles made by
+    `compile_mapping` (and `Converter`s) keep the tables they were made with"""
+    # a table that's being built while the flag flips would be kept in the old form
+    with romaji_to_kana_map._build_lock, kana_to_romaji_map._build_lock:
+        automaton_module.compact_tables = bool(compact)
+        romaji_to_kana_automata.clear()
+        kana_to_romaji_automata.clear()
+        custom_mapping_cache.clear()
+
+
+def _custom_mapping_key(
+    custom_mapping: Union[dict, Callable[[dict], dict]]
+) -> Hashable:
+    return mapping_key(custom_mapping) if custom_mapping else None
 
 
 def create_romaji_to_kana_map(
-    use_obsolete_kana: bool = False, custom_kana_mapping: dict = None
+    use_obsolete_kana: bool = False,
+    custom_kana_mapping: dict = None,
+    IME_mode: bool = False,
 ) -> dict:
     map = get_romaji_to_kana_tree()
-    global custom_roma_to_kana
 
+    map = IME_MODE_MAP(map) if IME_mode else map
     map = USE_OBSOLETE_KANA_MAP(map) if use_obsolete_kana else map
 
     if custom_kana_mapping:
-        if not custom_roma_to_kana:
-            custom_roma_to_kana = merge_custom_mapping(map, custom_kana_mapping)
-        map = custom_roma_to_kana
+        map = merge_custom_mapping(map, custom_kana_mapping)
 
     return map
 
 
-def _split_into_converted_kana(
-    input: str = "",
+def create_romaji_to_kana_automaton(
     use_obsolete_kana: bool = False,
     custom_kana_mapping: dict = None,
-    convert_ending: bool = True,
-    map: dict = None,
-) -> List[Tuple[int, int, str]]:
-    if not map:
-        map = create_romaji_to_kana_map(
+    IME_mode: bool = False,
+) -> MappingAutomaton:
+    if not custom_kana_mapping:
+        return get_romaji_to_kana_automaton(use_obsolete_kana, IME_mode)
+
+    return custom_mapping_cache.get_or_create(
+        (
+            "romaji_to_kana",
+            bool(use_obsolete_kana),
+            bool(IME_mode),
+            mapping_key(custom_kana_mapping),
+        ),
+        lambda: compacted(
+            MappingAutomaton(
+                create_romaji_to_kana_map(
+                    use_obsolete_kana=use_obsolete_kana,
+                    custom_kana_mapping=custom_kana_mapping,
+                    IME_mode=IME_mode,
+                )
+            )
+        ),
+    )
+
+
+def create_kana_to_romaji_automaton(
+    romanisation: ROMANISATIONS = ROMANISATIONS["HEPBURN"],
+    custom_romaji_mapping: dict = None,
+) -> MappingAutomaton:
+    if not custom_romaji_mapping:
+        return get_kana_to_romaji_automaton(romanisation=romanisation)
+
+    return custom_mapping_cache.get_or_create(
+        ("kana_to_romaji", romanisation, mapping_key(custom_romaji_mapping)),
+        lambda: compacted(
+            MappingAutomaton(
+                merge_custom_mapping(
+                    get_kana_to_romaji_tree(romanisation=romanisation),
+                    custom_romaji_mapping,
+                )
+            )
+        ),
+    )
+
+
+# a mapping resolved once by compile_mapping, to be passed as `full_map`
+CompiledMapping = namedtuple("CompiledMapping", ["direction", "automaton"])
+
+
+def compile_mapping(
+    direction: MAPPING_DIRECTIONS = MAPPING_DIRECTIONS["TO_KANA"],
+    use_obsolete_kana: bool = False,
+    custom_kana_mapping: dict = None,
+    romanisation: ROMANISATIONS = ROMANISATIONS["HEPBURN"],
+    custom_romaji_mapping: dict = None,
+) -> CompiledMapping:
+    """Resolves the mapping for `direction` (merging in the custom mapping) once,
+    returning an immutable handle that can be passed as `full_map` to any number of
+    calls. "to_kana" mappings are used by `to_kana`, `to_hiragana` and `to_katakana`
+    (from `use_obsolete_kana` and `custom_kana_mapping`), and "to_romaji" mappings by
+    `to_romaji` and `split_into_romaji` (from `romanisation` and
+    `custom_romaji_mapping`)"""
+    if direction == MAPPING_DIRECTIONS["TO_KANA"]:
+        automaton = create_romaji_to_kana_automaton(
             use_obsolete_kana=use_obsolete_kana, custom_kana_mapping=custom_kana_mapping
         )
+    elif direction == MAPPING_DIRECTIONS["TO_ROMAJI"]:
+        automaton = create_kana_to_romaji_automaton(
+            romanisation=romanisation, custom_romaji_mapping=custom_romaji_mapping
+        )
+    else:
+        raise ValueError(
+            f"unknown direction {direction!r}, expected one of "
+            f"{', '.join(MAPPING_DIRECTIONS.values())}"
+        )
+    return CompiledMapping(direction, automaton)
 
-    return apply_mapping(input.lower(), map, convert_ending)
+
+def _full_map_automaton(
+    full_map: Union[CompiledMapping, MappingAutomaton, dict],
+    direction: MAPPING_DIRECTIONS,
+) -> MappingAutomaton:
+    if isinstance(full_map, CompiledMapping):
+        if full_map.direction != direction:
+            raise ValueError(
+                f"a {full_map.direction} mapping can't be used for {direction}"
+            )
+        return full_map.automaton
+    if isinstance(full_map, MappingAutomaton):
+        return full_map
+    # a mapping tree, like create_romaji_to_kana_map makes
+    return MappingAutomaton(full_map)
+
+
+def _resolve_map(
+    full_map: Union[CompiledMapping, MappingAutomaton, dict],
+    direction: MAPPING_DIRECTIONS,
+    **options,
+) -> MappingAutomaton:
+    """Returns the automaton a conversion in `direction` uses: `full_map` if it's
+    given, otherwise the built-in mapping made with `options`"""
+    if full_map:
+        return _full_map_automaton(full_map, direction)
+    if direction == MAPPING_DIRECTIONS["TO_KANA"]:
+        return create_romaji_to_kana_automaton(**options)
+    return create_kana_to_romaji_automaton(**options)
+
+
+def _full_map_key(
+    full_map: Union[CompiledMapping, MappingAutomaton, dict],
+    custom_mapping: Union[dict, Callable[[dict], dict]],
+) -> Union[tuple, None]:
+    # only the handles are hashable (by identity); plain trees aren't memoised
+    if isinstance(full_map, CompiledMapping):
+        return (full_map,)
+    return None if full_map else (_custom_mapping_key(custom_mapping),)
+
+
+def _memoised(
+    name: str,
+    input: str,
+    full_map: Union[CompiledMapping, MappingAutomaton, dict],
+    custom_mapping: Union[dict, Callable[[dict], dict]],
+    options: tuple,
+    convert: Callable[[], str],
+) -> str:
+    """Returns `convert()`, memoised by `conversion_cache` under `name`, `input`, the
+    mapping and the other `options` when it's on and `input` is short enough"""
+    if len(input) > _memo_max_length:
+        return convert()
+    mapping = _full_map_key(full_map, custom_mapping)
+    if mapping is None:
+        return convert()
+    memo_key = (name, input, *mapping, *options)
+    result = conversion_cache.get(memo_key)
+    if result is None:
+        result = convert()
+        conversion_cache.set(memo_key, result)
+    return result
+
+
+def _is_uppercase_romaji(chunk: str) -> bool:
+    # is every character uppercase English?
+    return chunk.isascii() and chunk.isalpha() and chunk.isupper()
+
+
+def _kana_chunks(
+    input: str,
+    kana_tokens: List[Tuple[int, int, str]],
+    enforce: Union[None, "hira", "kata"] = None,
+) -> List[str]:
+    """Returns the text `to_kana` makes of each of the kana tokens of `input`"""
+    enforce_hiragana = enforce == "hira"
+    enforce_katakana = enforce == "kata"
+
+    kana_chunks = []
+    for start, end, kana in kana_tokens:
+        if kana is None:
+            # we didn't convert the end of the string
+            kana_chunks.append(input[start:])
+            continue
+        if enforce_hiragana:
+            kana_chunks.append(kana)
+            continue
+        if enforce_katakana or _is_uppercase_romaji(input[start:end]):
+            kana = hiragana_to_katakana(kana)
+        kana_chunks.append(kana)
+    return kana_chunks
+
+
+def _join_kana(
+    input: str,
+    kana_tokens: List[Tuple[int, int, str]],
+    enforce: Union[None, "hira", "kata"] = None,
+) -> str:
+    """Joins the kana tokens of `input` into the result of `to_kana`"""
+    return "".join(_kana_chunks(input, kana_tokens, enforce))
+
+
+def _join_kana_with_offsets(
+    input: str,
+    kana_tokens: List[Tuple[int, int, str]],
+    enforce: Union[None, "hira", "kata"] = None,
+) -> Tuple[str, array]:
+    """Joins the kana tokens of `input` like `_join_kana`, filling in the offset in
+    `input` of every character of the result in the same pass: the start of the
+    token it was converted from, or its own offset if it was kept as-is"""
+    enforce_hiragana = enforce == "hira"
+    enforce_katakana = enforce == "kata"
+
+    kana_chunks = []
+    offsets = array("I")
+    for start, end, kana in kana_tokens:
+        if kana is None:
+            # we didn't convert the end of the string
+            kana = input[start:]
+            kana_chunks.append(kana)
+            offsets.extend(range(start, start + len(kana)))
+            continue
+        if not enforce_hiragana:
+            if enforce_katakana or _is_uppercase_romaji(input[start:end]):
+                kana = hiragana_to_katakana(kana)
+        kana_chunks.append(kana)
+        offsets.extend(repeat(start, len(kana)))
+    return "".join(kana_chunks), offsets
+
+
+def _regex_kana(
+    input: str,
+    lowered: str,
+    regex: RegexMapping,
+    enforce: Union[None, "hira", "kata"] = None,
+) -> str:
+    """Converts `input` like `to_kana` does, matching the chunks of `lowered` (its
+    lowercase form) with `regex`"""
+    if enforce == "kata":
+        return hiragana_to_katakana(regex.convert(lowered))
+    if enforce == "hira" or lowered == input:
+        return regex.convert(lowered)
+
+    # uppercase romaji becomes katakana, so each chunk is checked against the input
+    parts = regex.split(lowered)
+    table = regex.table
+    position = 0
+    for index, part in enumerate(parts):
+        end = position + len(part)
+        if index % 2:
+            kana = table[part]
+            if _is_uppercase_romaji(input[position:end]):
+                kana = hiragana_to_katakana(kana)
+            parts[index] = kana
+        position = end
+    return "".join(parts)
+
+
+def _kana_converter(
+    kana_map: MappingAutomaton,
+    convert_ending: bool,
+    enforce: Union[None, "hira", "kata"],
+    backend: CONVERSION_BACKENDS = None,
+) -> Callable[[str], str]:
+    """Binds the options of `to_kana` once, returning a function that converts one
+    string"""
+    apply = kana_map.apply
+    passes_through = kana_map.passes_through
+    regex = kana_map.regex() if _uses_regex(backend, convert_ending) else None
+    # Katakana is only enforced on the converted text
+    keeps_kana = enforce != "kata"
+
+    def convert(input: str) -> str:
+        lowered = input.lower()
+        # text that's already kana has nothing to convert
+        if keeps_kana and lowered == input and passes_through(input):
+            return input
+        if regex is not None:
+            return _regex_kana(input, lowered, regex, enforce)
+        return _join_kana(input, apply(lowered, convert_ending), enforce)
+
+    return convert
 
 
 def to_kana(
@@ -94,62 +448,204 @@ def to_kana(
     use_obsolete_kana: bool = False,
     custom_kana_mapping: dict = None,
     convert_ending: bool = True,
-    full_map: dict = None,
+    full_map: Union[CompiledMapping, dict] = None,
     enforce: Union[None, "hira", "kata"] = None,
+    backend: CONVERSION_BACKENDS = None,
 ) -> str:
     """Converts Romaji to Kana, lowercase will become Hiragana and uppercase will
-    become Katakana"""
+    become Katakana. A `full_map` (see `compile_mapping`) replaces
+    `use_obsolete_kana` and `custom_kana_mapping`"""
+    if backend is not None:
+        _check_backend(backend)
     if enforce not in [None, "hira", "kata"]:
         enforce = None
-    if not full_map:
-        kana_map = create_romaji_to_kana_map(
-            use_obsolete_kana=use_obsolete_kana, custom_kana_mapping=custom_kana_mapping
-        )
 
-    def _process(kana_token: Tuple[int, int, str]) -> str:
-        start, end, kana = kana_token
-        if not kana:
-            # we didn't convert the end of the string
-            return input[start:]
-        enforce_hiragana = enforce == "hira"
-        enforce_katakana = enforce == "kata" or all(
-            is_char_uppercase(char) for char in input[start:end]
+    def convert() -> str:
+        kana_map = _resolve_map(
+            full_map,
+            MAPPING_DIRECTIONS["TO_KANA"],
+            use_obsolete_kana=use_obsolete_kana,
+            custom_kana_mapping=custom_kana_mapping,
         )
+        return _kana_converter(kana_map, convert_ending, enforce, backend)(input)
+
+    return _memoised(
+        "to_kana",
+        input,
+        full_map,
+        custom_kana_mapping,
+        (bool(use_obsolete_kana), bool(convert_ending), enforce),
+        convert,
+    )
 
-        return (
-            kana
-            if enforce_hiragana or (not enforce_katakana)
-            else hiragana_to_katakana(kana)
-        )
 
-    return "".join(
-        map(
-            _process,
-            _split_into_converted_kana(
-                input,
-                use_obsolete_kana=use_obsolete_kana,
-                custom_kana_mapping=custom_kana_mapping,
-                convert_ending=convert_ending,
-                map=kana_map,
-            ),
-        )
+def to_kana_with_offsets(
+    input: str = "",
+    use_obsolete_kana: bool = False,
+    custom_kana_mapping: dict = None,
+    convert_ending: bool = True,
+    enforce: Union[None, "hira", "kata"] = None,
+) -> Tuple[str, array]:
+    """Converts Romaji to Kana like `to_kana`, also returning the offset in `input`
+    that each character of the result was converted from"""
+    if enforce not in [None, "hira", "kata"]:
+        enforce = None
+    kana_map = create_romaji_to_kana_automaton(
+        use_obsolete_kana=use_obsolete_kana, custom_kana_mapping=custom_kana_mapping
+    )
+
+    kana_tokens = kana_map.apply(input.lower(), convert_ending)
+    return _join_kana_with_offsets(input, kana_tokens, enforce)
+
+
+def to_kana_many(
+    inputs: Iterable[str],
+    use_obsolete_kana: bool = False,
+    custom_kana_mapping: dict = None,
+    convert_ending: bool = True,
+    enforce: Union[None, "hira", "kata"] = None,
+    as_list: bool = False,
+    backend: CONVERSION_BACKENDS = None,
+    full_map: Union[CompiledMapping, dict] = None,
+) -> Union[Iterator[str], List[str]]:
+    """Converts every string in `inputs` like `to_kana`, resolving the options and
+    mapping once for the whole batch. Results are produced lazily, unless `as_list`
+    is set"""
+    if backend is not None:
+        _check_backend(backend)
+    if enforce not in [None, "hira", "kata"]:
+        enforce = None
+    kana_map = _resolve_map(
+        full_map,
+        MAPPING_DIRECTIONS["TO_KANA"],
+        use_obsolete_kana=use_obsolete_kana,
+        custom_kana_mapping=custom_kana_mapping,
     )
 
+    results = map(_kana_converter(kana_map, convert_ending, enforce, backend), inputs)
+    return list(results) if as_list else results
+
+
 def split_into_romaji(
     input: str,
     custom_romaji_mapping: dict = None,
     convert_ending: bool = True,
     romanisation: ROMANISATIONS = ROMANISATIONS["HEPBURN"],
+    full_map: Union[CompiledMapping, dict] = None,
 ) -> List[Tuple[int, int, str]]:
-    map = get_kana_to_romaji_tree(romanisation=romanisation)
-
-    if custom_romaji_mapping:
-        map = merge_custom_mapping(map, custom_romaji_mapping)
-
-    return apply_mapping(
-        katakana_to_hiragana(input, to_romaji, True), map, convert_ending
+    map = _resolve_map(
+        full_map,
+        MAPPING_DIRECTIONS["TO_ROMAJI"],
+        romanisation=romanisation,
+        custom_romaji_mapping=custom_romaji_mapping,
     )
 
+    return map.apply(katakana_to_hiragana(input, to_romaji, True), convert_ending)
+
+
+def _romaji_chunks(
+    input: str, romaji_tokens: List[Tuple[int, int, str]], uppercase_katakana: bool
+) -> List[str]:
+    """Returns the text `to_romaji` makes of each of the romaji tokens of `input`"""
+    if not uppercase_katakana:
+        return [
+            input[start:] if romaji is None else romaji
+            for start, _, romaji in romaji_tokens
+        ]
+    return [
+        input[start:]
+        if romaji is None
+        else romaji.upper()
+        if is_katakana(input[start:end])
+        else romaji
+        for start, end, romaji in romaji_tokens
+    ]
+
+
+def _join_romaji(
+    input: str, romaji_tokens: List[Tuple[int, int, str]], uppercase_katakana: bool
+) -> str:
+    """Joins the romaji tokens of `input` into the result of `to_romaji`"""
+    return "".join(_romaji_chunks(input, romaji_tokens, uppercase_katakana))
+
+
+def _join_romaji_with_offsets(
+    input: str, romaji_tokens: List[Tuple[int, int, str]], uppercase_katakana: bool
+) -> Tuple[str, array]:
+    """Joins the romaji tokens of `input` like `_join_romaji`, filling in the offsets
+    like `_join_kana_with_offsets`"""
+    romaji_chunks = []
+    offsets = array("I")
+    for start, end, romaji in romaji_tokens:
+        if romaji is None:
+            romaji = input[start:]
+            romaji_chunks.append(romaji)
+            offsets.extend(range(start, start + len(romaji)))
+            continue
+        if uppercase_katakana and is_katakana(input[start:end]):
+            romaji = romaji.upper()
+        romaji_chunks.append(romaji)
+        offsets.extend(repeat(start, len(romaji)))
+    return "".join(romaji_chunks), offsets
+
+
+def _regex_romaji(
+    input: str, hiragana: str, regex: RegexMapping, uppercase_katakana: bool
+) -> str:
+    """Converts `input` like `to_romaji` does, matching the chunks of `hiragana` (as
+    made by katakana_to_hiragana) with `regex`"""
+    if not uppercase_katakana or _katakana_char.search(input) is None:
+        return regex.convert(hiragana)
+
+    # romaji from katakana is uppercased, so each chunk is checked against the input
+    parts = regex.split(hiragana)
+    table = regex.table
+    position = 0
+    for index, part in enumerate(parts):
+        end = position + len(part)
+        if index % 2:
+            romaji = table[part]
+            if is_katakana(input[position:end]):
+                romaji = romaji.upper()
+            parts[index] = romaji
+        elif part != part.upper():
+            # the text between chunks passes through one character at a time, like
+            # the romaji katakana_to_hiragana writes for long vowel marks
+            parts[index] = "".join(
+                char.upper() if is_katakana(original) else char
+                for char, original in zip(part, input[position:end])
+            )
+        position = end
+    return "".join(parts)
+
+
+def _romaji_converter(
+    romaji_map: MappingAutomaton,
+    uppercase_katakana: bool,
+    convert_ending: bool,
+    backend: CONVERSION_BACKENDS = None,
+) -> Callable[[str], str]:
+    """Binds the options of `to_romaji` once, returning a function that converts one
+    string"""
+    apply = romaji_map.apply
+    passes_through = romaji_map.passes_through
+    regex = romaji_map.regex() if _uses_regex(backend, convert_ending) else None
+
+    def convert(input: str) -> str:
+        # text without kana (such as text that's already romaji) has nothing to
+        # convert
+        if passes_through(input) and (
+            input.isascii() or _katakana_char.search(input) is None
+        ):
+            return input
+        hiragana = katakana_to_hiragana(input, to_romaji, True)
+        if regex is not None:
+            return _regex_romaji(input, hiragana, regex, uppercase_katakana)
+        romaji_tokens = apply(hiragana, convert_ending)
+        return _join_romaji(input, romaji_tokens, uppercase_katakana)
+
+    return convert
+
 
 def to_romaji(
     input: str = "",
@@ -157,54 +653,223 @@ def to_romaji(
     custom_romaji_mapping: dict = None,
     convert_ending: bool = True,
     romanisation: ROMANISATIONS = ROMANISATIONS["HEPBURN"],
+    backend: CONVERSION_BACKENDS = None,
+    full_map: Union[CompiledMapping, dict] = None,
 ):
-    """Covert Kana to Romaji"""
-    # just throw away the substring index information and just concatenate all the kana
-    def _process(romaji_token: Tuple[int, int, str]) -> str:
-        start, end, romaji = romaji_token
-        make_uppercase = uppercase_katakana and is_katakana(input[start:end])
-
-        return romaji.upper() if make_uppercase else romaji
-
-    return "".join(
-        map(
-            _process,
-            split_into_romaji(
-                input, custom_romaji_mapping, convert_ending, romanisation
-            ),
+    """Covert Kana to Romaji. A `full_map` (see `compile_mapping`) replaces
+    `custom_romaji_mapping` and `romanisation`"""
+    if backend is not None:
+        _check_backend(backend)
+
+    def convert() -> str:
+        romaji_map = _resolve_map(
+            full_map,
+            MAPPING_DIRECTIONS["TO_ROMAJI"],
+            romanisation=romanisation,
+            custom_romaji_mapping=custom_romaji_mapping,
         )
+        return _romaji_converter(
+            romaji_map, uppercase_katakana, convert_ending, backend
+        )(input)
+
+    return _memoised(
+        "to_romaji",
+        input,
+        full_map,
+        custom_romaji_mapping,
+        (romanisation, bool(uppercase_katakana), bool(convert_ending)),
+        convert,
     )
 
 
-def to_hiragana(
+def to_romaji_with_offsets(
     input: str = "",
-    ignore_romaji: bool = False,
+    uppercase_katakana: bool = False,
+    custom_romaji_mapping: dict = None,
+    convert_ending: bool = True,
+    romanisation: ROMANISATIONS = ROMANISATIONS["HEPBURN"],
+) -> Tuple[str, array]:
+    """Converts Kana to Romaji like `to_romaji`, also returning the offset in `input`
+    that each character of the result was converted from"""
+    romaji_map = create_kana_to_romaji_automaton(
+        romanisation=romanisation, custom_romaji_mapping=custom_romaji_mapping
+    )
+
+    # katakana_to_hiragana keeps every character in its place
+    romaji_tokens = romaji_map.apply(
+        katakana_to_hiragana(input, to_romaji, True), convert_ending
+    )
+    return _join_romaji_with_offsets(input, romaji_tokens, uppercase_katakana)
+
+
+def to_romaji_many(
+    inputs: Iterable[str],
+    uppercase_katakana: bool = False,
+    custom_romaji_mapping: dict = None,
+    convert_ending: bool = True,
+    romanisation: ROMANISATIONS = ROMANISATIONS["HEPBURN"],
+    as_list: bool = False,
+    backend: CONVERSION_BACKENDS = None,
+    full_map: Union[CompiledMapping, dict] = None,
+) -> Union[Iterator[str], List[str]]:
+    """Converts every string in `inputs` like `to_romaji`, resolving the options and
+    mapping once for the whole batch. Results are produced lazily, unless `as_list`
+    is set"""
+    if backend is not None:
+        _check_backend(backend)
+    romaji_map = _resolve_map(
+        full_map,
+        MAPPING_DIRECTIONS["TO_ROMAJI"],
+        romanisation=romanisation,
+        custom_romaji_mapping=custom_romaji_mapping,
+    )
+
+    results = map(
+        _romaji_converter(romaji_map, uppercase_katakana, convert_ending, backend),
+        inputs,
+    )
+    return list(results) if as_list else results
+
+
+def _scan_categories(input: str) -> Tuple[int, int]:
+    """Classifies `input` in one pass, returning the categories found in any of its
+    characters and the categories shared by all of them"""
+    found = 0
+    shared = -1 if input else 0
+    # each distinct character only needs classifying once
+    for char in set(input):
+        flags = char_flags(char)
+        found |= flags
+        shared &= flags
+    return found, shared
+
+
+def _hiragana_route(input: str, ignore_romaji: bool = False) -> str:
+    """Decides how `to_hiragana` converts `input`: "kana" only shifts Katakana,
+    "romaji" converts Romaji, and "mixed" does both"""
+    if ignore_romaji or is_empty(input):
+        return "kana"
+
+    found, shared = _scan_categories(input)
+
+    # is_mixed(input, ignore_kanji=True)
+    if found & CHAR_KANA and found & CHAR_ROMAJI:
+        return "mixed"
+
+    # is_romaji(input) or any English punctuation
+    if shared & CHAR_ROMAJI or found & CHAR_ENGLISH_PUNCTUATION:
+        return "romaji"
+
+    return "kana"
+
+
+def _converted_to_hiragana(
+    input: str,
+    route: str,
     use_obsolete_kana: bool = False,
     custom_kana_mapping: dict = None,
     convert_ending: bool = True,
-):
-    """Convert input to Hiragana"""
-    if ignore_romaji:
+    backend: CONVERSION_BACKENDS = None,
+    kana_map: MappingAutomaton = None,
+) -> str:
+    if route == "kana":
+        if _katakana_char.search(input) is None:
+            return input
         return katakana_to_hiragana(input, to_romaji, False)
 
-    if is_mixed(input, ignore_kanji=True):
-        converted_katakana = katakana_to_hiragana(input, to_romaji, False)
-        return to_kana(
-            converted_katakana.lower(),
+    if route == "mixed":
+        input = katakana_to_hiragana(input, to_romaji, False)
+
+    # lowercase romaji always becomes hiragana
+    input = input.lower()
+    if kana_map is None:
+        kana_map = create_romaji_to_kana_automaton(
             use_obsolete_kana=use_obsolete_kana,
             custom_kana_mapping=custom_kana_mapping,
-            convert_ending=convert_ending,
         )
+    if _uses_regex(backend, convert_ending):
+        return kana_map.regex().convert(input)
+    return _join_kana(input, kana_map.apply(input, convert_ending), "hira")
+
 
-    if is_romaji(input) or any(is_char_english_punctuation(char) for char in input):
-        return to_kana(
-            input.lower(),
+def to_hiragana(
+    input: str = "",
+    ignore_romaji: bool = False,
+    use_obsolete_kana: bool = False,
+    custom_kana_mapping: dict = None,
+    convert_ending: bool = True,
+    backend: CONVERSION_BACKENDS = None,
+    full_map: Union[CompiledMapping, dict] = None,
+):
+    """Convert input to Hiragana. A `full_map` (see `compile_mapping`) replaces
+    `use_obsolete_kana` and `custom_kana_mapping`"""
+    if backend is not None:
+        _check_backend(backend)
+    return _memoised(
+        "to_hiragana",
+        input,
+        full_map,
+        custom_kana_mapping,
+        (bool(use_obsolete_kana), bool(ignore_romaji), bool(convert_ending)),
+        # the tables are only built once the route needs them
+        lambda: _converted_to_hiragana(
+            input,
+            _hiragana_route(input, ignore_romaji),
             use_obsolete_kana=use_obsolete_kana,
             custom_kana_mapping=custom_kana_mapping,
             convert_ending=convert_ending,
-        )
+            backend=backend,
+            kana_map=_full_map_automaton(full_map, MAPPING_DIRECTIONS["TO_KANA"])
+            if full_map
+            else None,
+        ),
+    )
+
+
+def _katakana_route(input: str, ignore_romaji: bool = False) -> str:
+    """Decides how `to_katakana` converts `input`: "kana" only shifts Hiragana, and
+    "romaji" converts Romaji as well"""
+    if ignore_romaji or is_empty(input):
+        return "kana"
+
+    found, shared = _scan_categories(input)
+
+    # is_mixed(input, ignore_kanji=True), is_romaji(input) or any English punctuation
+    if (
+        (found & CHAR_KANA and found & CHAR_ROMAJI)
+        or shared & CHAR_ROMAJI
+        or found & CHAR_ENGLISH_PUNCTUATION
+    ):
+        return "romaji"
 
-    return katakana_to_hiragana(input, to_romaji, False)
+    return "kana"
+
+
+def _converted_to_katakana(
+    input: str,
+    route: str,
+    use_obsolete_kana: bool = False,
+    custom_kana_mapping: dict = None,
+    convert_ending: bool = True,
+    backend: CONVERSION_BACKENDS = None,
+    kana_map: MappingAutomaton = None,
+) -> str:
+    if route == "romaji":
+        input = input.lower()
+        if kana_map is None:
+            kana_map = create_romaji_to_kana_automaton(
+                use_obsolete_kana=use_obsolete_kana,
+                custom_kana_mapping=custom_kana_mapping,
+            )
+        if _uses_regex(backend, convert_ending):
+            input = kana_map.regex().convert(input)
+        else:
+            input = _join_kana(input, kana_map.apply(input, convert_ending), "hira")
+    elif _hiragana_char.search(input) is None:
+        # there's nothing to shift
+        return input
+
+    return hiragana_to_katakana(input)
 
 
 def to_katakana(
@@ -213,25 +878,32 @@ def to_katakana(
     use_obsolete_kana: bool = False,
     custom_kana_mapping: dict = None,
     convert_ending: bool = True,
+    backend: CONVERSION_BACKENDS = None,
+    full_map: Union[CompiledMapping, dict] = None,
 ):
-    """Convert input to Katakana"""
-    if ignore_romaji:
-        return hiragana_to_katakana(input)
-
-    if (
-        is_mixed(input, ignore_kanji=True)
-        or is_romaji(input)
-        or any(is_char_english_punctuation(char) for char in input)
-    ):
-        hiragana = to_kana(
-            input.lower(),
+    """Convert input to Katakana. A `full_map` (see `compile_mapping`) replaces
+    `use_obsolete_kana` and `custom_kana_mapping`"""
+    if backend is not None:
+        _check_backend(backend)
+    return _memoised(
+        "to_katakana",
+        input,
+        full_map,
+        custom_kana_mapping,
+        (bool(use_obsolete_kana), bool(ignore_romaji), bool(convert_ending)),
+        # the tables are only built once the route needs them
+        lambda: _converted_to_katakana(
+            input,
+            _katakana_route(input, ignore_romaji),
             use_obsolete_kana=use_obsolete_kana,
             custom_kana_mapping=custom_kana_mapping,
             convert_ending=convert_ending,
-        )
-        return hiragana_to_katakana(hiragana)
-
-    return hiragana_to_katakana(input)
+            backend=backend,
+            kana_map=_full_map_automaton(full_map, MAPPING_DIRECTIONS["TO_KANA"])
+            if full_map
+            else None,
+        ),
+    )
 
 
 def normalise_romaji(
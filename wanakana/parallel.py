@@ -0,0 +1,237 @@
+"""Converts large batches of strings, or large documents, across a pool of worker
+processes. Conversion is CPU-bound pure Python, so processes (not threads) are needed
+to use more than one core.
+
+Each worker builds the mapping tables it needs once, in the pool initialiser, and
+then converts whole chunks of input per task. Results are returned in input order."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, List, Tuple, Union
+
+from .common import get_type, tokenise
+from .constants import MAPPING_DIRECTIONS
+from .japanese import (
+    _converted_to_hiragana,
+    _converted_to_katakana,
+    _full_map_automaton,
+    _hiragana_route,
+    _katakana_route,
+    to_hiragana,
+    to_kana,
+    to_kana_many,
+    to_katakana,
+    to_romaji,
+    to_romaji_many,
+)
+
+FUNCTIONS = {
+    "to_kana": to_kana,
+    "to_romaji": to_romaji,
+    "to_hiragana": to_hiragana,
+    "to_katakana": to_katakana,
+    "tokenise": tokenise,
+}
+
+# fewer chunks than this per worker leaves cores idle when chunks are uneven
+CHUNKS_PER_WORKER = 4
+# documents are never split into pieces smaller than this many characters
+MIN_DOCUMENT_CHUNK = 1 << 16
+
+# set in each worker process by the pool initialiser
+_worker_convert = None
+
+
+def _function_name(function: Union[str, Callable]) -> str:
+    name = function if isinstance(function, str) else getattr(function, "__name__", "")
+    if name not in FUNCTIONS:
+        raise ValueError(
+            f"can't convert in parallel with {function!r}, "
+            f"expected one of {', '.join(FUNCTIONS)}"
+        )
+    return name
+
+
+def _bind_many(function: str, options: dict) -> Callable[[List[str]], list]:
+    """Returns a function converting a list of strings with `function`"""
+    if function == "to_kana":
+        return partial(to_kana_many, as_list=True, **options)
+    if function == "to_romaji":
+        return partial(to_romaji_many, as_list=True, **options)
+
+    convert = partial(FUNCTIONS[function], **options)
+    return lambda inputs: [convert(input) for input in inputs]
+
+
+def _bind_document(
+    function: str, options: dict, route: str
+) -> Callable[[Tuple[str, bool]], Any]:
+    """Returns a function converting one piece of a document with `function`. Only
+    the final piece keeps the caller's `convert_ending`, as every other piece ends
+    with a newline"""
+    if function in ["to_hiragana", "to_katakana"]:
+        # the route already accounts for ignore_romaji
+        options.pop("ignore_romaji", None)
+        full_map = options.pop("full_map", None)
+        if full_map:
+            options["kana_map"] = _full_map_automaton(
+                full_map, MAPPING_DIRECTIONS["TO_KANA"]
+            )
+        if function == "to_hiragana":
+            convert = partial(_converted_to_hiragana, route=route)
+        else:
+            convert = partial(_converted_to_katakana, route=route)
+    else:
+        convert = FUNCTIONS[function]
+
+    def convert_piece(task: Tuple[str, bool]):
+        piece, final = task
+        if not final and "convert_ending" in options:
+            return convert(piece, **{**options, "convert_ending": True})
+        return convert(piece, **options)
+
+    return convert_piece
+
+
+def _warm_up(function: str, options: dict):
+    """Builds the mapping tables used by `function` with `options`"""
+    _bind_many(function, options)(["ka", "カー"])
+
+
+def _init_many_worker(function: str, options: dict):
+    global _worker_convert
+    _warm_up(function, options)
+    _worker_convert = _bind_many(function, options)
+
+
+def _init_document_worker(function: str, options: dict, route: str):
+    global _worker_convert
+    _warm_up(function, options)
+    _worker_convert = _bind_document(function, dict(options), route)
+
+
+def _run_task(task):
+    return _worker_convert(task)
+
+
+def _chunks(items: List, size: int) -> List[List]:
+    return [items[index : index + size] for index in range(0, len(items), size)]
+
+
+def _split_document(input: str, size: int) -> List[str]:
+    """Splits `input` after newlines into pieces of at least `size` characters.
+    Newlines never continue a mapping, so the pieces can be converted separately"""
+    pieces = []
+    start = 0
+    while start < len(input):
+        end = input.find("\n", start + size - 1)
+        end = len(input) if end == -1 else end + 1
+        pieces.append(input[start:end])
+        start = end
+    return pieces
+
+
+def convert_many(
+    function: Union[str, Callable],
+    inputs: Iterable[str],
+    workers: int = None,
+    chunksize: int = None,
+    **options,
+) -> list:
+    """Applies `function` (one of `to_kana`, `to_romaji`, `to_hiragana`, `to_katakana`
+    or `tokenise`, by name or the function itself) with `options` to every string in
+    `inputs`, spreading the work over `workers` processes (all cores by default).
+    `chunksize` strings are sent to a worker at a time. Results are in input order"""
+    function = _function_name(function)
+    inputs = list(inputs)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(inputs) < 2:
+        return _bind_many(function, options)(inputs)
+
+    if not chunksize:
+        chunksize = max(1, -(-len(inputs) // (workers * CHUNKS_PER_WORKER)))
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_many_worker,
+        initargs=(function, options),
+    ) as executor:
+        results = []
+        for converted in executor.map(_run_task, _chunks(inputs, chunksize)):
+            results.extend(converted)
+    return results
+
+
+def convert_document(
+    function: Union[str, Callable],
+    input: str,
+    workers: int = None,
+    chunksize: int = None,
+    **options,
+) -> Union[str, list]:
+    """Applies `function` (like `convert_many`) with `options` to one large string,
+    splitting it after newlines into pieces of about `chunksize` characters. The
+    result is the same as calling `function` on the whole of `input`, provided that
+    no custom mapping has a newline in its keys"""
+    function = _function_name(function)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        return FUNCTIONS[function](input, **options)
+
+    if not chunksize:
+        chunksize = max(
+            MIN_DOCUMENT_CHUNK, -(-len(input) // (workers * CHUNKS_PER_WORKER))
+        )
+    pieces = _split_document(input, chunksize)
+
+    if len(pieces) < 2:
+        return FUNCTIONS[function](input, **options)
+
+    # the conversion used by to_hiragana and to_katakana depends on the whole input
+    route = None
+    if function == "to_hiragana":
+        route = _hiragana_route(input, options.get("ignore_romaji", False))
+    elif function == "to_katakana":
+        route = _katakana_route(input, options.get("ignore_romaji", False))
+
+    tasks = [(piece, index == len(pieces) - 1) for index, piece in enumerate(pieces)]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_document_worker,
+        initargs=(function, options, route),
+    ) as executor:
+        results = list(executor.map(_run_task, tasks))
+
+    if function != "tokenise":
+        return "".join(results)
+
+    # a token can span pieces, so join same-type tokens across piece boundaries
+    compact = options.get("compact", False)
+    detailed = options.get("detailed", False)
+    tokens = []
+    if options.get("spans", False):
+        # the spans are relative to their piece
+        offset = 0
+        for piece, piece_tokens in zip(pieces, results):
+            for type, start, end in piece_tokens:
+                if tokens and tokens[-1][0] == type:
+                    tokens[-1] = (type, tokens[-1][1], offset + end)
+                else:
+                    tokens.append((type, offset + start, offset + end))
+            offset += len(piece)
+        return tokens
+    for piece_tokens in results:
+        if tokens and piece_tokens:
+            last, first = tokens[-1], piece_tokens[0]
+            if detailed and last[0] == first[0]:
+                tokens[-1] = [last[0], last[1] + first[1]]
+                piece_tokens = piece_tokens[1:]
+            elif not detailed and get_type(last[0], compact) == get_type(
+                first[0], compact
+            ):
+                tokens[-1] = last + first
+                piece_tokens = piece_tokens[1:]
+        tokens.extend(piece_tokens)
+    return tokens
@@ -0,0 +1,149 @@
+"""Converts text that arrives in pieces, such as file-like objects or iterators of
+chunks, without holding the whole text in memory.
+
+Only the characters of a mapping that is still in progress (for example the "k" of
+"k" + "ya") are held back between pieces, so memory use is bounded by the size of the
+pieces read."""
+from functools import partial
+from typing import IO, Iterable, Iterator, Union
+
+from .constants import ROMANISATIONS
+from .japanese import (
+    _join_kana,
+    _join_romaji,
+    create_kana_to_romaji_automaton,
+    create_romaji_to_kana_automaton,
+    to_romaji,
+)
+from .utils import resume_katakana_to_hiragana
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class KanaStream:
+    """Converts Romaji to Kana like `to_kana`, for text fed in one piece at a time.
+    `feed` returns the output that is certain so far, and `finish` returns the rest
+    once all the input has been fed"""
+
+    def __init__(
+        self,
+        use_obsolete_kana: bool = False,
+        custom_kana_mapping: dict = None,
+        convert_ending: bool = True,
+        enforce: Union[None, "hira", "kata"] = None,
+    ):
+        if enforce not in [None, "hira", "kata"]:
+            enforce = None
+        self._kana_map = create_romaji_to_kana_automaton(
+            use_obsolete_kana=use_obsolete_kana, custom_kana_mapping=custom_kana_mapping
+        )
+        self._convert_ending = convert_ending
+        self._enforce = enforce
+        # input that hasn't been converted yet
+        self._pending = ""
+
+    def _convert(self, text: str, final: bool) -> str:
+        input = self._pending + text
+        kana_tokens, consumed = self._kana_map.scan(
+            input.lower(), self._convert_ending, final
+        )
+        self._pending = input[consumed:]
+        return _join_kana(input, kana_tokens, self._enforce)
+
+    def feed(self, text: str) -> str:
+        return self._convert(text, final=False)
+
+    def finish(self) -> str:
+        return self._convert("", final=True)
+
+
+class RomajiStream:
+    """Converts Kana to Romaji like `to_romaji`, for text fed in one piece at a time.
+    `feed` returns the output that is certain so far, and `finish` returns the rest
+    once all the input has been fed"""
+
+    def __init__(
+        self,
+        uppercase_katakana: bool = False,
+        custom_romaji_mapping: dict = None,
+        convert_ending: bool = True,
+        romanisation: ROMANISATIONS = ROMANISATIONS["HEPBURN"],
+    ):
+        self._romaji_map = create_kana_to_romaji_automaton(
+            romanisation=romanisation, custom_romaji_mapping=custom_romaji_mapping
+        )
+        self._uppercase_katakana = uppercase_katakana
+        self._convert_ending = convert_ending
+        # input that hasn't been converted yet, as given and as hiragana
+        self._pending = ""
+        self._pending_hiragana = ""
+        # long vowel marks depend on the kana before them
+        self._previous_char = ""
+        self._previous_kana = ""
+
+    def _convert(self, text: str, final: bool) -> str:
+        (
+            hiragana,
+            self._previous_char,
+            self._previous_kana,
+        ) = resume_katakana_to_hiragana(
+            text, to_romaji, True, self._previous_char, self._previous_kana
+        )
+        input = self._pending + text
+        hiragana = self._pending_hiragana + hiragana
+        romaji_tokens, consumed = self._romaji_map.scan(
+            hiragana, self._convert_ending, final
+        )
+        self._pending = input[consumed:]
+        self._pending_hiragana = hiragana[consumed:]
+        return _join_romaji(input, romaji_tokens, self._uppercase_katakana)
+
+    def feed(self, text: str) -> str:
+        return self._convert(text, final=False)
+
+    def finish(self) -> str:
+        return self._convert("", final=True)
+
+
+def _pieces(source: Union[IO[str], Iterable[str]], chunk_size: int) -> Iterator[str]:
+    if hasattr(source, "read"):
+        return iter(partial(source.read, chunk_size), "")
+    if isinstance(source, str):
+        return iter([source])
+    return iter(source)
+
+
+def _stream(
+    converter: Union[KanaStream, RomajiStream],
+    source: Union[IO[str], Iterable[str]],
+    chunk_size: int,
+) -> Iterator[str]:
+    for piece in _pieces(source, chunk_size):
+        converted = converter.feed(piece)
+        if converted:
+            yield converted
+    converted = converter.finish()
+    if converted:
+        yield converted
+
+
+def stream_to_kana(
+    source: Union[IO[str], Iterable[str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **options,
+) -> Iterator[str]:
+    """Converts Romaji to Kana like `to_kana`, reading `source` (a text stream, read
+    `chunk_size` characters at a time, or an iterable of strings) lazily and yielding
+    the converted text as it becomes available"""
+    return _stream(KanaStream(**options), source, chunk_size)
+
+
+def stream_to_romaji(
+    source: Union[IO[str], Iterable[str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **options,
+) -> Iterator[str]:
+    """Converts Kana to Romaji like `to_romaji`, reading `source` (a text stream, read
+    `chunk_size` characters at a time, or an iterable of strings) lazily and yielding
+    the converted text as it becomes available"""
+    return _stream(RomajiStream(**options), source, chunk_size)
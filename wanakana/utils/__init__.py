@@ -1,11 +1,150 @@
-from .common import *
-from .english import *
-from .japanese import *
-from .kana_mapping import *
-from .kana_to_romaji_map import *
-from .romaji_to_kana_map import *
+from importlib import import_module
 
+# the submodules whose names are exported, with the public names each one defines.
+# They're only imported when one of their names is first used (PEP 562), so that
+# importing the package doesn't build the mapping tables. Later submodules take
+# precedence, as they did when they were star-imported in this order
+_submodules = {
+    "common": [
+        "is_empty",
+        "is_char_in_range",
+        "is_char_romaji",
+        "is_char_punctuation",
+    ],
+    "classification": [
+        "CHAR_ROMAJI",
+        "CHAR_ENGLISH_PUNCTUATION",
+        "CHAR_JAPANESE",
+        "CHAR_JAPANESE_PUNCTUATION",
+        "CHAR_HIRAGANA",
+        "CHAR_KATAKANA",
+        "CHAR_KANJI",
+        "CHAR_ENGLISH_NUMERAL",
+        "CHAR_JAPANESE_NUMERAL",
+        "CHAR_ENGLISH_SPACE",
+        "CHAR_JAPANESE_SPACE",
+        "CHAR_KANA",
+        "LONG_DASH_RANGE",
+        "CATEGORY_RANGES",
+        "BMP_SIZE",
+        "merge_category_ranges",
+        "char_flags",
+    ],
+    "english": [
+        "is_char_consonant",
+        "is_char_english_punctuation",
+        "is_char_uppercase",
+        "is_char_vowel",
+    ],
+    "japanese": [
+        "is_char_long_dash",
+        "is_char_slash_dot",
+        "is_char_japanese",
+        "is_char_japanese_punctuation",
+        "is_char_hiragana",
+        "is_char_katakana",
+        "is_char_kanji",
+        "katakana_to_hiragana",
+        "resume_katakana_to_hiragana",
+        "hiragana_to_katakana",
+        "is_char_kana",
+    ],
+    "kana_mapping": [
+        "apply_mapping",
+        "transform",
+        "get_subtree_of",
+        "create_custom_mapping",
+        "merge_custom_mapping",
+    ],
+    "automaton": ["MappingAutomaton", "CompactMappingAutomaton", "compacted"],
+    "regex_mapping": ["RegexMapping"],
+    "cache": ["CacheInfo", "mapping_key", "LRUCache"],
+    "instrumentation": [
+        "ENTRY_POINTS",
+        "HISTOGRAM_BOUNDS",
+        "EntryPointStats",
+        "StatsEvent",
+        "enable_instrumentation",
+        "disable_instrumentation",
+        "stats",
+        "reset_stats",
+        "add_stats_hook",
+        "remove_stats_hook",
+    ],
+    "kana_to_romaji_map": [
+        "kana_to_hepburn_map",
+        "kana_to_kunrei_map",
+        "kana_to_romaji_automata",
+        "kana_vowels",
+        "BASIC_HEPBURN",
+        "BASIC_KUNREI",
+        "SPECIAL_SYMBOLS",
+        "AMBIGUOUS_KANA",
+        "SMALL_Y",
+        "SMALL_Y_EXTRA",
+        "SMALL_AIUEO",
+        "YOON_KANA",
+        "YOON_EXCEPTIONS",
+        "SMALL_KANA",
+        "SOKUON_WHITELIST",
+        "resolve_tsu",
+        "create_kana_to_hepburn_map",
+        "create_kana_to_kunrei_map",
+        "get_kana_to_hepburn_tree",
+        "get_kana_to_kunrei_tree",
+        "create_kana_vowel_map",
+        "get_kana_vowels",
+        "get_kana_to_romaji_tree",
+        "get_kana_to_romaji_automaton",
+    ],
+    "romaji_to_kana_map": [
+        "BASIC_KUNREI",
+        "SPECIAL_SYMBOLS",
+        "CONSONANTS",
+        "SMALL_Y",
+        "SMALL_VOWELS",
+        "ALIASES",
+        "SMALL_LETTERS",
+        "SPECIAL_CASES",
+        "AIUEO_CONSTRUCTIONS",
+        "create_romaji_to_kana_map",
+        "get_romaji_to_kana_tree",
+        "romaji_to_kana_automata",
+        "build_romaji_to_kana_automaton",
+        "get_romaji_to_kana_automaton",
+        "USE_OBSOLETE_KANA_MAP",
+        "IME_MODE_MAP",
+    ],
+}
+_lazy_names = {
+    name: module for module, names in _submodules.items() for name in names
+}
+
+__all__ = list(_lazy_names)
+
+
+def __getattr__(name: str):
+    if name in _submodules:
+        return import_module(f".{name}", __name__)
+    if name in _lazy_names:
+        value = getattr(import_module(f".{_lazy_names[name]}", __name__), name)
+    else:
+        value = _find_reexport(name, __name__, list(_submodules))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted({*globals(), *_submodules, *_lazy_names})
+
+
+def _find_reexport(name: str, package: str, submodules: list):
+    """Looks up a name that isn't in a package's index, but used to be exported by
+    star-importing `submodules` (such as something they import themselves)"""
+    if not name.startswith("_"):
+        for submodule in reversed(submodules):
+            namespace = vars(import_module(f".{submodule}", package))
+            if name in namespace:
+                return namespace[name]
+    raise AttributeError(f"module {package!r} has no attribute {name!r}")
 
-def is_char_punctuation(char: str = "") -> bool:
-    """Tests if a character is considered Japanese or English punctuation"""
-    return is_char_english_punctuation(char) or is_char_japanese_punctuation(char)
@@ -0,0 +1,333 @@
+from array import array
+from functools import partial
+from threading import Lock
+from typing import List, Tuple
+
+from . import instrumentation
+
+# held while an automaton's RegexMapping is compiled, so it's only compiled once
+_regex_lock = Lock()
+
+# whether the mapping tables are built as CompactMappingAutomaton (see
+# use_compact_tables)
+compact_tables = False
+
+
+class MappingAutomaton:
+    """A compiled, read-only form of a mapping tree (as built by `transform`).
+
+    Every node of the tree becomes a numbered state; `_transitions[state]` maps the
+    next character to the next state and `_values[state]` is the text emitted for
+    that state (or None if the characters consumed so far should be kept). Subtrees
+    that are shared between branches of the tree are compiled once.
+
+    Instances are never mutated after construction, so one automaton can be shared
+    between calls and threads"""
+
+    __slots__ = ("_transitions", "_values", "_ascii_roots", "_regex")
+
+    def __init__(self, tree: dict):
+        if instrumentation.enabled:
+            instrumentation.record("trie_build")
+        transitions = []
+        values = []
+        states = {}
+
+        def add_state(node) -> int:
+            state = states.get(id(node))
+            if state is not None:
+                return state
+            state = states[id(node)] = len(values)
+            edges = {}
+            transitions.append(edges)
+            if isinstance(node, dict):
+                values.append(node.get(""))
+                for char, subtree in node.items():
+                    if char:
+                        edges[char] = add_state(subtree)
+            else:
+                values.append(node)
+            return state
+
+        add_state(tree)
+        # the root never emits anything by itself
+        values[0] = None
+        object.__setattr__(self, "_transitions", tuple(transitions))
+        object.__setattr__(self, "_values", tuple(values))
+        self._set_ascii_roots()
+        object.__setattr__(self, "_regex", None)
+
+    @classmethod
+    def from_tables(cls, transitions: tuple, values: tuple) -> "MappingAutomaton":
+        """Recreates an automaton from the `tables` of another, without the tree"""
+        automaton = object.__new__(cls)
+        object.__setattr__(automaton, "_transitions", tuple(transitions))
+        object.__setattr__(automaton, "_values", tuple(values))
+        automaton._set_ascii_roots()
+        object.__setattr__(automaton, "_regex", None)
+        return automaton
+
+    def _set_ascii_roots(self):
+        # whether any ASCII character starts a chunk, so that passes_through can
+        # skip looking at ASCII strings when none do
+        ascii_roots = any(char.isascii() for char in self._transitions[0])
+        object.__setattr__(self, "_ascii_roots", ascii_roots)
+
+    def tables(self) -> Tuple[tuple, tuple]:
+        """Returns the transitions and values of every state, which can be saved and
+        passed to `from_tables` later"""
+        return self._transitions, self._values
+
+    def __reduce__(self):
+        return type(self).from_tables, self.tables()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __len__(self) -> int:
+        """The number of states in the automaton"""
+        return len(self._values)
+
+    def regex(self) -> "RegexMapping":
+        """Returns the automaton compiled into a `RegexMapping`, compiling it on first
+        use"""
+        regex = self._regex
+        if regex is None:
+            from .regex_mapping import RegexMapping
+
+            with _regex_lock:
+                regex = self._regex
+                if regex is None:
+                    regex = RegexMapping(self)
+                    object.__setattr__(self, "_regex", regex)
+        return regex
+
+    def passes_through(self, string: str) -> bool:
+        """Tests if no character of `string` starts a chunk, in which case applying
+        the automaton leaves every character as it is"""
+        if not self._ascii_roots and string.isascii():
+            return True
+        return self._transitions[0].keys().isdisjoint(string)
+
+    def apply(self, string: str, convert_ending: bool) -> List[Tuple[int, int, str]]:
+        """Splits `string` into the longest chunks known to the automaton, with the
+        same `(start, end, text)` output as `apply_mapping`"""
+        return self.scan(string, convert_ending)[0]
+
+    def scan(
+        self, string: str, convert_ending: bool, final: bool = True
+    ) -> Tuple[List[Tuple[int, int, str]], int]:
+        """Like `apply`, but also returns how much of `string` was consumed. If
+        `final` is unset, more input may follow `string`, so a chunk that reaches the
+        end of `string` and could still be continued is left unconsumed, to be
+        scanned again once more input has arrived"""
+        transitions = self._transitions
+        values = self._values
+        root = transitions[0]
+        chunks = []
+        length = len(string)
+        cursor = 0
+
+        while cursor < length:
+            last_cursor = cursor
+            char = string[cursor]
+            state = root.get(char)
+            cursor += 1
+
+            if state is None:
+                # unmapped characters are passed through as-is
+                if cursor < length or (final and convert_ending):
+                    chunks.append((last_cursor, cursor, char))
+                elif final:
+                    chunks.append((last_cursor, cursor, None))
+                else:
+                    return chunks, last_cursor
+                continue
+
+            text = values[state]
+            if text is None:
+                text = char
+            edges = transitions[state]
+
+            # descend as far as the automaton allows
+            while cursor < length:
+                next_char = string[cursor]
+                next_state = edges.get(next_char)
+                if next_state is None:
+                    break
+                value = values[next_state]
+                # states without a value of their own keep the characters consumed
+                text = text + next_char if value is None else value
+                edges = transitions[next_state]
+                cursor += 1
+
+            if cursor < length:
+                chunks.append((last_cursor, cursor, text))
+            elif edges and not final:
+                # more input might continue this chunk
+                return chunks, last_cursor
+            elif convert_ending or not edges:
+                # don't leave an empty element at the end of the result
+                if text:
+                    chunks.append((last_cursor, cursor, text))
+            else:
+                # there are still possible continuations, so leave the ending alone
+                chunks.append((last_cursor, cursor, None))
+
+        return chunks, length
+
+
+class CompactMappingAutomaton(MappingAutomaton):
+    """A `MappingAutomaton` keeping its tables in a few flat arrays instead of a dict
+    per state, for less than half of the memory (most states are leaves, and even an
+    empty dict takes 64 bytes) at the cost of slower scans.
+
+    The edges of state `s` are `_edge_chars[_edge_offsets[s]:_edge_offsets[s + 1]]`,
+    leading to the states at the same positions of `_edge_targets`, and its text is
+    `_texts[_text_ids[s]]`, each distinct text being stored once. The root's edges
+    are kept in a dict, since every chunk starts there. Edges with more than one
+    character are only kept at the root, as the automaton never reaches the others"""
+
+    __slots__ = (
+        "_root",
+        "_edge_offsets",
+        "_edge_chars",
+        "_edge_targets",
+        "_text_ids",
+        "_texts",
+    )
+
+    def __init__(self, tree: dict):
+        self._compact(*MappingAutomaton(tree).tables())
+
+    @classmethod
+    def from_tables(
+        cls, transitions: tuple, values: tuple
+    ) -> "CompactMappingAutomaton":
+        automaton = object.__new__(cls)
+        automaton._compact(transitions, values)
+        return automaton
+
+    @classmethod
+    def from_automaton(cls, automaton: MappingAutomaton) -> "CompactMappingAutomaton":
+        return cls.from_tables(*automaton.tables())
+
+    def _compact(self, transitions: tuple, values: tuple):
+        # the root's edges are only in _root
+        edge_offsets = array("I", [0, 0])
+        edge_chars = []
+        edge_targets = array("I")
+        for edges in transitions[1:]:
+            for char, state in edges.items():
+                if len(char) == 1:
+                    edge_chars.append(char)
+                    edge_targets.append(state)
+            edge_offsets.append(len(edge_chars))
+        # the text of each id, with the states without a text of their own first
+        texts = {None: 0}
+        text_ids = array("I", [texts.setdefault(text, len(texts)) for text in values])
+
+        assign = partial(object.__setattr__, self)
+        assign("_root", dict(transitions[0]))
+        assign("_edge_offsets", edge_offsets)
+        assign("_edge_chars", "".join(edge_chars))
+        assign("_edge_targets", edge_targets)
+        assign("_text_ids", text_ids)
+        assign("_texts", tuple(texts))
+        self._set_ascii_roots()
+        assign("_regex", None)
+
+    def _set_ascii_roots(self):
+        ascii_roots = any(char.isascii() for char in self._root)
+        object.__setattr__(self, "_ascii_roots", ascii_roots)
+
+    def tables(self) -> Tuple[tuple, tuple]:
+        edge_offsets = self._edge_offsets
+        edge_chars = self._edge_chars
+        edge_targets = self._edge_targets
+        transitions = [self._root]
+        for state in range(1, len(self)):
+            start, end = edge_offsets[state], edge_offsets[state + 1]
+            edges = zip(edge_chars[start:end], edge_targets[start:end])
+            transitions.append(dict(edges))
+        texts = self._texts
+        return tuple(transitions), tuple(texts[text_id] for text_id in self._text_ids)
+
+    def __len__(self) -> int:
+        return len(self._text_ids)
+
+    def passes_through(self, string: str) -> bool:
+        if not self._ascii_roots and string.isascii():
+            return True
+        return self._root.keys().isdisjoint(string)
+
+    def scan(
+        self, string: str, convert_ending: bool, final: bool = True
+    ) -> Tuple[List[Tuple[int, int, str]], int]:
+        # the same as MappingAutomaton.scan, with the edges of each state being the
+        # range start:end of the flat tables
+        root = self._root
+        edge_offsets = self._edge_offsets
+        find_edge = self._edge_chars.find
+        edge_targets = self._edge_targets
+        text_ids = self._text_ids
+        texts = self._texts
+        chunks = []
+        length = len(string)
+        cursor = 0
+
+        while cursor < length:
+            last_cursor = cursor
+            char = string[cursor]
+            state = root.get(char)
+            cursor += 1
+
+            if state is None:
+                if cursor < length or (final and convert_ending):
+                    chunks.append((last_cursor, cursor, char))
+                elif final:
+                    chunks.append((last_cursor, cursor, None))
+                else:
+                    return chunks, last_cursor
+                continue
+
+            text = texts[text_ids[state]]
+            if text is None:
+                text = char
+            start = edge_offsets[state]
+            end = edge_offsets[state + 1]
+
+            while cursor < length and start < end:
+                next_char = string[cursor]
+                edge = find_edge(next_char, start, end)
+                if edge < 0:
+                    break
+                next_state = edge_targets[edge]
+                value = texts[text_ids[next_state]]
+                text = text + next_char if value is None else value
+                start = edge_offsets[next_state]
+                end = edge_offsets[next_state + 1]
+                cursor += 1
+
+            if cursor < length:
+                chunks.append((last_cursor, cursor, text))
+            elif start < end and not final:
+                return chunks, last_cursor
+            elif convert_ending or start == end:
+                if text:
+                    chunks.append((last_cursor, cursor, text))
+            else:
+                chunks.append((last_cursor, cursor, None))
+
+        return chunks, length
+
+
+def compacted(automaton: MappingAutomaton) -> MappingAutomaton:
+    """Returns `automaton` as a CompactMappingAutomaton if the tables are to be
+    compact (see use_compact_tables), or as it is otherwise"""
+    if compact_tables and not isinstance(automaton, CompactMappingAutomaton):
+        return CompactMappingAutomaton.from_automaton(automaton)
+    return automaton
@@ -0,0 +1,121 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Union
+
+from . import instrumentation
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "size"])
+
+_missing = object()
+
+
+def mapping_key(mapping: Union[dict, Callable[[dict], dict]]) -> Hashable:
+    """Returns a hashable key identifying a custom mapping by its content, so that
+    equal mappings share cache entries. Mappings given as functions can't be
+    inspected, so they are identified by the function itself"""
+    if isinstance(mapping, dict):
+        return tuple(sorted(mapping.items()))
+    return mapping
+
+
+class LRUCache:
+    """A thread-safe cache holding at most `maxsize` entries, evicting the least
+    recently used entry when full. A `maxsize` of 0 disables caching. If `ttl` is
+    set, entries also expire `ttl` seconds after they were added (expired entries
+    are counted as evictions)"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = None):
+        self._data = OrderedDict()
+        # when each entry expires, for the entries added while there was a ttl
+        self._expiry = {}
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def _evict(self):
+        while len(self._data) > self._maxsize:
+            key, _ = self._data.popitem(last=False)
+            self._expiry.pop(key, None)
+            self._evictions += 1
+
+    def _added(self, key: Hashable):
+        self._data.move_to_end(key)
+        if self._ttl is not None:
+            self._expiry[key] = monotonic() + self._ttl
+        else:
+            self._expiry.pop(key, None)
+        self._evict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, _missing)
+            expires = self._expiry.get(key)
+            if expires is not None and expires <= monotonic():
+                del self._data[key], self._expiry[key]
+                self._evictions += 1
+                value = _missing
+            if value is _missing:
+                self._misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._hits += 1
+        if instrumentation.enabled:
+            instrumentation.record("cache_miss" if value is _missing else "cache_hit")
+        return default if value is _missing else value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._added(key)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Returns the entry for `key`, calling `factory` to create it on a miss.
+        `factory` is called without holding the lock, so if two threads miss at
+        once both may build the value, but only the first one is kept"""
+        value = self.get(key, _missing)
+        if value is not _missing:
+            return value
+        value = factory()
+        with self._lock:
+            if key in self._data:
+                # another thread created it first
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._data[key] = value
+            self._added(key)
+        return value
+
+    def resize(self, maxsize: int):
+        """Changes the maximum number of entries, evicting entries if needed"""
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def set_ttl(self, ttl: float = None):
+        """Changes how long entries added from now on are kept for (forever if `ttl`
+        is None)"""
+        with self._lock:
+            self._ttl = ttl
+
+    def clear(self):
+        """Removes all entries and resets the statistics"""
+        with self._lock:
+            self._data.clear()
+            self._expiry.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._evictions, self._maxsize, len(self._data)
+            )
@@ -0,0 +1,93 @@
+from array import array
+from bisect import bisect_right
+from typing import List, Tuple
+from ..constants import (
+    ROMAJI_RANGES,
+    EN_PUNCTUATION_RANGES,
+    JAPANESE_RANGES,
+    JA_PUNCTUATION_RANGES,
+    HIRAGANA_START,
+    HIRAGANA_END,
+    KATAKANA_START,
+    KATAKANA_END,
+    KANJI_START,
+    KANJI_END,
+    PROLONGED_SOUND_MARK,
+    ZENKAKU_NUMBERS,
+)
+
+# character categories, as bit flags (a character can be in several categories)
+CHAR_ROMAJI = 1 << 0
+CHAR_ENGLISH_PUNCTUATION = 1 << 1
+CHAR_JAPANESE = 1 << 2
+CHAR_JAPANESE_PUNCTUATION = 1 << 3
+CHAR_HIRAGANA = 1 << 4
+CHAR_KATAKANA = 1 << 5
+CHAR_KANJI = 1 << 6
+CHAR_ENGLISH_NUMERAL = 1 << 7
+CHAR_JAPANESE_NUMERAL = 1 << 8
+CHAR_ENGLISH_SPACE = 1 << 9
+CHAR_JAPANESE_SPACE = 1 << 10
+CHAR_KANA = CHAR_HIRAGANA | CHAR_KATAKANA
+
+LONG_DASH_RANGE = [PROLONGED_SOUND_MARK, PROLONGED_SOUND_MARK]
+
+CATEGORY_RANGES = [
+    (CHAR_ROMAJI, ROMAJI_RANGES),
+    (CHAR_ENGLISH_PUNCTUATION, EN_PUNCTUATION_RANGES),
+    (CHAR_JAPANESE, JAPANESE_RANGES),
+    (CHAR_JAPANESE_PUNCTUATION, JA_PUNCTUATION_RANGES),
+    (CHAR_HIRAGANA, [[HIRAGANA_START, HIRAGANA_END], LONG_DASH_RANGE]),
+    (CHAR_KATAKANA, [[KATAKANA_START, KATAKANA_END], LONG_DASH_RANGE]),
+    (CHAR_KANJI, [[KANJI_START, KANJI_END]]),
+    (CHAR_ENGLISH_NUMERAL, [[ord("0"), ord("9")]]),
+    (CHAR_JAPANESE_NUMERAL, [ZENKAKU_NUMBERS]),
+    (CHAR_ENGLISH_SPACE, [[ord(" "), ord(" ")]]),
+    (CHAR_JAPANESE_SPACE, [[ord("　"), ord("　")]]),
+]
+
+BMP_SIZE = 0x10000
+
+
+def merge_category_ranges(category_ranges: list) -> Tuple[List[int], List[int]]:
+    """Splits the code points into intervals with the same categories, returning the
+    sorted starts of the intervals and the category flags of each interval"""
+    boundaries = {0}
+    for _, ranges in category_ranges:
+        for start, end in ranges:
+            boundaries.update([start, end + 1])
+
+    starts = sorted(boundaries)
+    flags = []
+    for start in starts:
+        interval_flags = 0
+        for flag, ranges in category_ranges:
+            if any(range_start <= start <= end for range_start, end in ranges):
+                interval_flags |= flag
+        flags.append(interval_flags)
+    return starts, flags
+
+
+_interval_starts, _interval_flags = merge_category_ranges(CATEGORY_RANGES)
+
+# one entry per code point in the Basic Multilingual Plane, where all of the ranges
+# are; anything above it is looked up in the intervals instead
+_bmp_flags = array("H", bytes(2 * BMP_SIZE))
+for _index, _start in enumerate(_interval_starts):
+    if _start >= BMP_SIZE:
+        break
+    _end = BMP_SIZE
+    if _index + 1 < len(_interval_starts):
+        _end = min(_interval_starts[_index + 1], BMP_SIZE)
+    _bmp_flags[_start:_end] = array("H", [_interval_flags[_index]]) * (_end - _start)
+del _index, _start, _end
+
+
+def char_flags(char: str = "") -> int:
+    """Returns the categories (`CHAR_*` bit flags) of the first character of `char`"""
+    if (not isinstance(char, str)) or (not char):
+        return 0
+    code = ord(char[0])
+    if code < BMP_SIZE:
+        return _bmp_flags[code]
+    return _interval_flags[bisect_right(_interval_starts, code) - 1]
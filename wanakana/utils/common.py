@@ -1,4 +1,10 @@
-from ..constants import ROMAJI_RANGES, DEFAULT_OPTIONS
+from ..constants import DEFAULT_OPTIONS
+from .classification import (
+    char_flags,
+    CHAR_ROMAJI,
+    CHAR_ENGLISH_PUNCTUATION,
+    CHAR_JAPANESE_PUNCTUATION,
+)
 
 
 def is_empty(text: str) -> bool:
@@ -15,4 +21,11 @@ def is_char_in_range(char: str = "", start: int = 0, end: int = 0) -> bool:
 
 def is_char_romaji(char: str = "") -> bool:
     """Tests if a character is Romaji (using Hepburn romanisation)."""
-    return any(is_char_in_range(char, start, end) for start, end in ROMAJI_RANGES)
+    return bool(char_flags(char) & CHAR_ROMAJI)
+
+
+def is_char_punctuation(char: str = "") -> bool:
+    """Tests if a character is considered Japanese or English punctuation"""
+    return bool(
+        char_flags(char) & (CHAR_ENGLISH_PUNCTUATION | CHAR_JAPANESE_PUNCTUATION)
+    )
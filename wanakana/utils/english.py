@@ -1,6 +1,6 @@
 import string
-from ..constants import EN_PUNCTUATION_RANGES
-from .common import is_empty, is_char_in_range
+from .common import is_empty
+from .classification import char_flags, CHAR_ENGLISH_PUNCTUATION
 
 
 def is_char_consonant(char: str = "", include_y: bool = True) -> bool:
@@ -16,9 +16,7 @@ def is_char_consonant(char: str = "", include_y: bool = True) -> bool:
 
 def is_char_english_punctuation(char: str = "") -> bool:
     """Tests if a character is considered English punctuation."""
-    return any(
-        is_char_in_range(char, start, end) for start, end in EN_PUNCTUATION_RANGES
-    )
+    return bool(char_flags(char) & CHAR_ENGLISH_PUNCTUATION)
 
 
 def is_char_uppercase(char: str = "") -> bool:
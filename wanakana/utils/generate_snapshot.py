@@ -0,0 +1,139 @@
+"""Generates `snapshot_tables.py` from the mapping trees.
+
+    python -m wanakana.utils.generate_snapshot          # regenerate the snapshots
+    python -m wanakana.utils.generate_snapshot --check  # fail if they're out of date"""
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+from ..constants import ROMANISATIONS
+from .automaton import MappingAutomaton
+from .kana_to_romaji_map import create_kana_vowel_map, get_kana_to_romaji_tree
+from .romaji_to_kana_map import build_romaji_to_kana_automaton
+from .snapshot import load_snapshot
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "snapshot_tables.py")
+LINE_LENGTH = 88
+
+
+def build_tables() -> Dict[tuple, Any]:
+    """Builds every table that is snapshotted, without using the snapshots"""
+    tables = {}
+    for use_obsolete_kana in [False, True]:
+        for IME_mode in [False, True]:
+            tables[
+                ("romaji_to_kana", use_obsolete_kana, IME_mode)
+            ] = build_romaji_to_kana_automaton(use_obsolete_kana, IME_mode)
+    for romanisation in ROMANISATIONS.values():
+        tables[("kana_to_romaji", romanisation)] = MappingAutomaton(
+            get_kana_to_romaji_tree(romanisation=romanisation)
+        )
+    tables[("kana_vowels",)] = create_kana_vowel_map()
+    return tables
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, str):
+        # JSON strings are valid Python, and use the same quotes as the rest of the code
+        return json.dumps(value, ensure_ascii=False)
+    return repr(value)
+
+
+def _literal_tuple(parts: tuple) -> str:
+    if len(parts) == 1:
+        return f"({_literal(parts[0])},)"
+    return f"({', '.join(_literal(part) for part in parts)})"
+
+
+def _wrap(items: List[str], brackets: str, indent: int) -> List[str]:
+    """Lays out `items` between `brackets`, filling each line up to LINE_LENGTH"""
+    opening, closing = brackets
+    single_line = f"{opening}{', '.join(items)}{closing}"
+    if indent + len(single_line) <= LINE_LENGTH:
+        return [" " * indent + single_line]
+    lines = [" " * indent + opening]
+    line = ""
+    for item in items:
+        if line and indent + 4 + len(line) + len(item) + 2 > LINE_LENGTH:
+            lines.append(" " * (indent + 4) + line.rstrip())
+            line = ""
+        line += f"{item}, "
+    lines.append(" " * (indent + 4) + line.rstrip())
+    lines.append(" " * indent + closing)
+    return lines
+
+
+def _wrap_dict(table: dict, indent: int) -> List[str]:
+    items = [f"{_literal(key)}: {_literal(value)}" for key, value in table.items()]
+    return _wrap(items, "{}", indent)
+
+
+def _function_name(key: tuple) -> str:
+    return "_".join(str(part).lower() for part in key)
+
+
+def render_snapshots(tables: Dict[tuple, Any]) -> str:
+    lines = [
+        "# Generated by `python -m wanakana.utils.generate_snapshot`; do not edit",
+        "from .automaton import MappingAutomaton",
+    ]
+    for key, table in tables.items():
+        lines += ["", "", f"def {_function_name(key)}():"]
+        if isinstance(table, MappingAutomaton):
+            transitions, values = table.tables()
+            lines.append("    return MappingAutomaton.from_tables(")
+            lines.append("        (")
+            for edges in transitions:
+                lines += _wrap_dict(edges, 12)
+                lines[-1] += ","
+            lines.append("        ),")
+            lines += _wrap([_literal(value) for value in values], "()", 8)
+            lines[-1] += ","
+            lines.append("    )")
+        else:
+            table_lines = _wrap_dict(table, 4)
+            table_lines[0] = "    return " + table_lines[0].lstrip()
+            lines += table_lines
+    lines += ["", "", "SNAPSHOTS = {"]
+    for key in tables:
+        lines.append(f"    {_literal_tuple(key)}: {_function_name(key)},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _contents(table: Any) -> Any:
+    if isinstance(table, MappingAutomaton):
+        return table.tables()
+    return table
+
+
+def stale_snapshots() -> List[tuple]:
+    """Returns the keys of the snapshots that don't match the mapping trees"""
+    return [
+        key
+        for key, table in build_tables().items()
+        if _contents(load_snapshot(key)) != _contents(table)
+    ]
+
+
+def main(args: List[str]) -> int:
+    if "--check" in args:
+        stale = stale_snapshots()
+        for key in stale:
+            print(f"the snapshot of {key} is out of date", file=sys.stderr)
+        if stale:
+            print(
+                "run `python -m wanakana.utils.generate_snapshot` to regenerate them",
+                file=sys.stderr,
+            )
+        return 1 if stale else 0
+
+    with open(SNAPSHOT_PATH, "w", encoding="utf-8") as file:
+        file.write(render_snapshots(build_tables()))
+    print(f"wrote {SNAPSHOT_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
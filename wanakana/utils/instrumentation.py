@@ -0,0 +1,213 @@
+"""Opt-in counters (and optionally timings) for the public functions, to find out
+where the time goes in production.
+
+Nothing is recorded until `enable_instrumentation` is called. It replaces the
+functions named in ENTRY_POINTS with wrappers that record each call, and
+`disable_instrumentation` puts the originals back, so instrumentation costs nothing
+while it's off. Names imported before it was enabled (`from wanakana import to_kana`)
+keep calling the originals.
+
+The internals (mapping builds, custom mapping merges and cache lookups) only record
+their events while `enabled` is set, against the entry point running on the same
+thread (or OTHER if there isn't one)"""
+import threading
+import time
+from bisect import bisect_left
+from collections import namedtuple
+from functools import wraps
+from importlib import import_module
+from typing import Callable, Dict
+
+# the instrumented functions, by the module (in the wanakana package) defining them
+ENTRY_POINTS = {
+    "common": [
+        "is_hiragana",
+        "is_katakana",
+        "is_japanese",
+        "is_kana",
+        "is_kanji",
+        "is_mixed",
+        "is_romaji",
+        "tokenise",
+    ],
+    "japanese": [
+        "strip_okurigana",
+        "to_kana",
+        "to_kana_with_offsets",
+        "to_kana_many",
+        "split_into_romaji",
+        "to_romaji",
+        "to_romaji_with_offsets",
+        "to_romaji_many",
+        "to_hiragana",
+        "to_katakana",
+        "normalise_romaji",
+    ],
+}
+# where events that happen outside of the entry points are recorded
+OTHER = "other"
+
+# the upper bounds of the timing histogram's buckets, in seconds. The last bucket
+# counts the calls that took longer than all of them
+HISTOGRAM_BOUNDS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+EntryPointStats = namedtuple(
+    "EntryPointStats",
+    [
+        "calls",
+        "characters",
+        "trie_builds",
+        "merges",
+        "cache_hits",
+        "cache_misses",
+        "seconds",
+        "histogram",
+    ],
+)
+# passed to the hooks for every call ("call") and internal event ("trie_build",
+# "merge", "cache_hit" or "cache_miss"). `characters` is only set for calls, and
+# `seconds` for calls that were timed
+StatsEvent = namedtuple("StatsEvent", ["kind", "entry_point", "characters", "seconds"])
+
+# the positions of the internal events' counters
+_event_counters = {"trie_build": 2, "merge": 3, "cache_hit": 4, "cache_miss": 5}
+
+enabled = False
+_timed = False
+_lock = threading.Lock()
+_counters = {}
+_hooks = ()
+# (namespace, name, original function) for everything enable_instrumentation replaced
+_replaced = []
+_current = threading.local()
+
+
+def _counters_of(entry_point: str) -> list:
+    # only call this while holding _lock
+    counters = _counters.get(entry_point)
+    if counters is None:
+        counters = _counters[entry_point] = [0, 0, 0, 0, 0, 0, 0.0]
+        counters.append([0] * (len(HISTOGRAM_BOUNDS) + 1))
+    return counters
+
+
+def _notify(event: StatsEvent):
+    for hook in _hooks:
+        hook(event)
+
+
+def record(kind: str):
+    """Records an internal event of `kind` (see StatsEvent) against the entry point
+    running on this thread"""
+    entry_point = getattr(_current, "entry_point", OTHER)
+    with _lock:
+        _counters_of(entry_point)[_event_counters[kind]] += 1
+    if _hooks:
+        _notify(StatsEvent(kind, entry_point, None, None))
+
+
+def _record_call(entry_point: str, characters: int, seconds: float):
+    with _lock:
+        counters = _counters_of(entry_point)
+        counters[0] += 1
+        counters[1] += characters
+        if seconds is not None:
+            counters[6] += seconds
+            counters[7][bisect_left(HISTOGRAM_BOUNDS, seconds)] += 1
+    if _hooks:
+        _notify(StatsEvent("call", entry_point, characters, seconds))
+
+
+def _instrument(entry_point: str, function: Callable) -> Callable:
+    @wraps(function)
+    def instrumented(*args, **kwargs):
+        # wrappers can outlive disable_instrumentation (e.g. in a caller's globals),
+        # and calls between the entry points (like normalise_romaji calling
+        # to_kana) are part of the outermost call
+        if not enabled or getattr(_current, "entry_point", OTHER) != OTHER:
+            return function(*args, **kwargs)
+        input = args[0] if args else kwargs.get("input", kwargs.get("inputs", ""))
+        if isinstance(input, str):
+            characters = len(input)
+        elif isinstance(input, (list, tuple)):
+            # the inputs of a batch (lazy ones can't be counted without using them up)
+            characters = sum(map(len, input))
+        else:
+            characters = 0
+        _current.entry_point = entry_point
+        start = time.perf_counter() if _timed else None
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds = None if start is None else time.perf_counter() - start
+            _current.entry_point = OTHER
+            _record_call(entry_point, characters, seconds)
+
+    return instrumented
+
+
+def enable_instrumentation(timings: bool = False):
+    """Starts recording the calls to the ENTRY_POINTS and the events inside them. If
+    `timings` is set, the calls are timed as well"""
+    global enabled, _timed
+    _timed = timings
+    if enabled:
+        return
+    package = vars(import_module("..", __package__))
+    for module, names in ENTRY_POINTS.items():
+        namespace = vars(import_module(f"..{module}", __package__))
+        for name in names:
+            original = namespace[name]
+            instrumented = _instrument(name, original)
+            namespace[name] = instrumented
+            _replaced.append((namespace, name, original))
+            # the package caches the names that have been used
+            if package.get(name) is original:
+                package[name] = instrumented
+                _replaced.append((package, name, original))
+    enabled = True
+
+
+def disable_instrumentation():
+    """Stops recording, keeping the statistics recorded so far"""
+    global enabled
+    enabled = False
+    while _replaced:
+        namespace, name, original = _replaced.pop()
+        namespace[name] = original
+    # the package also caches the wrappers of the names first used while enabled
+    package = vars(import_module("..", __package__))
+    for names in ENTRY_POINTS.values():
+        for name in names:
+            original = getattr(package.get(name), "__wrapped__", None)
+            if original is not None:
+                package[name] = original
+
+
+def stats() -> Dict[str, EntryPointStats]:
+    """Returns the statistics recorded for each entry point so far"""
+    with _lock:
+        return {
+            entry_point: EntryPointStats(*counters[:7], tuple(counters[7]))
+            for entry_point, counters in _counters.items()
+        }
+
+
+def reset_stats():
+    """Forgets the statistics recorded so far"""
+    with _lock:
+        _counters.clear()
+
+
+def add_stats_hook(hook: Callable[[StatsEvent], None]):
+    """Calls `hook` with every event recorded from now on, on the thread it happened
+    on (e.g. to forward them to a metrics exporter)"""
+    global _hooks
+    with _lock:
+        _hooks += (hook,)
+
+
+def remove_stats_hook(hook: Callable[[StatsEvent], None]):
+    global _hooks
+    with _lock:
+        _hooks = tuple(added for added in _hooks if added is not hook)
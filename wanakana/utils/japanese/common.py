@@ -1,10 +1,6 @@
-from ...constants import (
-    PROLONGED_SOUND_MARK,
-    KANA_SLASH_DOT,
-    JAPANESE_RANGES,
-    JA_PUNCTUATION_RANGES,
-)
-from ..common import is_empty, is_char_in_range
+from ...constants import PROLONGED_SOUND_MARK, KANA_SLASH_DOT
+from ..common import is_empty
+from ..classification import char_flags, CHAR_JAPANESE, CHAR_JAPANESE_PUNCTUATION
 
 
 def is_char_long_dash(char: str = "") -> bool:
@@ -21,11 +17,9 @@ def is_char_slash_dot(char: str = "") -> bool:
 
 def is_char_japanese(char: str = "") -> bool:
     """Tests if a character is Japanese."""
-    return any(is_char_in_range(char, start, end) for start, end in JAPANESE_RANGES)
+    return bool(char_flags(char) & CHAR_JAPANESE)
 
 
 def is_char_japanese_punctuation(char: str = "") -> bool:
     """Tests if a character is considered Japanese punctuation."""
-    return any(
-        is_char_in_range(char, start, end) for start, end in JA_PUNCTUATION_RANGES
-    )
+    return bool(char_flags(char) & CHAR_JAPANESE_PUNCTUATION)
@@ -1,21 +1,12 @@
-from ...constants import KATAKANA_START, HIRAGANA_START
-from .common import is_char_long_dash, is_char_slash_dot
-from .hiragana import is_char_hiragana
+from ...constants import KATAKANA_START, HIRAGANA_START, HIRAGANA_END
 
+# str.translate table shifting every Hiragana character to its Katakana counterpart
+# ('ー' and '・' aren't in the Hiragana block so they're left alone)
+HIRAGANA_TO_KATAKANA = {
+    code: code + (KATAKANA_START - HIRAGANA_START)
+    for code in range(HIRAGANA_START, HIRAGANA_END + 1)
+}
 
-def hiragana_to_katakana(input: str) -> str:
-    kata = []
-    for char in input:
-        # Short circuit to avoid incorrect codeshift for 'ー' and '・'
-        if is_char_slash_dot(char) or is_char_long_dash(char):
-            kata.append(char)
-        elif (not is_char_long_dash(char)) and is_char_hiragana(char):
-            # Shift char code
-            code = ord(char[0]) + (KATAKANA_START - HIRAGANA_START)
-            kata_char = chr(code)
-            kata.append(kata_char)
-        else:
-            kata.append(char)
-
-    return "".join(kata)
 
+def hiragana_to_katakana(input: str) -> str:
+    return input.translate(HIRAGANA_TO_KATAKANA)
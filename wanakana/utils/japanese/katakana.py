@@ -1,10 +1,6 @@
-from ...constants import KATAKANA_END, KATAKANA_START
-from ..common import is_char_in_range
-from .common import is_char_long_dash
+from ..classification import char_flags, CHAR_KATAKANA
 
 
 def is_char_katakana(char: str = "") -> bool:
     """Tests if a character is Katakana."""
-    if is_char_long_dash(char):
-        return True
-    return is_char_in_range(char, KATAKANA_START, KATAKANA_END)
+    return bool(char_flags(char) & CHAR_KATAKANA)
@@ -1,51 +1,84 @@
-from typing import Callable
-from ...constants import KATAKANA_START, HIRAGANA_START
-from .common import is_char_long_dash, is_char_slash_dot
+from typing import Callable, Tuple
+from ...constants import (
+    KATAKANA_START,
+    KATAKANA_END,
+    HIRAGANA_START,
+    PROLONGED_SOUND_MARK,
+)
 from .katakana import is_char_katakana
 
-is_char_initial_long_dash = lambda char, index: index == 0 and is_char_long_dash(char)
-is_char_inner_long_dash = lambda char, index: index > 0 and is_char_long_dash(char)
-is_kana_as_symbol = lambda char: char in ["ヶ", "ヵ"]  # idfk but they're small kana lol
 LONG_VOWELS = {"a": "あ", "i": "い", "u": "う", "e": "え", "o": "う"}
+LONG_DASH = chr(PROLONGED_SOUND_MARK)
+# passed through without touching previous_kana ('ヶ' and 'ヵ': idfk but they're small
+# kana lol)
+UNSHIFTED_CHARS = "・ヶヵ"
 
-# inject to_romaji to avoid circular dependency (to_romaji <-> katakana_to_hiragana)
+# str.translate table shifting Katakana to Hiragana, other than the characters above
+# and 'ー', which is handled separately
+KATAKANA_TO_HIRAGANA = {
+    code: code + (HIRAGANA_START - KATAKANA_START)
+    for code in range(KATAKANA_START, KATAKANA_END + 1)
+    if chr(code) not in UNSHIFTED_CHARS + LONG_DASH
+}
+
+
+def kana_vowels() -> dict:
+    # the mapping tables are only imported once they're needed
+    from ..kana_to_romaji_map import get_kana_vowels
+
+    return get_kana_vowels()
+
+
+# to_romaji used to be injected here to find the vowels of long vowel marks; they're
+# looked up in a table now, but the argument is kept so existing callers still work
 def katakana_to_hiragana(
     input: str, to_romaji: Callable, is_destination_romaji: bool
 ) -> str:
-    previous_kana = ""
+    return resume_katakana_to_hiragana(input, to_romaji, is_destination_romaji)[0]
+
 
+def resume_katakana_to_hiragana(
+    input: str,
+    to_romaji: Callable,
+    is_destination_romaji: bool,
+    previous_char: str = "",
+    previous_kana: str = "",
+) -> Tuple[str, str, str]:
+    """Like `katakana_to_hiragana`, but continues from the state left by converting
+    the text before `input`, so that text can be converted in pieces. Returns the
+    converted text along with `previous_char` and `previous_kana` to continue from"""
     hira = []
-    for index, char in enumerate(input):
-        # Short circuit to avoid incorrect codeshift for 'ー' and '・'
-        if (
-            is_char_slash_dot(char)
-            or is_char_initial_long_dash(char, index)
-            or is_kana_as_symbol(char)
-        ):
-            hira.append(char)
-        elif previous_kana and is_char_inner_long_dash(
-            char, index
-        ):  # Transform long vowels: 'オー' to 'おう'
-            # Transform previousKana back to romaji, and slice off the vowel
-            romaji = to_romaji(previous_kana)[-1]
+    # only long vowel marks depend on the characters around them, so the text
+    # between them is translated in one go
+    segments = input.split(LONG_DASH)
+    vowels = kana_vowels() if len(segments) > 1 else {}
+    for index, segment in enumerate(segments):
+        if index > 0:
+            # Transform long vowels: 'オー' to 'おう' (leaving an initial 'ー', or one
+            # after a kana without a vowel like 'ン', alone)
+            romaji = previous_char and vowels.get(previous_kana)
+            if not romaji:
+                hira.append(LONG_DASH)
             # However, ensure 'オー' => 'おお' => 'oo' if this is a transform on the way to romaji
-            if (
-                is_char_katakana(input[index - 1])
-                and romaji == "o"
+            elif (
+                romaji == "o"
                 and is_destination_romaji
+                and is_char_katakana(previous_char)
             ):
                 hira.append("o")
             else:
                 hira.append(LONG_VOWELS[romaji])
-        elif (not is_char_long_dash(char)) and is_char_katakana(char):
-            # Shift char code
-            code = ord(char[0]) + (HIRAGANA_START - KATAKANA_START)
-            hira_char = chr(code)
-            previous_kana = hira_char
-            hira.append(hira_char)
-        else:
-            previous_kana = ""
-            hira.append(char)
-
-    return "".join(hira)
+            previous_char = LONG_DASH
+
+        if not segment:
+            continue
+        hira.append(segment.translate(KATAKANA_TO_HIRAGANA))
+        previous_char = segment[-1]
+        # the last character that isn't passed through decides the next long vowel
+        last_char = segment.rstrip(UNSHIFTED_CHARS)[-1:]
+        if last_char:
+            previous_kana = last_char.translate(KATAKANA_TO_HIRAGANA)
+            if previous_kana == last_char:
+                previous_kana = ""
 
+    return "".join(hira), previous_char, previous_kana
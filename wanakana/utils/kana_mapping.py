@@ -1,59 +1,60 @@
 from typing import Callable, Union, List, Tuple
 
+from . import instrumentation
+
 
 def apply_mapping(
     string: str, mapping: dict, convert_ending: bool
 ) -> List[Tuple[int, int, str]]:
-    root = mapping.copy()  # no idea if it's being mutated but they decided to copy it
-
-    def assign(target: dict, source: dict) -> dict:
-        if isinstance(source, dict):
-            target.update(source)
-        else:
-            target.update({"0": source})
-        return target
-
-    def next_subtree(tree: dict, next_char: str):
-        try:
-            subtree = tree[next_char]
-        except:
-            return
-        return assign({"": tree[""] + next_char}, subtree)
-
-    def new_chunk(remaining: str, current_cursor: int):
-        first_char = remaining[0]
-        return parse(
-            assign({"": first_char}, root.get(first_char)),
-            remaining[1:],
-            current_cursor,
-            current_cursor + 1,
+    """Splits `string` into the longest chunks found in the `mapping` tree, returning
+    a `(start, end, text)` tuple for each chunk. The input is consumed in a single
+    loop (no recursion), so conversion is linear in the length of `string`"""
+    chunks = []
+    length = len(string)
+    cursor = 0
+
+    while cursor < length:
+        last_cursor = cursor
+        char = string[cursor]
+        tree = mapping.get(char)
+        # unmapped characters are passed through as-is
+        text = char
+        cursor += 1
+
+        # descend as far as the tree allows
+        while True:
+            if isinstance(tree, dict):
+                # nodes without a value of their own keep the characters consumed so far
+                text = tree.get("", text)
+            elif tree is not None:
+                text = tree
+            if cursor == length or not isinstance(tree, dict):
+                break
+            subtree = tree.get(string[cursor])
+            if subtree is None:
+                break
+            text += string[cursor]
+            tree = subtree
+            cursor += 1
+
+        if cursor < length:
+            chunks.append((last_cursor, cursor, text))
+            continue
+
+        # nothing more to consume
+        is_leaf = isinstance(tree, str) or (
+            tree is not None and not any(key for key in tree)
         )
+        if convert_ending or is_leaf:
+            # don't leave an empty element at the end of the result
+            if text:
+                chunks.append((last_cursor, cursor, text))
+        else:
+            # if we don't want to convert the ending, because there are still
+            # possible continuations, return None as the final node value
+            chunks.append((last_cursor, cursor, None))
 
-    def parse(tree: dict, remaining: str, last_cursor: int, current_cursor: int):
-        if not remaining:
-            if convert_ending or len(tree.keys()) == 1:
-                # nothing more to consume, just commit the last chunk and return it
-                # so as not to have an empty element at the end of the result
-                return [(last_cursor, current_cursor, tree[""])] if tree[""] else []
-            # if we don't want to convert the ending, because there are still possible
-            # continuations, return None as the final node value
-            return [(last_cursor, current_cursor, None)]
-
-        if len(tree.keys()) == 1:
-            return [(last_cursor, current_cursor, tree[""])] + new_chunk(
-                remaining, current_cursor
-            )
-
-        subtree = next_subtree(tree, remaining[0])
-
-        if not subtree:
-            return [(last_cursor, current_cursor, tree[""])] + new_chunk(
-                remaining, current_cursor
-            )
-        # continue current branch
-        return parse(subtree, remaining[1:], last_cursor, current_cursor + 1)
-
-    return new_chunk(string, 0)
+    return chunks
 
 
 # transform the tree, so that for example hepburn_tree['ゔ']['ぁ'][''] == 'va'
@@ -94,17 +95,17 @@ def create_custom_mapping(custom_map: dict = None) -> Callable[[dict], dict]:
             subtree[""] = value
 
     def make_map(map: dict):
-        map_copy = map.copy()
-
         def transform_map(map_subtree, custom_subtree):
             if (not map_subtree) or isinstance(map_subtree, str):
                 return custom_subtree
-            new_subtree = map_subtree
+            # copy only the nodes on the custom paths, so that `map` (and any
+            # subtrees it shares between branches) is left untouched
+            new_subtree = map_subtree.copy()
             for char, subtree in custom_subtree.items():
                 new_subtree[char] = transform_map(map_subtree.get(char), subtree)
             return new_subtree
 
-        return transform_map(map_copy, custom_tree)
+        return transform_map(map, custom_tree)
 
     return make_map
 
@@ -114,6 +115,8 @@ def merge_custom_mapping(
 ) -> dict:
     if not custom_mapping:
         return map
+    if instrumentation.enabled:
+        instrumentation.record("merge")
     return (
         create_custom_mapping(custom_mapping)(map)
         if isinstance(custom_mapping, dict)
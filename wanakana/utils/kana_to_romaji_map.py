@@ -1,9 +1,17 @@
 from copy import deepcopy
+from threading import RLock
 from .kana_mapping import transform, get_subtree_of
+from .automaton import MappingAutomaton, compacted
+from . import instrumentation
+from .snapshot import load_snapshot
 from ..constants import ROMANISATIONS
 
 kana_to_hepburn_map = None
 kana_to_kunrei_map = None
+kana_to_romaji_automata = {}
+kana_vowels = None
+# held while the lazily built tables are built (see romaji_to_kana_map)
+_build_lock = RLock()
 BASIC_HEPBURN = {
     "あ": "a",
     "い": "i",
@@ -343,21 +351,75 @@ def create_kana_to_kunrei_map() -> dict:
 
 def get_kana_to_hepburn_tree() -> dict:
     global kana_to_hepburn_map
-    if not kana_to_hepburn_map:
-        kana_to_hepburn_map = create_kana_to_hepburn_map()
+    if kana_to_hepburn_map is None:
+        with _build_lock:
+            if kana_to_hepburn_map is None:
+                kana_to_hepburn_map = create_kana_to_hepburn_map()
     return deepcopy(kana_to_hepburn_map)
 
 
 def get_kana_to_kunrei_tree() -> dict:
     global kana_to_kunrei_map
-    if not kana_to_kunrei_map:
-        kana_to_kunrei_map = create_kana_to_kunrei_map()
+    if kana_to_kunrei_map is None:
+        with _build_lock:
+            if kana_to_kunrei_map is None:
+                kana_to_kunrei_map = create_kana_to_kunrei_map()
     return deepcopy(kana_to_kunrei_map)
 
 
+def create_kana_vowel_map() -> dict:
+    vowels = {}
+    for kana, subtree in get_kana_to_hepburn_tree().items():
+        romaji = subtree.get("") if isinstance(subtree, dict) else subtree
+        # ん and っ have no vowel to lengthen
+        if romaji and romaji[-1] in "aiueo":
+            vowels[kana] = romaji[-1]
+    return vowels
+
+
+def get_kana_vowels() -> dict:
+    """Returns the vowel that each kana ends with in Hepburn romaji (as used to
+    resolve long vowel marks), loading the table on first use"""
+    global kana_vowels
+    if kana_vowels is None:
+        with _build_lock:
+            if kana_vowels is None:
+                # only published once it's complete
+                vowels = load_snapshot(("kana_vowels",))
+                if vowels is None:
+                    vowels = create_kana_vowel_map()
+                kana_vowels = vowels
+    return kana_vowels
+
+
 def get_kana_to_romaji_tree(*, romanisation: str, **kwargs) -> dict:
     if romanisation == ROMANISATIONS["HEPBURN"]:
         return get_kana_to_hepburn_tree()
     if romanisation == ROMANISATIONS["KUNREI"]:
         return get_kana_to_kunrei_tree()
     return {}
+
+
+def get_kana_to_romaji_automaton(*, romanisation: str, **kwargs) -> MappingAutomaton:
+    """Returns the compiled kana to romaji mapping for `romanisation`, loading it from
+    the snapshot (or building it if there isn't one) on first use"""
+    if romanisation not in ROMANISATIONS.values():
+        # unknown romanisations don't convert anything (see get_kana_to_romaji_tree)
+        romanisation = None
+    automaton = kana_to_romaji_automata.get(romanisation)
+
+    if instrumentation.enabled:
+        instrumentation.record("cache_miss" if automaton is None else "cache_hit")
+    if automaton is None:
+        with _build_lock:
+            automaton = kana_to_romaji_automata.get(romanisation)
+            if automaton is None:
+                automaton = load_snapshot(("kana_to_romaji", romanisation))
+                if automaton is None:
+                    automaton = MappingAutomaton(
+                        get_kana_to_romaji_tree(romanisation=romanisation)
+                    )
+                automaton = compacted(automaton)
+                kana_to_romaji_automata[romanisation] = automaton
+
+    return automaton
@@ -0,0 +1,70 @@
+"""Another way of applying a compiled mapping: the automaton is turned into a single
+regular expression matching the longest chunk at each position, so the input is
+scanned by the `re` engine (in C) instead of one character at a time in Python.
+
+The expression mirrors the automaton state by state (`か(?:ゃ|ゅ)?` rather than a
+flat alternation of every key), which is the same longest match without trying each
+key in turn, and every path through the automaton is looked up in a table of the
+text `MappingAutomaton.apply` would produce for it. Only complete conversions are
+supported: when the ending mustn't be converted (`convert_ending=False`), the
+automaton has to be used"""
+import re
+from typing import List
+
+from .automaton import MappingAutomaton
+
+# matches nothing, for automata without any chunks
+NEVER = "(?!)"
+
+
+class RegexMapping:
+    """A `MappingAutomaton` compiled into a regular expression, converting strings
+    the same way as joining the texts of `automaton.apply(string, True)`"""
+
+    __slots__ = ("pattern", "table")
+
+    def __init__(self, automaton: MappingAutomaton):
+        transitions, values = automaton.tables()
+        table = {}
+
+        def add_state(state: int, path: str, text: str) -> str:
+            branches = []
+            # chunks that can't be continued, matched with one character class
+            leaves = []
+            for char, next_state in transitions[state].items():
+                # the automaton reads one character at a time, so longer keys are
+                # never reached
+                if len(char) != 1:
+                    continue
+                value = values[next_state]
+                if value is not None:
+                    next_text = value
+                elif path:
+                    next_text = text + char
+                else:
+                    next_text = char
+                table[path + char] = next_text
+                continuation = add_state(next_state, path + char, next_text)
+                if continuation:
+                    branches.append(f"{re.escape(char)}(?:{continuation})?")
+                else:
+                    leaves.append(re.escape(char))
+            if len(leaves) > 1:
+                branches.insert(0, f"[{''.join(leaves)}]")
+            else:
+                branches[:0] = leaves
+            return "|".join(branches)
+
+        self.pattern = re.compile(f"({add_state(0, '', '') or NEVER})")
+        self.table = table
+
+    def split(self, string: str) -> List[str]:
+        """Splits `string` into the text between chunks (at even indices, possibly
+        empty) and the chunks themselves (at odd indices, to be looked up in
+        `table`)"""
+        return self.pattern.split(string)
+
+    def convert(self, string: str) -> str:
+        parts = self.pattern.split(string)
+        parts[1::2] = map(self.table.__getitem__, parts[1::2])
+        return "".join(parts)
@@ -1,5 +1,9 @@
 from copy import deepcopy
+from threading import RLock
 from .kana_mapping import transform, get_subtree_of, create_custom_mapping
+from .automaton import MappingAutomaton, compacted
+from . import instrumentation
+from .snapshot import load_snapshot
 
 # NOTE: not exactly kunrei shiki, for example ぢゃ -> dya instead of zya
 # to avoid name clashing
@@ -215,16 +219,63 @@ def create_romaji_to_kana_map():
 
 
 romaji_to_kana_map = None
+# held while the lazily built tables are built, so that concurrent first uses build
+# each table once; the tables are only published once they are complete. It is
+# re-entrant because the automata are built from the tree
+_build_lock = RLock()
 
 
 def get_romaji_to_kana_tree():
+    """Returns the romaji to kana mapping tree, building it on first use. The tree is
+    shared, so it must not be modified (custom mappings copy what they change)"""
     global romaji_to_kana_map
 
-    if not romaji_to_kana_map:
-        romaji_to_kana_map = create_romaji_to_kana_map()
+    if romaji_to_kana_map is None:
+        with _build_lock:
+            if romaji_to_kana_map is None:
+                romaji_to_kana_map = create_romaji_to_kana_map()
 
     return romaji_to_kana_map
 
 
-USE_OBSOLETE_KANA_MAP = create_custom_mapping({"wi": "ゐ", "we": "ゑ"})
+romaji_to_kana_automata = {}
+
+
+def build_romaji_to_kana_automaton(
+    use_obsolete_kana: bool = False, IME_mode: bool = False
+) -> MappingAutomaton:
+    """Compiles the romaji to kana mapping from the mapping tree"""
+    map = get_romaji_to_kana_tree()
+    if IME_mode:
+        map = IME_MODE_MAP(map)
+    if use_obsolete_kana:
+        map = USE_OBSOLETE_KANA_MAP(map)
+    return MappingAutomaton(map)
+
+
+def get_romaji_to_kana_automaton(
+    use_obsolete_kana: bool = False, IME_mode: bool = False
+) -> MappingAutomaton:
+    """Returns the compiled romaji to kana mapping, loading it from the snapshot (or
+    building it if there isn't one) on first use"""
+    key = (bool(use_obsolete_kana), bool(IME_mode))
+    automaton = romaji_to_kana_automata.get(key)
 
+    if instrumentation.enabled:
+        instrumentation.record("cache_miss" if automaton is None else "cache_hit")
+    if automaton is None:
+        with _build_lock:
+            automaton = romaji_to_kana_automata.get(key)
+            if automaton is None:
+                automaton = load_snapshot(("romaji_to_kana", *key))
+                if automaton is None:
+                    automaton = build_romaji_to_kana_automaton(*key)
+                automaton = compacted(automaton)
+                romaji_to_kana_automata[key] = automaton
+
+    return automaton
+
+
+USE_OBSOLETE_KANA_MAP = create_custom_mapping({"wi": "ゐ", "we": "ゑ"})
+# while typing, a single n is only converted once the next character is known
+IME_MODE_MAP = create_custom_mapping({"nn": "ん", "n ": "ん"})
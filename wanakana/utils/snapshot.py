@@ -0,0 +1,20 @@
+"""Snapshots of the tables compiled from the built-in mappings, so the first
+conversion in a process doesn't have to build the mapping trees.
+
+The snapshots live in `snapshot_tables.py` as Python literals, generated by
+`python -m wanakana.utils.generate_snapshot`, and must be regenerated whenever the
+mappings change (`--check` tells you whether they're out of date). Each table is
+only built from its literals when it's first used"""
+from typing import Any
+
+
+def load_snapshot(key: tuple) -> Any:
+    """Returns the snapshot of the table for `key`, or None if there isn't one"""
+    try:
+        from .snapshot_tables import SNAPSHOTS
+    except ImportError:
+        return None
+    load = SNAPSHOTS.get(key)
+    if load is None:
+        return None
+    return load()
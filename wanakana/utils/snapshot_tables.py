@@ -0,0 +1,4017 @@
+# Generated by `python -m wanakana.utils.generate_snapshot`; do not edit
+from .automaton import MappingAutomaton
+
+
+def romaji_to_kana_false_false():
+    return MappingAutomaton.from_tables(
+        (
+            {
+                "a": 1, "i": 2, "u": 3, "e": 4, "o": 5, "k": 6, "s": 34, "t": 94,
+                "n": 154, "h": 167, "m": 191, "y": 215, "r": 227, "w": 251, "g": 275,
+                "z": 311, "d": 335, "b": 399, "p": 423, "v": 447, "q": 471, "f": 507,
+                ".": 543, ",": 544, ":": 545, "/": 546, "!": 547, "?": 548, "~": 549,
+                "-": 550, "‘": 551, "’": 552, "“": 553, "”": 554, "[": 555, "]": 556,
+                "(": 557, ")": 558, "{": 559, "}": 560, "x": 561, "c": 583, "j": 631,
+                "l": 655,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 7, "i": 8, "u": 9, "e": 10, "o": 11, "y": 12, "w": 18, "k": 20},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 13, "i": 14, "u": 15, "e": 16, "o": 17},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 19},
+            {},
+            {"a": 21, "i": 22, "u": 23, "e": 24, "o": 25, "y": 26, "w": 32},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 27, "i": 28, "u": 29, "e": 30, "o": 31},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 33},
+            {},
+            {
+                "a": 35, "i": 36, "u": 37, "e": 38, "o": 39, "y": 40, "w": 46, "h": 52,
+                "s": 64,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 41, "i": 42, "u": 43, "e": 44, "o": 45},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 47, "i": 48, "u": 49, "e": 50, "o": 51},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 53, "i": 54, "u": 55, "e": 56, "o": 57, "y": 58},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 59, "i": 60, "u": 61, "e": 62, "o": 63},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 65, "i": 66, "u": 67, "e": 68, "o": 69, "y": 70, "w": 76, "h": 82},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 71, "i": 72, "u": 73, "e": 74, "o": 75},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 77, "i": 78, "u": 79, "e": 80, "o": 81},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 83, "i": 84, "u": 85, "e": 86, "o": 87, "y": 88},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 89, "i": 90, "u": 91, "e": 92, "o": 93},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 95, "i": 96, "u": 97, "e": 98, "o": 99, "y": 100, "s": 106,
+                "h": 112, "w": 118, "t": 124,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 101, "i": 102, "u": 103, "e": 104, "o": 105},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 107, "i": 108, "u": 109, "e": 110, "o": 111},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 113, "i": 114, "u": 115, "e": 116, "o": 117},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 119, "i": 120, "u": 121, "e": 122, "o": 123},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 125, "i": 126, "u": 127, "e": 128, "o": 129, "y": 130, "s": 136,
+                "h": 142, "w": 148,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 131, "i": 132, "u": 133, "e": 134, "o": 135},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 137, "i": 138, "u": 139, "e": 140, "o": 141},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 143, "i": 144, "u": 145, "e": 146, "o": 147},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 149, "i": 150, "u": 151, "e": 152, "o": 153},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 155, "i": 156, "u": 157, "e": 158, "o": 159, "y": 160, "'": 166},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 161, "i": 162, "u": 163, "e": 164, "o": 165},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 168, "i": 169, "u": 170, "e": 171, "o": 172, "y": 173, "h": 179},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 174, "i": 175, "u": 176, "e": 177, "o": 178},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 180, "i": 181, "u": 182, "e": 183, "o": 184, "y": 185},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 186, "i": 187, "u": 188, "e": 189, "o": 190},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 192, "i": 193, "u": 194, "e": 195, "o": 196, "y": 197, "m": 203},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 198, "i": 199, "u": 200, "e": 201, "o": 202},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 204, "i": 205, "u": 206, "e": 207, "o": 208, "y": 209},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 210, "i": 211, "u": 212, "e": 213, "o": 214},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 216, "u": 217, "o": 218, "i": 219, "e": 220, "y": 221},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 222, "u": 223, "o": 224, "i": 225, "e": 226},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 228, "i": 229, "u": 230, "e": 231, "o": 232, "y": 233, "r": 239},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 234, "i": 235, "u": 236, "e": 237, "o": 238},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 240, "i": 241, "u": 242, "e": 243, "o": 244, "y": 245},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 246, "i": 247, "u": 248, "e": 249, "o": 250},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 252, "i": 253, "e": 254, "o": 255, "h": 256, "u": 262, "w": 263},
+            {},
+            {},
+            {},
+            {},
+            {"a": 257, "i": 258, "u": 259, "e": 260, "o": 261},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 264, "i": 265, "e": 266, "o": 267, "h": 268, "u": 274},
+            {},
+            {},
+            {},
+            {},
+            {"a": 269, "i": 270, "u": 271, "e": 272, "o": 273},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 276, "i": 277, "u": 278, "e": 279, "o": 280, "y": 281, "w": 287,
+                "g": 293,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 282, "i": 283, "u": 284, "e": 285, "o": 286},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 288, "i": 289, "u": 290, "e": 291, "o": 292},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 294, "i": 295, "u": 296, "e": 297, "o": 298, "y": 299, "w": 305},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 300, "i": 301, "u": 302, "e": 303, "o": 304},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 306, "i": 307, "u": 308, "e": 309, "o": 310},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 312, "i": 313, "u": 314, "e": 315, "o": 316, "y": 317, "z": 323},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 318, "i": 319, "u": 320, "e": 321, "o": 322},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 324, "i": 325, "u": 326, "e": 327, "o": 328, "y": 329},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 330, "i": 331, "u": 332, "e": 333, "o": 334},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 336, "i": 337, "u": 338, "e": 339, "o": 340, "y": 341, "h": 347,
+                "w": 353, "j": 359, "z": 365, "d": 367,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 342, "i": 343, "u": 344, "e": 345, "o": 346},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 348, "i": 349, "u": 350, "e": 351, "o": 352},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 354, "i": 355, "u": 356, "e": 357, "o": 358},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 360, "i": 361, "u": 362, "e": 363, "o": 364},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"u": 366},
+            {},
+            {
+                "a": 368, "i": 369, "u": 370, "e": 371, "o": 372, "y": 373, "h": 379,
+                "w": 385, "j": 391, "z": 397,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 374, "i": 375, "u": 376, "e": 377, "o": 378},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 380, "i": 381, "u": 382, "e": 383, "o": 384},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 386, "i": 387, "u": 388, "e": 389, "o": 390},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 392, "i": 393, "u": 394, "e": 395, "o": 396},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"u": 398},
+            {},
+            {"a": 400, "i": 401, "u": 402, "e": 403, "o": 404, "y": 405, "b": 411},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 406, "i": 407, "u": 408, "e": 409, "o": 410},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 412, "i": 413, "u": 414, "e": 415, "o": 416, "y": 417},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 418, "i": 419, "u": 420, "e": 421, "o": 422},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 424, "i": 425, "u": 426, "e": 427, "o": 428, "y": 429, "p": 435},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 430, "i": 431, "u": 432, "e": 433, "o": 434},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 436, "i": 437, "u": 438, "e": 439, "o": 440, "y": 441},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 442, "i": 443, "u": 444, "e": 445, "o": 446},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 448, "i": 449, "u": 450, "e": 451, "o": 452, "y": 453, "v": 459},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 454, "i": 455, "u": 456, "e": 457, "o": 458},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 460, "i": 461, "u": 462, "e": 463, "o": 464, "y": 465},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 466, "i": 467, "u": 468, "e": 469, "o": 470},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "y": 472, "w": 478, "a": 484, "i": 485, "u": 486, "e": 487, "o": 488,
+                "q": 489,
+            },
+            {"a": 473, "i": 474, "u": 475, "e": 476, "o": 477},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 479, "i": 480, "u": 481, "e": 482, "o": 483},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"y": 490, "w": 496, "a": 502, "i": 503, "u": 504, "e": 505, "o": 506},
+            {"a": 491, "i": 492, "u": 493, "e": 494, "o": 495},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 497, "i": 498, "u": 499, "e": 500, "o": 501},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "y": 508, "w": 514, "a": 520, "i": 521, "u": 522, "e": 523, "o": 524,
+                "f": 525,
+            },
+            {"a": 509, "i": 510, "u": 511, "e": 512, "o": 513},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 515, "i": 516, "u": 517, "e": 518, "o": 519},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"y": 526, "w": 532, "a": 538, "i": 539, "u": 540, "e": 541, "o": 542},
+            {"a": 527, "i": 528, "u": 529, "e": 530, "o": 531},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 533, "i": 534, "u": 535, "e": 536, "o": 537},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "n": 562, "t": 563, "w": 566, "k": 568, "c": 571, "a": 572, "i": 573,
+                "u": 574, "e": 575, "o": 576, "y": 577,
+            },
+            {},
+            {"u": 564, "s": 565},
+            {},
+            {"u": 564},
+            {"a": 567},
+            {},
+            {"a": 569, "e": 570},
+            {},
+            {},
+            {"a": 569, "e": 570},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 578, "i": 579, "u": 580, "e": 581, "o": 582},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 584, "i": 585, "u": 586, "e": 587, "o": 588, "y": 589, "h": 595,
+                "c": 607,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 590, "i": 591, "u": 592, "e": 593, "o": 594},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 596, "i": 597, "u": 598, "e": 599, "o": 600, "y": 601},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 602, "i": 603, "u": 604, "e": 605, "o": 606},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 608, "i": 609, "u": 610, "e": 611, "o": 612, "y": 613, "h": 619},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 614, "i": 615, "u": 616, "e": 617, "o": 618},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 620, "i": 621, "u": 622, "e": 623, "o": 624, "y": 625},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 626, "i": 627, "u": 628, "e": 629, "o": 630},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 632, "i": 633, "u": 634, "e": 635, "o": 636, "y": 637, "j": 643},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 638, "i": 639, "u": 640, "e": 641, "o": 642},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 644, "i": 645, "u": 646, "e": 647, "o": 648, "y": 649},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 650, "i": 651, "u": 652, "e": 653, "o": 654},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "t": 656, "w": 658, "k": 659, "c": 660, "a": 572, "i": 573, "u": 574,
+                "e": 575, "o": 576, "y": 661,
+            },
+            {"u": 564, "s": 657},
+            {"u": 564},
+            {"a": 567},
+            {"a": 569, "e": 570},
+            {"a": 569, "e": 570},
+            {"a": 578, "i": 579, "u": 580, "e": 581, "o": 582},
+        ),
+        (
+            None, "あ", "い", "う", "え", "お", None, "か", "き", "く", "け", "こ", None, "きゃ",
+            "きぃ", "きゅ", "きぇ", "きょ", None, "くぁ", None, "っか", "っき", "っく", "っけ", "っこ",
+            None, "っきゃ", "っきぃ", "っきゅ", "っきぇ", "っきょ", None, "っくぁ", None, "さ", "し", "す",
+            "せ", "そ", None, "しゃ", "しぃ", "しゅ", "しぇ", "しょ", None, "すぁ", "すぃ", "すぅ", "すぇ",
+            "すぉ", None, "しゃ", "し", "しゅ", "しぇ", "しょ", None, "しゃ", "しぃ", "しゅ", "しぇ",
+            "しょ", None, "っさ", "っし", "っす", "っせ", "っそ", None, "っしゃ", "っしぃ", "っしゅ", "っしぇ",
+            "っしょ", None, "っすぁ", "っすぃ", "っすぅ", "っすぇ", "っすぉ", None, "っしゃ", "っし", "っしゅ",
+            "っしぇ", "っしょ", None, "っしゃ", "っしぃ", "っしゅ", "っしぇ", "っしょ", None, "た", "ち", "つ",
+            "て", "と", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ", "ちょ", None, "つぁ", "つぃ", "つ", "つぇ",
+            "つぉ", None, "てゃ", "てぃ", "てゅ", "てぇ", "てょ", None, "とぁ", "とぃ", "とぅ", "とぇ",
+            "とぉ", None, "った", "っち", "っつ", "って", "っと", None, "っちゃ", "っちぃ", "っちゅ", "っちぇ",
+            "っちょ", None, "っつぁ", "っつぃ", "っつ", "っつぇ", "っつぉ", None, "ってゃ", "ってぃ", "ってゅ",
+            "ってぇ", "ってょ", None, "っとぁ", "っとぃ", "っとぅ", "っとぇ", "っとぉ", "ん", "な", "に", "ぬ",
+            "ね", "の", None, "にゃ", "にぃ", "にゅ", "にぇ", "にょ", "ん", None, "は", "ひ", "ふ",
+            "へ", "ほ", None, "ひゃ", "ひぃ", "ひゅ", "ひぇ", "ひょ", None, "っは", "っひ", "っふ", "っへ",
+            "っほ", None, "っひゃ", "っひぃ", "っひゅ", "っひぇ", "っひょ", None, "ま", "み", "む", "め",
+            "も", None, "みゃ", "みぃ", "みゅ", "みぇ", "みょ", None, "っま", "っみ", "っむ", "っめ",
+            "っも", None, "っみゃ", "っみぃ", "っみゅ", "っみぇ", "っみょ", None, "や", "ゆ", "よ", "い",
+            "いぇ", None, "っや", "っゆ", "っよ", "っい", "っいぇ", None, "ら", "り", "る", "れ", "ろ",
+            None, "りゃ", "りぃ", "りゅ", "りぇ", "りょ", None, "っら", "っり", "っる", "っれ", "っろ",
+            None, "っりゃ", "っりぃ", "っりゅ", "っりぇ", "っりょ", None, "わ", "うぃ", "うぇ", "を", None,
+            "うぁ", "うぃ", "う", "うぇ", "うぉ", "う", None, "っわ", "っうぃ", "っうぇ", "っを", None,
+            "っうぁ", "っうぃ", "っう", "っうぇ", "っうぉ", "っう", None, "が", "ぎ", "ぐ", "げ", "ご",
+            None, "ぎゃ", "ぎぃ", "ぎゅ", "ぎぇ", "ぎょ", None, "ぐぁ", "ぐぃ", "ぐぅ", "ぐぇ", "ぐぉ",
+            None, "っが", "っぎ", "っぐ", "っげ", "っご", None, "っぎゃ", "っぎぃ", "っぎゅ", "っぎぇ",
+            "っぎょ", None, "っぐぁ", "っぐぃ", "っぐぅ", "っぐぇ", "っぐぉ", None, "ざ", "じ", "ず", "ぜ",
+            "ぞ", None, "じゃ", "じぃ", "じゅ", "じぇ", "じょ", None, "っざ", "っじ", "っず", "っぜ",
+            "っぞ", None, "っじゃ", "っじぃ", "っじゅ", "っじぇ", "っじょ", None, "だ", "ぢ", "づ", "で",
+            "ど", None, "ぢゃ", "ぢぃ", "ぢゅ", "ぢぇ", "ぢょ", None, "でゃ", "でぃ", "でゅ", "でぇ",
+            "でょ", None, "どぁ", "どぃ", "どぅ", "どぇ", "どぉ", None, "ぢゃ", "ぢ", "ぢゅ", "ぢぇ",
+            "ぢょ", None, "づ", None, "っだ", "っぢ", "っづ", "っで", "っど", None, "っぢゃ", "っぢぃ",
+            "っぢゅ", "っぢぇ", "っぢょ", None, "っでゃ", "っでぃ", "っでゅ", "っでぇ", "っでょ", None, "っどぁ",
+            "っどぃ", "っどぅ", "っどぇ", "っどぉ", None, "っぢゃ", "っぢ", "っぢゅ", "っぢぇ", "っぢょ", None,
+            "っづ", None, "ば", "び", "ぶ", "べ", "ぼ", None, "びゃ", "びぃ", "びゅ", "びぇ", "びょ",
+            None, "っば", "っび", "っぶ", "っべ", "っぼ", None, "っびゃ", "っびぃ", "っびゅ", "っびぇ",
+            "っびょ", None, "ぱ", "ぴ", "ぷ", "ぺ", "ぽ", None, "ぴゃ", "ぴぃ", "ぴゅ", "ぴぇ", "ぴょ",
+            None, "っぱ", "っぴ", "っぷ", "っぺ", "っぽ", None, "っぴゃ", "っぴぃ", "っぴゅ", "っぴぇ",
+            "っぴょ", None, "ゔぁ", "ゔぃ", "ゔ", "ゔぇ", "ゔぉ", None, "ゔゃ", "ゔぃ", "ゔゅ", "ゔぇ",
+            "ゔょ", None, "っゔぁ", "っゔぃ", "っゔ", "っゔぇ", "っゔぉ", None, "っゔゃ", "っゔぃ", "っゔゅ",
+            "っゔぇ", "っゔょ", None, None, "くゃ", "くぃ", "くゅ", "くぇ", "くょ", None, "くぁ", "くぃ",
+            "くぅ", "くぇ", "くぉ", "くぁ", "くぃ", "くぅ", "くぇ", "くぉ", None, None, "っくゃ", "っくぃ",
+            "っくゅ", "っくぇ", "っくょ", None, "っくぁ", "っくぃ", "っくぅ", "っくぇ", "っくぉ", "っくぁ", "っくぃ",
+            "っくぅ", "っくぇ", "っくぉ", None, None, "ふゃ", "ふぃ", "ふゅ", "ふぇ", "ふょ", None, "ふぁ",
+            "ふぃ", "ふぅ", "ふぇ", "ふぉ", "ふぁ", "ふぃ", "ふ", "ふぇ", "ふぉ", None, None, "っふゃ",
+            "っふぃ", "っふゅ", "っふぇ", "っふょ", None, "っふぁ", "っふぃ", "っふぅ", "っふぇ", "っふぉ", "っふぁ",
+            "っふぃ", "っふ", "っふぇ", "っふぉ", "。", "、", "：", "・", "！", "？", "〜", "ー", "「",
+            "」", "『", "』", "［", "］", "（", "）", "｛", "｝", None, "ん", None, "っ", None,
+            None, "ゎ", None, "ヵ", "ヶ", None, "ぁ", "ぃ", "ぅ", "ぇ", "ぉ", None, "ゃ", "ぃ",
+            "ゅ", "ぇ", "ょ", None, "か", "き", "く", "け", "こ", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ",
+            "ちょ", None, "ちゃ", "ち", "ちゅ", "ちぇ", "ちょ", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ",
+            "ちょ", None, "っか", "っき", "っく", "っけ", "っこ", None, "っちゃ", "っちぃ", "っちゅ", "っちぇ",
+            "っちょ", None, "っちゃ", "っち", "っちゅ", "っちぇ", "っちょ", None, "っちゃ", "っちぃ", "っちゅ",
+            "っちぇ", "っちょ", None, "じゃ", "じ", "じゅ", "じぇ", "じょ", None, "じゃ", "じぃ", "じゅ",
+            "じぇ", "じょ", None, "っじゃ", "っじ", "っじゅ", "っじぇ", "っじょ", None, "っじゃ", "っじぃ",
+            "っじゅ", "っじぇ", "っじょ", None, None, None, None, None, None, None,
+        ),
+    )
+
+
+def romaji_to_kana_false_true():
+    return MappingAutomaton.from_tables(
+        (
+            {
+                "a": 1, "i": 2, "u": 3, "e": 4, "o": 5, "k": 6, "s": 34, "t": 94,
+                "n": 154, "h": 169, "m": 193, "y": 217, "r": 229, "w": 253, "g": 277,
+                "z": 313, "d": 337, "b": 401, "p": 425, "v": 449, "q": 473, "f": 509,
+                ".": 545, ",": 546, ":": 547, "/": 548, "!": 549, "?": 550, "~": 551,
+                "-": 552, "‘": 553, "’": 554, "“": 555, "”": 556, "[": 557, "]": 558,
+                "(": 559, ")": 560, "{": 561, "}": 562, "x": 563, "c": 585, "j": 633,
+                "l": 657,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 7, "i": 8, "u": 9, "e": 10, "o": 11, "y": 12, "w": 18, "k": 20},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 13, "i": 14, "u": 15, "e": 16, "o": 17},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 19},
+            {},
+            {"a": 21, "i": 22, "u": 23, "e": 24, "o": 25, "y": 26, "w": 32},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 27, "i": 28, "u": 29, "e": 30, "o": 31},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 33},
+            {},
+            {
+                "a": 35, "i": 36, "u": 37, "e": 38, "o": 39, "y": 40, "w": 46, "h": 52,
+                "s": 64,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 41, "i": 42, "u": 43, "e": 44, "o": 45},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 47, "i": 48, "u": 49, "e": 50, "o": 51},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 53, "i": 54, "u": 55, "e": 56, "o": 57, "y": 58},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 59, "i": 60, "u": 61, "e": 62, "o": 63},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 65, "i": 66, "u": 67, "e": 68, "o": 69, "y": 70, "w": 76, "h": 82},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 71, "i": 72, "u": 73, "e": 74, "o": 75},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 77, "i": 78, "u": 79, "e": 80, "o": 81},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 83, "i": 84, "u": 85, "e": 86, "o": 87, "y": 88},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 89, "i": 90, "u": 91, "e": 92, "o": 93},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 95, "i": 96, "u": 97, "e": 98, "o": 99, "y": 100, "s": 106,
+                "h": 112, "w": 118, "t": 124,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 101, "i": 102, "u": 103, "e": 104, "o": 105},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 107, "i": 108, "u": 109, "e": 110, "o": 111},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 113, "i": 114, "u": 115, "e": 116, "o": 117},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 119, "i": 120, "u": 121, "e": 122, "o": 123},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 125, "i": 126, "u": 127, "e": 128, "o": 129, "y": 130, "s": 136,
+                "h": 142, "w": 148,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 131, "i": 132, "u": 133, "e": 134, "o": 135},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 137, "i": 138, "u": 139, "e": 140, "o": 141},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 143, "i": 144, "u": 145, "e": 146, "o": 147},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 149, "i": 150, "u": 151, "e": 152, "o": 153},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 155, "i": 156, "u": 157, "e": 158, "o": 159, "y": 160, "'": 166,
+                "n": 167, " ": 168,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 161, "i": 162, "u": 163, "e": 164, "o": 165},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 170, "i": 171, "u": 172, "e": 173, "o": 174, "y": 175, "h": 181},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 176, "i": 177, "u": 178, "e": 179, "o": 180},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 182, "i": 183, "u": 184, "e": 185, "o": 186, "y": 187},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 188, "i": 189, "u": 190, "e": 191, "o": 192},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 194, "i": 195, "u": 196, "e": 197, "o": 198, "y": 199, "m": 205},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 200, "i": 201, "u": 202, "e": 203, "o": 204},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 206, "i": 207, "u": 208, "e": 209, "o": 210, "y": 211},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 212, "i": 213, "u": 214, "e": 215, "o": 216},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 218, "u": 219, "o": 220, "i": 221, "e": 222, "y": 223},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 224, "u": 225, "o": 226, "i": 227, "e": 228},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 230, "i": 231, "u": 232, "e": 233, "o": 234, "y": 235, "r": 241},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 236, "i": 237, "u": 238, "e": 239, "o": 240},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 242, "i": 243, "u": 244, "e": 245, "o": 246, "y": 247},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 248, "i": 249, "u": 250, "e": 251, "o": 252},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 254, "i": 255, "e": 256, "o": 257, "h": 258, "u": 264, "w": 265},
+            {},
+            {},
+            {},
+            {},
+            {"a": 259, "i": 260, "u": 261, "e": 262, "o": 263},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 266, "i": 267, "e": 268, "o": 269, "h": 270, "u": 276},
+            {},
+            {},
+            {},
+            {},
+            {"a": 271, "i": 272, "u": 273, "e": 274, "o": 275},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 278, "i": 279, "u": 280, "e": 281, "o": 282, "y": 283, "w": 289,
+                "g": 295,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 284, "i": 285, "u": 286, "e": 287, "o": 288},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 290, "i": 291, "u": 292, "e": 293, "o": 294},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 296, "i": 297, "u": 298, "e": 299, "o": 300, "y": 301, "w": 307},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 302, "i": 303, "u": 304, "e": 305, "o": 306},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 308, "i": 309, "u": 310, "e": 311, "o": 312},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 314, "i": 315, "u": 316, "e": 317, "o": 318, "y": 319, "z": 325},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 320, "i": 321, "u": 322, "e": 323, "o": 324},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 326, "i": 327, "u": 328, "e": 329, "o": 330, "y": 331},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 332, "i": 333, "u": 334, "e": 335, "o": 336},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 338, "i": 339, "u": 340, "e": 341, "o": 342, "y": 343, "h": 349,
+                "w": 355, "j": 361, "z": 367, "d": 369,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 344, "i": 345, "u": 346, "e": 347, "o": 348},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 350, "i": 351, "u": 352, "e": 353, "o": 354},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 356, "i": 357, "u": 358, "e": 359, "o": 360},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 362, "i": 363, "u": 364, "e": 365, "o": 366},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"u": 368},
+            {},
+            {
+                "a": 370, "i": 371, "u": 372, "e": 373, "o": 374, "y": 375, "h": 381,
+                "w": 387, "j": 393, "z": 399,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 376, "i": 377, "u": 378, "e": 379, "o": 380},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 382, "i": 383, "u": 384, "e": 385, "o": 386},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 388, "i": 389, "u": 390, "e": 391, "o": 392},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 394, "i": 395, "u": 396, "e": 397, "o": 398},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"u": 400},
+            {},
+            {"a": 402, "i": 403, "u": 404, "e": 405, "o": 406, "y": 407, "b": 413},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 408, "i": 409, "u": 410, "e": 411, "o": 412},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 414, "i": 415, "u": 416, "e": 417, "o": 418, "y": 419},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 420, "i": 421, "u": 422, "e": 423, "o": 424},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 426, "i": 427, "u": 428, "e": 429, "o": 430, "y": 431, "p": 437},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 432, "i": 433, "u": 434, "e": 435, "o": 436},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 438, "i": 439, "u": 440, "e": 441, "o": 442, "y": 443},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 444, "i": 445, "u": 446, "e": 447, "o": 448},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 450, "i": 451, "u": 452, "e": 453, "o": 454, "y": 455, "v": 461},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 456, "i": 457, "u": 458, "e": 459, "o": 460},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 462, "i": 463, "u": 464, "e": 465, "o": 466, "y": 467},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 468, "i": 469, "u": 470, "e": 471, "o": 472},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "y": 474, "w": 480, "a": 486, "i": 487, "u": 488, "e": 489, "o": 490,
+                "q": 491,
+            },
+            {"a": 475, "i": 476, "u": 477, "e": 478, "o": 479},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 481, "i": 482, "u": 483, "e": 484, "o": 485},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"y": 492, "w": 498, "a": 504, "i": 505, "u": 506, "e": 507, "o": 508},
+            {"a": 493, "i": 494, "u": 495, "e": 496, "o": 497},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 499, "i": 500, "u": 501, "e": 502, "o": 503},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "y": 510, "w": 516, "a": 522, "i": 523, "u": 524, "e": 525, "o": 526,
+                "f": 527,
+            },
+            {"a": 511, "i": 512, "u": 513, "e": 514, "o": 515},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 517, "i": 518, "u": 519, "e": 520, "o": 521},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"y": 528, "w": 534, "a": 540, "i": 541, "u": 542, "e": 543, "o": 544},
+            {"a": 529, "i": 530, "u": 531, "e": 532, "o": 533},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 535, "i": 536, "u": 537, "e": 538, "o": 539},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "n": 564, "t": 565, "w": 568, "k": 570, "c": 573, "a": 574, "i": 575,
+                "u": 576, "e": 577, "o": 578, "y": 579,
+            },
+            {},
+            {"u": 566, "s": 567},
+            {},
+            {"u": 566},
+            {"a": 569},
+            {},
+            {"a": 571, "e": 572},
+            {},
+            {},
+            {"a": 571, "e": 572},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 580, "i": 581, "u": 582, "e": 583, "o": 584},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 586, "i": 587, "u": 588, "e": 589, "o": 590, "y": 591, "h": 597,
+                "c": 609,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 592, "i": 593, "u": 594, "e": 595, "o": 596},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 598, "i": 599, "u": 600, "e": 601, "o": 602, "y": 603},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 604, "i": 605, "u": 606, "e": 607, "o": 608},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 610, "i": 611, "u": 612, "e": 613, "o": 614, "y": 615, "h": 621},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 616, "i": 617, "u": 618, "e": 619, "o": 620},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 622, "i": 623, "u": 624, "e": 625, "o": 626, "y": 627},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 628, "i": 629, "u": 630, "e": 631, "o": 632},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 634, "i": 635, "u": 636, "e": 637, "o": 638, "y": 639, "j": 645},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 640, "i": 641, "u": 642, "e": 643, "o": 644},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 646, "i": 647, "u": 648, "e": 649, "o": 650, "y": 651},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 652, "i": 653, "u": 654, "e": 655, "o": 656},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "t": 658, "w": 660, "k": 661, "c": 662, "a": 574, "i": 575, "u": 576,
+                "e": 577, "o": 578, "y": 663,
+            },
+            {"u": 566, "s": 659},
+            {"u": 566},
+            {"a": 569},
+            {"a": 571, "e": 572},
+            {"a": 571, "e": 572},
+            {"a": 580, "i": 581, "u": 582, "e": 583, "o": 584},
+        ),
+        (
+            None, "あ", "い", "う", "え", "お", None, "か", "き", "く", "け", "こ", None, "きゃ",
+            "きぃ", "きゅ", "きぇ", "きょ", None, "くぁ", None, "っか", "っき", "っく", "っけ", "っこ",
+            None, "っきゃ", "っきぃ", "っきゅ", "っきぇ", "っきょ", None, "っくぁ", None, "さ", "し", "す",
+            "せ", "そ", None, "しゃ", "しぃ", "しゅ", "しぇ", "しょ", None, "すぁ", "すぃ", "すぅ", "すぇ",
+            "すぉ", None, "しゃ", "し", "しゅ", "しぇ", "しょ", None, "しゃ", "しぃ", "しゅ", "しぇ",
+            "しょ", None, "っさ", "っし", "っす", "っせ", "っそ", None, "っしゃ", "っしぃ", "っしゅ", "っしぇ",
+            "っしょ", None, "っすぁ", "っすぃ", "っすぅ", "っすぇ", "っすぉ", None, "っしゃ", "っし", "っしゅ",
+            "っしぇ", "っしょ", None, "っしゃ", "っしぃ", "っしゅ", "っしぇ", "っしょ", None, "た", "ち", "つ",
+            "て", "と", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ", "ちょ", None, "つぁ", "つぃ", "つ", "つぇ",
+            "つぉ", None, "てゃ", "てぃ", "てゅ", "てぇ", "てょ", None, "とぁ", "とぃ", "とぅ", "とぇ",
+            "とぉ", None, "った", "っち", "っつ", "って", "っと", None, "っちゃ", "っちぃ", "っちゅ", "っちぇ",
+            "っちょ", None, "っつぁ", "っつぃ", "っつ", "っつぇ", "っつぉ", None, "ってゃ", "ってぃ", "ってゅ",
+            "ってぇ", "ってょ", None, "っとぁ", "っとぃ", "っとぅ", "っとぇ", "っとぉ", "ん", "な", "に", "ぬ",
+            "ね", "の", None, "にゃ", "にぃ", "にゅ", "にぇ", "にょ", "ん", "ん", "ん", None, "は",
+            "ひ", "ふ", "へ", "ほ", None, "ひゃ", "ひぃ", "ひゅ", "ひぇ", "ひょ", None, "っは", "っひ",
+            "っふ", "っへ", "っほ", None, "っひゃ", "っひぃ", "っひゅ", "っひぇ", "っひょ", None, "ま", "み",
+            "む", "め", "も", None, "みゃ", "みぃ", "みゅ", "みぇ", "みょ", None, "っま", "っみ", "っむ",
+            "っめ", "っも", None, "っみゃ", "っみぃ", "っみゅ", "っみぇ", "っみょ", None, "や", "ゆ", "よ",
+            "い", "いぇ", None, "っや", "っゆ", "っよ", "っい", "っいぇ", None, "ら", "り", "る", "れ",
+            "ろ", None, "りゃ", "りぃ", "りゅ", "りぇ", "りょ", None, "っら", "っり", "っる", "っれ",
+            "っろ", None, "っりゃ", "っりぃ", "っりゅ", "っりぇ", "っりょ", None, "わ", "うぃ", "うぇ", "を",
+            None, "うぁ", "うぃ", "う", "うぇ", "うぉ", "う", None, "っわ", "っうぃ", "っうぇ", "っを",
+            None, "っうぁ", "っうぃ", "っう", "っうぇ", "っうぉ", "っう", None, "が", "ぎ", "ぐ", "げ",
+            "ご", None, "ぎゃ", "ぎぃ", "ぎゅ", "ぎぇ", "ぎょ", None, "ぐぁ", "ぐぃ", "ぐぅ", "ぐぇ",
+            "ぐぉ", None, "っが", "っぎ", "っぐ", "っげ", "っご", None, "っぎゃ", "っぎぃ", "っぎゅ", "っぎぇ",
+            "っぎょ", None, "っぐぁ", "っぐぃ", "っぐぅ", "っぐぇ", "っぐぉ", None, "ざ", "じ", "ず", "ぜ",
+            "ぞ", None, "じゃ", "じぃ", "じゅ", "じぇ", "じょ", None, "っざ", "っじ", "っず", "っぜ",
+            "っぞ", None, "っじゃ", "っじぃ", "っじゅ", "っじぇ", "っじょ", None, "だ", "ぢ", "づ", "で",
+            "ど", None, "ぢゃ", "ぢぃ", "ぢゅ", "ぢぇ", "ぢょ", None, "でゃ", "でぃ", "でゅ", "でぇ",
+            "でょ", None, "どぁ", "どぃ", "どぅ", "どぇ", "どぉ", None, "ぢゃ", "ぢ", "ぢゅ", "ぢぇ",
+            "ぢょ", None, "づ", None, "っだ", "っぢ", "っづ", "っで", "っど", None, "っぢゃ", "っぢぃ",
+            "っぢゅ", "っぢぇ", "っぢょ", None, "っでゃ", "っでぃ", "っでゅ", "っでぇ", "っでょ", None, "っどぁ",
+            "っどぃ", "っどぅ", "っどぇ", "っどぉ", None, "っぢゃ", "っぢ", "っぢゅ", "っぢぇ", "っぢょ", None,
+            "っづ", None, "ば", "び", "ぶ", "べ", "ぼ", None, "びゃ", "びぃ", "びゅ", "びぇ", "びょ",
+            None, "っば", "っび", "っぶ", "っべ", "っぼ", None, "っびゃ", "っびぃ", "っびゅ", "っびぇ",
+            "っびょ", None, "ぱ", "ぴ", "ぷ", "ぺ", "ぽ", None, "ぴゃ", "ぴぃ", "ぴゅ", "ぴぇ", "ぴょ",
+            None, "っぱ", "っぴ", "っぷ", "っぺ", "っぽ", None, "っぴゃ", "っぴぃ", "っぴゅ", "っぴぇ",
+            "っぴょ", None, "ゔぁ", "ゔぃ", "ゔ", "ゔぇ", "ゔぉ", None, "ゔゃ", "ゔぃ", "ゔゅ", "ゔぇ",
+            "ゔょ", None, "っゔぁ", "っゔぃ", "っゔ", "っゔぇ", "っゔぉ", None, "っゔゃ", "っゔぃ", "っゔゅ",
+            "っゔぇ", "っゔょ", None, None, "くゃ", "くぃ", "くゅ", "くぇ", "くょ", None, "くぁ", "くぃ",
+            "くぅ", "くぇ", "くぉ", "くぁ", "くぃ", "くぅ", "くぇ", "くぉ", None, None, "っくゃ", "っくぃ",
+            "っくゅ", "っくぇ", "っくょ", None, "っくぁ", "っくぃ", "っくぅ", "っくぇ", "っくぉ", "っくぁ", "っくぃ",
+            "っくぅ", "っくぇ", "っくぉ", None, None, "ふゃ", "ふぃ", "ふゅ", "ふぇ", "ふょ", None, "ふぁ",
+            "ふぃ", "ふぅ", "ふぇ", "ふぉ", "ふぁ", "ふぃ", "ふ", "ふぇ", "ふぉ", None, None, "っふゃ",
+            "っふぃ", "っふゅ", "っふぇ", "っふょ", None, "っふぁ", "っふぃ", "っふぅ", "っふぇ", "っふぉ", "っふぁ",
+            "っふぃ", "っふ", "っふぇ", "っふぉ", "。", "、", "：", "・", "！", "？", "〜", "ー", "「",
+            "」", "『", "』", "［", "］", "（", "）", "｛", "｝", None, "ん", None, "っ", None,
+            None, "ゎ", None, "ヵ", "ヶ", None, "ぁ", "ぃ", "ぅ", "ぇ", "ぉ", None, "ゃ", "ぃ",
+            "ゅ", "ぇ", "ょ", None, "か", "き", "く", "け", "こ", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ",
+            "ちょ", None, "ちゃ", "ち", "ちゅ", "ちぇ", "ちょ", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ",
+            "ちょ", None, "っか", "っき", "っく", "っけ", "っこ", None, "っちゃ", "っちぃ", "っちゅ", "っちぇ",
+            "っちょ", None, "っちゃ", "っち", "っちゅ", "っちぇ", "っちょ", None, "っちゃ", "っちぃ", "っちゅ",
+            "っちぇ", "っちょ", None, "じゃ", "じ", "じゅ", "じぇ", "じょ", None, "じゃ", "じぃ", "じゅ",
+            "じぇ", "じょ", None, "っじゃ", "っじ", "っじゅ", "っじぇ", "っじょ", None, "っじゃ", "っじぃ",
+            "っじゅ", "っじぇ", "っじょ", None, None, None, None, None, None, None,
+        ),
+    )
+
+
+def romaji_to_kana_true_false():
+    return MappingAutomaton.from_tables(
+        (
+            {
+                "a": 1, "i": 2, "u": 3, "e": 4, "o": 5, "k": 6, "s": 34, "t": 94,
+                "n": 154, "h": 167, "m": 191, "y": 215, "r": 227, "w": 251, "g": 275,
+                "z": 311, "d": 335, "b": 399, "p": 423, "v": 447, "q": 471, "f": 507,
+                ".": 543, ",": 544, ":": 545, "/": 546, "!": 547, "?": 548, "~": 549,
+                "-": 550, "‘": 551, "’": 552, "“": 553, "”": 554, "[": 555, "]": 556,
+                "(": 557, ")": 558, "{": 559, "}": 560, "x": 561, "c": 583, "j": 631,
+                "l": 655,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 7, "i": 8, "u": 9, "e": 10, "o": 11, "y": 12, "w": 18, "k": 20},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 13, "i": 14, "u": 15, "e": 16, "o": 17},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 19},
+            {},
+            {"a": 21, "i": 22, "u": 23, "e": 24, "o": 25, "y": 26, "w": 32},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 27, "i": 28, "u": 29, "e": 30, "o": 31},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 33},
+            {},
+            {
+                "a": 35, "i": 36, "u": 37, "e": 38, "o": 39, "y": 40, "w": 46, "h": 52,
+                "s": 64,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 41, "i": 42, "u": 43, "e": 44, "o": 45},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 47, "i": 48, "u": 49, "e": 50, "o": 51},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 53, "i": 54, "u": 55, "e": 56, "o": 57, "y": 58},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 59, "i": 60, "u": 61, "e": 62, "o": 63},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 65, "i": 66, "u": 67, "e": 68, "o": 69, "y": 70, "w": 76, "h": 82},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 71, "i": 72, "u": 73, "e": 74, "o": 75},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 77, "i": 78, "u": 79, "e": 80, "o": 81},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 83, "i": 84, "u": 85, "e": 86, "o": 87, "y": 88},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 89, "i": 90, "u": 91, "e": 92, "o": 93},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 95, "i": 96, "u": 97, "e": 98, "o": 99, "y": 100, "s": 106,
+                "h": 112, "w": 118, "t": 124,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 101, "i": 102, "u": 103, "e": 104, "o": 105},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 107, "i": 108, "u": 109, "e": 110, "o": 111},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 113, "i": 114, "u": 115, "e": 116, "o": 117},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 119, "i": 120, "u": 121, "e": 122, "o": 123},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 125, "i": 126, "u": 127, "e": 128, "o": 129, "y": 130, "s": 136,
+                "h": 142, "w": 148,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 131, "i": 132, "u": 133, "e": 134, "o": 135},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 137, "i": 138, "u": 139, "e": 140, "o": 141},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 143, "i": 144, "u": 145, "e": 146, "o": 147},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 149, "i": 150, "u": 151, "e": 152, "o": 153},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 155, "i": 156, "u": 157, "e": 158, "o": 159, "y": 160, "'": 166},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 161, "i": 162, "u": 163, "e": 164, "o": 165},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 168, "i": 169, "u": 170, "e": 171, "o": 172, "y": 173, "h": 179},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 174, "i": 175, "u": 176, "e": 177, "o": 178},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 180, "i": 181, "u": 182, "e": 183, "o": 184, "y": 185},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 186, "i": 187, "u": 188, "e": 189, "o": 190},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 192, "i": 193, "u": 194, "e": 195, "o": 196, "y": 197, "m": 203},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 198, "i": 199, "u": 200, "e": 201, "o": 202},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 204, "i": 205, "u": 206, "e": 207, "o": 208, "y": 209},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 210, "i": 211, "u": 212, "e": 213, "o": 214},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 216, "u": 217, "o": 218, "i": 219, "e": 220, "y": 221},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 222, "u": 223, "o": 224, "i": 225, "e": 226},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 228, "i": 229, "u": 230, "e": 231, "o": 232, "y": 233, "r": 239},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 234, "i": 235, "u": 236, "e": 237, "o": 238},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 240, "i": 241, "u": 242, "e": 243, "o": 244, "y": 245},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 246, "i": 247, "u": 248, "e": 249, "o": 250},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 252, "i": 253, "e": 254, "o": 255, "h": 256, "u": 262, "w": 263},
+            {},
+            {},
+            {},
+            {},
+            {"a": 257, "i": 258, "u": 259, "e": 260, "o": 261},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 264, "i": 265, "e": 266, "o": 267, "h": 268, "u": 274},
+            {},
+            {},
+            {},
+            {},
+            {"a": 269, "i": 270, "u": 271, "e": 272, "o": 273},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 276, "i": 277, "u": 278, "e": 279, "o": 280, "y": 281, "w": 287,
+                "g": 293,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 282, "i": 283, "u": 284, "e": 285, "o": 286},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 288, "i": 289, "u": 290, "e": 291, "o": 292},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 294, "i": 295, "u": 296, "e": 297, "o": 298, "y": 299, "w": 305},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 300, "i": 301, "u": 302, "e": 303, "o": 304},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 306, "i": 307, "u": 308, "e": 309, "o": 310},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 312, "i": 313, "u": 314, "e": 315, "o": 316, "y": 317, "z": 323},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 318, "i": 319, "u": 320, "e": 321, "o": 322},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 324, "i": 325, "u": 326, "e": 327, "o": 328, "y": 329},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 330, "i": 331, "u": 332, "e": 333, "o": 334},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 336, "i": 337, "u": 338, "e": 339, "o": 340, "y": 341, "h": 347,
+                "w": 353, "j": 359, "z": 365, "d": 367,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 342, "i": 343, "u": 344, "e": 345, "o": 346},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 348, "i": 349, "u": 350, "e": 351, "o": 352},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 354, "i": 355, "u": 356, "e": 357, "o": 358},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 360, "i": 361, "u": 362, "e": 363, "o": 364},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"u": 366},
+            {},
+            {
+                "a": 368, "i": 369, "u": 370, "e": 371, "o": 372, "y": 373, "h": 379,
+                "w": 385, "j": 391, "z": 397,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 374, "i": 375, "u": 376, "e": 377, "o": 378},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 380, "i": 381, "u": 382, "e": 383, "o": 384},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 386, "i": 387, "u": 388, "e": 389, "o": 390},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 392, "i": 393, "u": 394, "e": 395, "o": 396},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"u": 398},
+            {},
+            {"a": 400, "i": 401, "u": 402, "e": 403, "o": 404, "y": 405, "b": 411},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 406, "i": 407, "u": 408, "e": 409, "o": 410},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 412, "i": 413, "u": 414, "e": 415, "o": 416, "y": 417},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 418, "i": 419, "u": 420, "e": 421, "o": 422},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 424, "i": 425, "u": 426, "e": 427, "o": 428, "y": 429, "p": 435},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 430, "i": 431, "u": 432, "e": 433, "o": 434},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 436, "i": 437, "u": 438, "e": 439, "o": 440, "y": 441},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 442, "i": 443, "u": 444, "e": 445, "o": 446},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 448, "i": 449, "u": 450, "e": 451, "o": 452, "y": 453, "v": 459},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 454, "i": 455, "u": 456, "e": 457, "o": 458},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 460, "i": 461, "u": 462, "e": 463, "o": 464, "y": 465},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 466, "i": 467, "u": 468, "e": 469, "o": 470},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "y": 472, "w": 478, "a": 484, "i": 485, "u": 486, "e": 487, "o": 488,
+                "q": 489,
+            },
+            {"a": 473, "i": 474, "u": 475, "e": 476, "o": 477},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 479, "i": 480, "u": 481, "e": 482, "o": 483},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"y": 490, "w": 496, "a": 502, "i": 503, "u": 504, "e": 505, "o": 506},
+            {"a": 491, "i": 492, "u": 493, "e": 494, "o": 495},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 497, "i": 498, "u": 499, "e": 500, "o": 501},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "y": 508, "w": 514, "a": 520, "i": 521, "u": 522, "e": 523, "o": 524,
+                "f": 525,
+            },
+            {"a": 509, "i": 510, "u": 511, "e": 512, "o": 513},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 515, "i": 516, "u": 517, "e": 518, "o": 519},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"y": 526, "w": 532, "a": 538, "i": 539, "u": 540, "e": 541, "o": 542},
+            {"a": 527, "i": 528, "u": 529, "e": 530, "o": 531},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 533, "i": 534, "u": 535, "e": 536, "o": 537},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "n": 562, "t": 563, "w": 566, "k": 568, "c": 571, "a": 572, "i": 573,
+                "u": 574, "e": 575, "o": 576, "y": 577,
+            },
+            {},
+            {"u": 564, "s": 565},
+            {},
+            {"u": 564},
+            {"a": 567},
+            {},
+            {"a": 569, "e": 570},
+            {},
+            {},
+            {"a": 569, "e": 570},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 578, "i": 579, "u": 580, "e": 581, "o": 582},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 584, "i": 585, "u": 586, "e": 587, "o": 588, "y": 589, "h": 595,
+                "c": 607,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 590, "i": 591, "u": 592, "e": 593, "o": 594},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 596, "i": 597, "u": 598, "e": 599, "o": 600, "y": 601},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 602, "i": 603, "u": 604, "e": 605, "o": 606},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 608, "i": 609, "u": 610, "e": 611, "o": 612, "y": 613, "h": 619},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 614, "i": 615, "u": 616, "e": 617, "o": 618},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 620, "i": 621, "u": 622, "e": 623, "o": 624, "y": 625},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 626, "i": 627, "u": 628, "e": 629, "o": 630},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 632, "i": 633, "u": 634, "e": 635, "o": 636, "y": 637, "j": 643},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 638, "i": 639, "u": 640, "e": 641, "o": 642},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 644, "i": 645, "u": 646, "e": 647, "o": 648, "y": 649},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 650, "i": 651, "u": 652, "e": 653, "o": 654},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "t": 656, "w": 658, "k": 659, "c": 660, "a": 572, "i": 573, "u": 574,
+                "e": 575, "o": 576, "y": 661,
+            },
+            {"u": 564, "s": 657},
+            {"u": 564},
+            {"a": 567},
+            {"a": 569, "e": 570},
+            {"a": 569, "e": 570},
+            {"a": 578, "i": 579, "u": 580, "e": 581, "o": 582},
+        ),
+        (
+            None, "あ", "い", "う", "え", "お", None, "か", "き", "く", "け", "こ", None, "きゃ",
+            "きぃ", "きゅ", "きぇ", "きょ", None, "くぁ", None, "っか", "っき", "っく", "っけ", "っこ",
+            None, "っきゃ", "っきぃ", "っきゅ", "っきぇ", "っきょ", None, "っくぁ", None, "さ", "し", "す",
+            "せ", "そ", None, "しゃ", "しぃ", "しゅ", "しぇ", "しょ", None, "すぁ", "すぃ", "すぅ", "すぇ",
+            "すぉ", None, "しゃ", "し", "しゅ", "しぇ", "しょ", None, "しゃ", "しぃ", "しゅ", "しぇ",
+            "しょ", None, "っさ", "っし", "っす", "っせ", "っそ", None, "っしゃ", "っしぃ", "っしゅ", "っしぇ",
+            "っしょ", None, "っすぁ", "っすぃ", "っすぅ", "っすぇ", "っすぉ", None, "っしゃ", "っし", "っしゅ",
+            "っしぇ", "っしょ", None, "っしゃ", "っしぃ", "っしゅ", "っしぇ", "っしょ", None, "た", "ち", "つ",
+            "て", "と", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ", "ちょ", None, "つぁ", "つぃ", "つ", "つぇ",
+            "つぉ", None, "てゃ", "てぃ", "てゅ", "てぇ", "てょ", None, "とぁ", "とぃ", "とぅ", "とぇ",
+            "とぉ", None, "った", "っち", "っつ", "って", "っと", None, "っちゃ", "っちぃ", "っちゅ", "っちぇ",
+            "っちょ", None, "っつぁ", "っつぃ", "っつ", "っつぇ", "っつぉ", None, "ってゃ", "ってぃ", "ってゅ",
+            "ってぇ", "ってょ", None, "っとぁ", "っとぃ", "っとぅ", "っとぇ", "っとぉ", "ん", "な", "に", "ぬ",
+            "ね", "の", None, "にゃ", "にぃ", "にゅ", "にぇ", "にょ", "ん", None, "は", "ひ", "ふ",
+            "へ", "ほ", None, "ひゃ", "ひぃ", "ひゅ", "ひぇ", "ひょ", None, "っは", "っひ", "っふ", "っへ",
+            "っほ", None, "っひゃ", "っひぃ", "っひゅ", "っひぇ", "っひょ", None, "ま", "み", "む", "め",
+            "も", None, "みゃ", "みぃ", "みゅ", "みぇ", "みょ", None, "っま", "っみ", "っむ", "っめ",
+            "っも", None, "っみゃ", "っみぃ", "っみゅ", "っみぇ", "っみょ", None, "や", "ゆ", "よ", "い",
+            "いぇ", None, "っや", "っゆ", "っよ", "っい", "っいぇ", None, "ら", "り", "る", "れ", "ろ",
+            None, "りゃ", "りぃ", "りゅ", "りぇ", "りょ", None, "っら", "っり", "っる", "っれ", "っろ",
+            None, "っりゃ", "っりぃ", "っりゅ", "っりぇ", "っりょ", None, "わ", "ゐ", "ゑ", "を", None,
+            "うぁ", "うぃ", "う", "うぇ", "うぉ", "う", None, "っわ", "っうぃ", "っうぇ", "っを", None,
+            "っうぁ", "っうぃ", "っう", "っうぇ", "っうぉ", "っう", None, "が", "ぎ", "ぐ", "げ", "ご",
+            None, "ぎゃ", "ぎぃ", "ぎゅ", "ぎぇ", "ぎょ", None, "ぐぁ", "ぐぃ", "ぐぅ", "ぐぇ", "ぐぉ",
+            None, "っが", "っぎ", "っぐ", "っげ", "っご", None, "っぎゃ", "っぎぃ", "っぎゅ", "っぎぇ",
+            "っぎょ", None, "っぐぁ", "っぐぃ", "っぐぅ", "っぐぇ", "っぐぉ", None, "ざ", "じ", "ず", "ぜ",
+            "ぞ", None, "じゃ", "じぃ", "じゅ", "じぇ", "じょ", None, "っざ", "っじ", "っず", "っぜ",
+            "っぞ", None, "っじゃ", "っじぃ", "っじゅ", "っじぇ", "っじょ", None, "だ", "ぢ", "づ", "で",
+            "ど", None, "ぢゃ", "ぢぃ", "ぢゅ", "ぢぇ", "ぢょ", None, "でゃ", "でぃ", "でゅ", "でぇ",
+            "でょ", None, "どぁ", "どぃ", "どぅ", "どぇ", "どぉ", None, "ぢゃ", "ぢ", "ぢゅ", "ぢぇ",
+            "ぢょ", None, "づ", None, "っだ", "っぢ", "っづ", "っで", "っど", None, "っぢゃ", "っぢぃ",
+            "っぢゅ", "っぢぇ", "っぢょ", None, "っでゃ", "っでぃ", "っでゅ", "っでぇ", "っでょ", None, "っどぁ",
+            "っどぃ", "っどぅ", "っどぇ", "っどぉ", None, "っぢゃ", "っぢ", "っぢゅ", "っぢぇ", "っぢょ", None,
+            "っづ", None, "ば", "び", "ぶ", "べ", "ぼ", None, "びゃ", "びぃ", "びゅ", "びぇ", "びょ",
+            None, "っば", "っび", "っぶ", "っべ", "っぼ", None, "っびゃ", "っびぃ", "っびゅ", "っびぇ",
+            "っびょ", None, "ぱ", "ぴ", "ぷ", "ぺ", "ぽ", None, "ぴゃ", "ぴぃ", "ぴゅ", "ぴぇ", "ぴょ",
+            None, "っぱ", "っぴ", "っぷ", "っぺ", "っぽ", None, "っぴゃ", "っぴぃ", "っぴゅ", "っぴぇ",
+            "っぴょ", None, "ゔぁ", "ゔぃ", "ゔ", "ゔぇ", "ゔぉ", None, "ゔゃ", "ゔぃ", "ゔゅ", "ゔぇ",
+            "ゔょ", None, "っゔぁ", "っゔぃ", "っゔ", "っゔぇ", "っゔぉ", None, "っゔゃ", "っゔぃ", "っゔゅ",
+            "っゔぇ", "っゔょ", None, None, "くゃ", "くぃ", "くゅ", "くぇ", "くょ", None, "くぁ", "くぃ",
+            "くぅ", "くぇ", "くぉ", "くぁ", "くぃ", "くぅ", "くぇ", "くぉ", None, None, "っくゃ", "っくぃ",
+            "っくゅ", "っくぇ", "っくょ", None, "っくぁ", "っくぃ", "っくぅ", "っくぇ", "っくぉ", "っくぁ", "っくぃ",
+            "っくぅ", "っくぇ", "っくぉ", None, None, "ふゃ", "ふぃ", "ふゅ", "ふぇ", "ふょ", None, "ふぁ",
+            "ふぃ", "ふぅ", "ふぇ", "ふぉ", "ふぁ", "ふぃ", "ふ", "ふぇ", "ふぉ", None, None, "っふゃ",
+            "っふぃ", "っふゅ", "っふぇ", "っふょ", None, "っふぁ", "っふぃ", "っふぅ", "っふぇ", "っふぉ", "っふぁ",
+            "っふぃ", "っふ", "っふぇ", "っふぉ", "。", "、", "：", "・", "！", "？", "〜", "ー", "「",
+            "」", "『", "』", "［", "］", "（", "）", "｛", "｝", None, "ん", None, "っ", None,
+            None, "ゎ", None, "ヵ", "ヶ", None, "ぁ", "ぃ", "ぅ", "ぇ", "ぉ", None, "ゃ", "ぃ",
+            "ゅ", "ぇ", "ょ", None, "か", "き", "く", "け", "こ", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ",
+            "ちょ", None, "ちゃ", "ち", "ちゅ", "ちぇ", "ちょ", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ",
+            "ちょ", None, "っか", "っき", "っく", "っけ", "っこ", None, "っちゃ", "っちぃ", "っちゅ", "っちぇ",
+            "っちょ", None, "っちゃ", "っち", "っちゅ", "っちぇ", "っちょ", None, "っちゃ", "っちぃ", "っちゅ",
+            "っちぇ", "っちょ", None, "じゃ", "じ", "じゅ", "じぇ", "じょ", None, "じゃ", "じぃ", "じゅ",
+            "じぇ", "じょ", None, "っじゃ", "っじ", "っじゅ", "っじぇ", "っじょ", None, "っじゃ", "っじぃ",
+            "っじゅ", "っじぇ", "っじょ", None, None, None, None, None, None, None,
+        ),
+    )
+
+
+def romaji_to_kana_true_true():
+    return MappingAutomaton.from_tables(
+        (
+            {
+                "a": 1, "i": 2, "u": 3, "e": 4, "o": 5, "k": 6, "s": 34, "t": 94,
+                "n": 154, "h": 169, "m": 193, "y": 217, "r": 229, "w": 253, "g": 277,
+                "z": 313, "d": 337, "b": 401, "p": 425, "v": 449, "q": 473, "f": 509,
+                ".": 545, ",": 546, ":": 547, "/": 548, "!": 549, "?": 550, "~": 551,
+                "-": 552, "‘": 553, "’": 554, "“": 555, "”": 556, "[": 557, "]": 558,
+                "(": 559, ")": 560, "{": 561, "}": 562, "x": 563, "c": 585, "j": 633,
+                "l": 657,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 7, "i": 8, "u": 9, "e": 10, "o": 11, "y": 12, "w": 18, "k": 20},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 13, "i": 14, "u": 15, "e": 16, "o": 17},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 19},
+            {},
+            {"a": 21, "i": 22, "u": 23, "e": 24, "o": 25, "y": 26, "w": 32},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 27, "i": 28, "u": 29, "e": 30, "o": 31},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 33},
+            {},
+            {
+                "a": 35, "i": 36, "u": 37, "e": 38, "o": 39, "y": 40, "w": 46, "h": 52,
+                "s": 64,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 41, "i": 42, "u": 43, "e": 44, "o": 45},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 47, "i": 48, "u": 49, "e": 50, "o": 51},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 53, "i": 54, "u": 55, "e": 56, "o": 57, "y": 58},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 59, "i": 60, "u": 61, "e": 62, "o": 63},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 65, "i": 66, "u": 67, "e": 68, "o": 69, "y": 70, "w": 76, "h": 82},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 71, "i": 72, "u": 73, "e": 74, "o": 75},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 77, "i": 78, "u": 79, "e": 80, "o": 81},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 83, "i": 84, "u": 85, "e": 86, "o": 87, "y": 88},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 89, "i": 90, "u": 91, "e": 92, "o": 93},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 95, "i": 96, "u": 97, "e": 98, "o": 99, "y": 100, "s": 106,
+                "h": 112, "w": 118, "t": 124,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 101, "i": 102, "u": 103, "e": 104, "o": 105},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 107, "i": 108, "u": 109, "e": 110, "o": 111},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 113, "i": 114, "u": 115, "e": 116, "o": 117},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 119, "i": 120, "u": 121, "e": 122, "o": 123},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 125, "i": 126, "u": 127, "e": 128, "o": 129, "y": 130, "s": 136,
+                "h": 142, "w": 148,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 131, "i": 132, "u": 133, "e": 134, "o": 135},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 137, "i": 138, "u": 139, "e": 140, "o": 141},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 143, "i": 144, "u": 145, "e": 146, "o": 147},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 149, "i": 150, "u": 151, "e": 152, "o": 153},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 155, "i": 156, "u": 157, "e": 158, "o": 159, "y": 160, "'": 166,
+                "n": 167, " ": 168,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 161, "i": 162, "u": 163, "e": 164, "o": 165},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 170, "i": 171, "u": 172, "e": 173, "o": 174, "y": 175, "h": 181},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 176, "i": 177, "u": 178, "e": 179, "o": 180},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 182, "i": 183, "u": 184, "e": 185, "o": 186, "y": 187},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 188, "i": 189, "u": 190, "e": 191, "o": 192},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 194, "i": 195, "u": 196, "e": 197, "o": 198, "y": 199, "m": 205},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 200, "i": 201, "u": 202, "e": 203, "o": 204},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 206, "i": 207, "u": 208, "e": 209, "o": 210, "y": 211},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 212, "i": 213, "u": 214, "e": 215, "o": 216},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 218, "u": 219, "o": 220, "i": 221, "e": 222, "y": 223},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 224, "u": 225, "o": 226, "i": 227, "e": 228},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 230, "i": 231, "u": 232, "e": 233, "o": 234, "y": 235, "r": 241},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 236, "i": 237, "u": 238, "e": 239, "o": 240},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 242, "i": 243, "u": 244, "e": 245, "o": 246, "y": 247},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 248, "i": 249, "u": 250, "e": 251, "o": 252},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 254, "i": 255, "e": 256, "o": 257, "h": 258, "u": 264, "w": 265},
+            {},
+            {},
+            {},
+            {},
+            {"a": 259, "i": 260, "u": 261, "e": 262, "o": 263},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 266, "i": 267, "e": 268, "o": 269, "h": 270, "u": 276},
+            {},
+            {},
+            {},
+            {},
+            {"a": 271, "i": 272, "u": 273, "e": 274, "o": 275},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 278, "i": 279, "u": 280, "e": 281, "o": 282, "y": 283, "w": 289,
+                "g": 295,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 284, "i": 285, "u": 286, "e": 287, "o": 288},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 290, "i": 291, "u": 292, "e": 293, "o": 294},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 296, "i": 297, "u": 298, "e": 299, "o": 300, "y": 301, "w": 307},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 302, "i": 303, "u": 304, "e": 305, "o": 306},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 308, "i": 309, "u": 310, "e": 311, "o": 312},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 314, "i": 315, "u": 316, "e": 317, "o": 318, "y": 319, "z": 325},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 320, "i": 321, "u": 322, "e": 323, "o": 324},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 326, "i": 327, "u": 328, "e": 329, "o": 330, "y": 331},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 332, "i": 333, "u": 334, "e": 335, "o": 336},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 338, "i": 339, "u": 340, "e": 341, "o": 342, "y": 343, "h": 349,
+                "w": 355, "j": 361, "z": 367, "d": 369,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 344, "i": 345, "u": 346, "e": 347, "o": 348},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 350, "i": 351, "u": 352, "e": 353, "o": 354},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 356, "i": 357, "u": 358, "e": 359, "o": 360},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 362, "i": 363, "u": 364, "e": 365, "o": 366},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"u": 368},
+            {},
+            {
+                "a": 370, "i": 371, "u": 372, "e": 373, "o": 374, "y": 375, "h": 381,
+                "w": 387, "j": 393, "z": 399,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 376, "i": 377, "u": 378, "e": 379, "o": 380},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 382, "i": 383, "u": 384, "e": 385, "o": 386},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 388, "i": 389, "u": 390, "e": 391, "o": 392},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 394, "i": 395, "u": 396, "e": 397, "o": 398},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"u": 400},
+            {},
+            {"a": 402, "i": 403, "u": 404, "e": 405, "o": 406, "y": 407, "b": 413},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 408, "i": 409, "u": 410, "e": 411, "o": 412},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 414, "i": 415, "u": 416, "e": 417, "o": 418, "y": 419},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 420, "i": 421, "u": 422, "e": 423, "o": 424},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 426, "i": 427, "u": 428, "e": 429, "o": 430, "y": 431, "p": 437},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 432, "i": 433, "u": 434, "e": 435, "o": 436},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 438, "i": 439, "u": 440, "e": 441, "o": 442, "y": 443},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 444, "i": 445, "u": 446, "e": 447, "o": 448},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 450, "i": 451, "u": 452, "e": 453, "o": 454, "y": 455, "v": 461},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 456, "i": 457, "u": 458, "e": 459, "o": 460},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 462, "i": 463, "u": 464, "e": 465, "o": 466, "y": 467},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 468, "i": 469, "u": 470, "e": 471, "o": 472},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "y": 474, "w": 480, "a": 486, "i": 487, "u": 488, "e": 489, "o": 490,
+                "q": 491,
+            },
+            {"a": 475, "i": 476, "u": 477, "e": 478, "o": 479},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 481, "i": 482, "u": 483, "e": 484, "o": 485},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"y": 492, "w": 498, "a": 504, "i": 505, "u": 506, "e": 507, "o": 508},
+            {"a": 493, "i": 494, "u": 495, "e": 496, "o": 497},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 499, "i": 500, "u": 501, "e": 502, "o": 503},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "y": 510, "w": 516, "a": 522, "i": 523, "u": 524, "e": 525, "o": 526,
+                "f": 527,
+            },
+            {"a": 511, "i": 512, "u": 513, "e": 514, "o": 515},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 517, "i": 518, "u": 519, "e": 520, "o": 521},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"y": 528, "w": 534, "a": 540, "i": 541, "u": 542, "e": 543, "o": 544},
+            {"a": 529, "i": 530, "u": 531, "e": 532, "o": 533},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 535, "i": 536, "u": 537, "e": 538, "o": 539},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "n": 564, "t": 565, "w": 568, "k": 570, "c": 573, "a": 574, "i": 575,
+                "u": 576, "e": 577, "o": 578, "y": 579,
+            },
+            {},
+            {"u": 566, "s": 567},
+            {},
+            {"u": 566},
+            {"a": 569},
+            {},
+            {"a": 571, "e": 572},
+            {},
+            {},
+            {"a": 571, "e": 572},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 580, "i": 581, "u": 582, "e": 583, "o": 584},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "a": 586, "i": 587, "u": 588, "e": 589, "o": 590, "y": 591, "h": 597,
+                "c": 609,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 592, "i": 593, "u": 594, "e": 595, "o": 596},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 598, "i": 599, "u": 600, "e": 601, "o": 602, "y": 603},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 604, "i": 605, "u": 606, "e": 607, "o": 608},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 610, "i": 611, "u": 612, "e": 613, "o": 614, "y": 615, "h": 621},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 616, "i": 617, "u": 618, "e": 619, "o": 620},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 622, "i": 623, "u": 624, "e": 625, "o": 626, "y": 627},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 628, "i": 629, "u": 630, "e": 631, "o": 632},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 634, "i": 635, "u": 636, "e": 637, "o": 638, "y": 639, "j": 645},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 640, "i": 641, "u": 642, "e": 643, "o": 644},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 646, "i": 647, "u": 648, "e": 649, "o": 650, "y": 651},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"a": 652, "i": 653, "u": 654, "e": 655, "o": 656},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "t": 658, "w": 660, "k": 661, "c": 662, "a": 574, "i": 575, "u": 576,
+                "e": 577, "o": 578, "y": 663,
+            },
+            {"u": 566, "s": 659},
+            {"u": 566},
+            {"a": 569},
+            {"a": 571, "e": 572},
+            {"a": 571, "e": 572},
+            {"a": 580, "i": 581, "u": 582, "e": 583, "o": 584},
+        ),
+        (
+            None, "あ", "い", "う", "え", "お", None, "か", "き", "く", "け", "こ", None, "きゃ",
+            "きぃ", "きゅ", "きぇ", "きょ", None, "くぁ", None, "っか", "っき", "っく", "っけ", "っこ",
+            None, "っきゃ", "っきぃ", "っきゅ", "っきぇ", "っきょ", None, "っくぁ", None, "さ", "し", "す",
+            "せ", "そ", None, "しゃ", "しぃ", "しゅ", "しぇ", "しょ", None, "すぁ", "すぃ", "すぅ", "すぇ",
+            "すぉ", None, "しゃ", "し", "しゅ", "しぇ", "しょ", None, "しゃ", "しぃ", "しゅ", "しぇ",
+            "しょ", None, "っさ", "っし", "っす", "っせ", "っそ", None, "っしゃ", "っしぃ", "っしゅ", "っしぇ",
+            "っしょ", None, "っすぁ", "っすぃ", "っすぅ", "っすぇ", "っすぉ", None, "っしゃ", "っし", "っしゅ",
+            "っしぇ", "っしょ", None, "っしゃ", "っしぃ", "っしゅ", "っしぇ", "っしょ", None, "た", "ち", "つ",
+            "て", "と", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ", "ちょ", None, "つぁ", "つぃ", "つ", "つぇ",
+            "つぉ", None, "てゃ", "てぃ", "てゅ", "てぇ", "てょ", None, "とぁ", "とぃ", "とぅ", "とぇ",
+            "とぉ", None, "った", "っち", "っつ", "って", "っと", None, "っちゃ", "っちぃ", "っちゅ", "っちぇ",
+            "っちょ", None, "っつぁ", "っつぃ", "っつ", "っつぇ", "っつぉ", None, "ってゃ", "ってぃ", "ってゅ",
+            "ってぇ", "ってょ", None, "っとぁ", "っとぃ", "っとぅ", "っとぇ", "っとぉ", "ん", "な", "に", "ぬ",
+            "ね", "の", None, "にゃ", "にぃ", "にゅ", "にぇ", "にょ", "ん", "ん", "ん", None, "は",
+            "ひ", "ふ", "へ", "ほ", None, "ひゃ", "ひぃ", "ひゅ", "ひぇ", "ひょ", None, "っは", "っひ",
+            "っふ", "っへ", "っほ", None, "っひゃ", "っひぃ", "っひゅ", "っひぇ", "っひょ", None, "ま", "み",
+            "む", "め", "も", None, "みゃ", "みぃ", "みゅ", "みぇ", "みょ", None, "っま", "っみ", "っむ",
+            "っめ", "っも", None, "っみゃ", "っみぃ", "っみゅ", "っみぇ", "っみょ", None, "や", "ゆ", "よ",
+            "い", "いぇ", None, "っや", "っゆ", "っよ", "っい", "っいぇ", None, "ら", "り", "る", "れ",
+            "ろ", None, "りゃ", "りぃ", "りゅ", "りぇ", "りょ", None, "っら", "っり", "っる", "っれ",
+            "っろ", None, "っりゃ", "っりぃ", "っりゅ", "っりぇ", "っりょ", None, "わ", "ゐ", "ゑ", "を",
+            None, "うぁ", "うぃ", "う", "うぇ", "うぉ", "う", None, "っわ", "っうぃ", "っうぇ", "っを",
+            None, "っうぁ", "っうぃ", "っう", "っうぇ", "っうぉ", "っう", None, "が", "ぎ", "ぐ", "げ",
+            "ご", None, "ぎゃ", "ぎぃ", "ぎゅ", "ぎぇ", "ぎょ", None, "ぐぁ", "ぐぃ", "ぐぅ", "ぐぇ",
+            "ぐぉ", None, "っが", "っぎ", "っぐ", "っげ", "っご", None, "っぎゃ", "っぎぃ", "っぎゅ", "っぎぇ",
+            "っぎょ", None, "っぐぁ", "っぐぃ", "っぐぅ", "っぐぇ", "っぐぉ", None, "ざ", "じ", "ず", "ぜ",
+            "ぞ", None, "じゃ", "じぃ", "じゅ", "じぇ", "じょ", None, "っざ", "っじ", "っず", "っぜ",
+            "っぞ", None, "っじゃ", "っじぃ", "っじゅ", "っじぇ", "っじょ", None, "だ", "ぢ", "づ", "で",
+            "ど", None, "ぢゃ", "ぢぃ", "ぢゅ", "ぢぇ", "ぢょ", None, "でゃ", "でぃ", "でゅ", "でぇ",
+            "でょ", None, "どぁ", "どぃ", "どぅ", "どぇ", "どぉ", None, "ぢゃ", "ぢ", "ぢゅ", "ぢぇ",
+            "ぢょ", None, "づ", None, "っだ", "っぢ", "っづ", "っで", "っど", None, "っぢゃ", "っぢぃ",
+            "っぢゅ", "っぢぇ", "っぢょ", None, "っでゃ", "っでぃ", "っでゅ", "っでぇ", "っでょ", None, "っどぁ",
+            "っどぃ", "っどぅ", "っどぇ", "っどぉ", None, "っぢゃ", "っぢ", "っぢゅ", "っぢぇ", "っぢょ", None,
+            "っづ", None, "ば", "び", "ぶ", "べ", "ぼ", None, "びゃ", "びぃ", "びゅ", "びぇ", "びょ",
+            None, "っば", "っび", "っぶ", "っべ", "っぼ", None, "っびゃ", "っびぃ", "っびゅ", "っびぇ",
+            "っびょ", None, "ぱ", "ぴ", "ぷ", "ぺ", "ぽ", None, "ぴゃ", "ぴぃ", "ぴゅ", "ぴぇ", "ぴょ",
+            None, "っぱ", "っぴ", "っぷ", "っぺ", "っぽ", None, "っぴゃ", "っぴぃ", "っぴゅ", "っぴぇ",
+            "っぴょ", None, "ゔぁ", "ゔぃ", "ゔ", "ゔぇ", "ゔぉ", None, "ゔゃ", "ゔぃ", "ゔゅ", "ゔぇ",
+            "ゔょ", None, "っゔぁ", "っゔぃ", "っゔ", "っゔぇ", "っゔぉ", None, "っゔゃ", "っゔぃ", "っゔゅ",
+            "っゔぇ", "っゔょ", None, None, "くゃ", "くぃ", "くゅ", "くぇ", "くょ", None, "くぁ", "くぃ",
+            "くぅ", "くぇ", "くぉ", "くぁ", "くぃ", "くぅ", "くぇ", "くぉ", None, None, "っくゃ", "っくぃ",
+            "っくゅ", "っくぇ", "っくょ", None, "っくぁ", "っくぃ", "っくぅ", "っくぇ", "っくぉ", "っくぁ", "っくぃ",
+            "っくぅ", "っくぇ", "っくぉ", None, None, "ふゃ", "ふぃ", "ふゅ", "ふぇ", "ふょ", None, "ふぁ",
+            "ふぃ", "ふぅ", "ふぇ", "ふぉ", "ふぁ", "ふぃ", "ふ", "ふぇ", "ふぉ", None, None, "っふゃ",
+            "っふぃ", "っふゅ", "っふぇ", "っふょ", None, "っふぁ", "っふぃ", "っふぅ", "っふぇ", "っふぉ", "っふぁ",
+            "っふぃ", "っふ", "っふぇ", "っふぉ", "。", "、", "：", "・", "！", "？", "〜", "ー", "「",
+            "」", "『", "』", "［", "］", "（", "）", "｛", "｝", None, "ん", None, "っ", None,
+            None, "ゎ", None, "ヵ", "ヶ", None, "ぁ", "ぃ", "ぅ", "ぇ", "ぉ", None, "ゃ", "ぃ",
+            "ゅ", "ぇ", "ょ", None, "か", "き", "く", "け", "こ", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ",
+            "ちょ", None, "ちゃ", "ち", "ちゅ", "ちぇ", "ちょ", None, "ちゃ", "ちぃ", "ちゅ", "ちぇ",
+            "ちょ", None, "っか", "っき", "っく", "っけ", "っこ", None, "っちゃ", "っちぃ", "っちゅ", "っちぇ",
+            "っちょ", None, "っちゃ", "っち", "っちゅ", "っちぇ", "っちょ", None, "っちゃ", "っちぃ", "っちゅ",
+            "っちぇ", "っちょ", None, "じゃ", "じ", "じゅ", "じぇ", "じょ", None, "じゃ", "じぃ", "じゅ",
+            "じぇ", "じょ", None, "っじゃ", "っじ", "っじゅ", "っじぇ", "っじょ", None, "っじゃ", "っじぃ",
+            "っじゅ", "っじぇ", "っじょ", None, None, None, None, None, None, None,
+        ),
+    )
+
+
+def kana_to_romaji_hepburn():
+    return MappingAutomaton.from_tables(
+        (
+            {
+                "あ": 1, "い": 2, "う": 3, "え": 4, "お": 5, "か": 6, "き": 7, "く": 13,
+                "け": 19, "こ": 20, "さ": 21, "し": 22, "す": 28, "せ": 29, "そ": 30, "た": 31,
+                "ち": 32, "つ": 38, "て": 39, "と": 40, "な": 41, "に": 42, "ぬ": 48, "ね": 49,
+                "の": 50, "は": 51, "ひ": 52, "ふ": 58, "へ": 64, "ほ": 65, "ま": 66, "み": 67,
+                "む": 73, "め": 74, "も": 75, "ら": 76, "り": 77, "る": 83, "れ": 84, "ろ": 85,
+                "や": 86, "ゆ": 87, "よ": 88, "わ": 89, "ゐ": 90, "ゑ": 91, "を": 92, "ん": 93,
+                "が": 107, "ぎ": 108, "ぐ": 114, "げ": 115, "ご": 116, "ざ": 117, "じ": 118,
+                "ず": 124, "ぜ": 125, "ぞ": 126, "だ": 127, "ぢ": 128, "づ": 134, "で": 135,
+                "ど": 136, "ば": 137, "び": 138, "ぶ": 144, "べ": 145, "ぼ": 146, "ぱ": 147,
+                "ぴ": 148, "ぷ": 154, "ぺ": 155, "ぽ": 156, "ゔぁ": 157, "ゔぃ": 158, "ゔ": 159,
+                "ゔぇ": 165, "ゔぉ": 166, "。": 167, "、": 168, "：": 169, "・": 170, "！": 171,
+                "？": 172, "〜": 173, "ー": 174, "「": 175, "」": 176, "『": 177, "』": 178,
+                "［": 179, "］": 180, "（": 181, "）": 182, "｛": 183, "｝": 184, "　": 185,
+                "ゃ": 186, "ゅ": 187, "ょ": 188, "ぁ": 189, "ぃ": 190, "ぅ": 191, "ぇ": 192,
+                "ぉ": 193, "っ": 194,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 8, "ゅ": 9, "ょ": 10, "ぃ": 11, "ぇ": 12},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 14, "ゅ": 15, "ょ": 16, "ぃ": 17, "ぇ": 18},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 23, "ゅ": 24, "ょ": 25, "ぃ": 26, "ぇ": 27},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 33, "ゅ": 34, "ょ": 35, "ぃ": 36, "ぇ": 37},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 43, "ゅ": 44, "ょ": 45, "ぃ": 46, "ぇ": 47},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 53, "ゅ": 54, "ょ": 55, "ぃ": 56, "ぇ": 57},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 59, "ゅ": 60, "ょ": 61, "ぃ": 62, "ぇ": 63},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 68, "ゅ": 69, "ょ": 70, "ぃ": 71, "ぇ": 72},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 78, "ゅ": 79, "ょ": 80, "ぃ": 81, "ぇ": 82},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "あ": 94, "い": 95, "う": 96, "え": 97, "お": 98, "や": 99, "ゆ": 100,
+                "よ": 101, "な": 102, "に": 103, "ぬ": 104, "ね": 105, "の": 106,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 109, "ゅ": 110, "ょ": 111, "ぃ": 112, "ぇ": 113},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 119, "ゅ": 120, "ょ": 121, "ぃ": 122, "ぇ": 123},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 129, "ゅ": 130, "ょ": 131, "ぃ": 132, "ぇ": 133},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 139, "ゅ": 140, "ょ": 141, "ぃ": 142, "ぇ": 143},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 149, "ゅ": 150, "ょ": 151, "ぃ": 152, "ぇ": 153},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 160, "ゅ": 161, "ょ": 162, "ぃ": 163, "ぇ": 164},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "あ": 195, "い": 196, "う": 197, "え": 198, "お": 199, "か": 200, "き": 201,
+                "く": 207, "け": 213, "こ": 214, "さ": 215, "し": 216, "す": 222, "せ": 223,
+                "そ": 224, "た": 225, "ち": 226, "つ": 232, "て": 233, "と": 234, "な": 235,
+                "に": 236, "ぬ": 242, "ね": 243, "の": 244, "は": 245, "ひ": 246, "ふ": 252,
+                "へ": 258, "ほ": 259, "ま": 260, "み": 261, "む": 267, "め": 268, "も": 269,
+                "ら": 270, "り": 271, "る": 277, "れ": 278, "ろ": 279, "や": 280, "ゆ": 281,
+                "よ": 282, "わ": 283, "ゐ": 284, "ゑ": 285, "を": 286, "ん": 287, "が": 288,
+                "ぎ": 289, "ぐ": 295, "げ": 296, "ご": 297, "ざ": 298, "じ": 299, "ず": 305,
+                "ぜ": 306, "ぞ": 307, "だ": 308, "ぢ": 309, "づ": 315, "で": 316, "ど": 317,
+                "ば": 318, "び": 319, "ぶ": 325, "べ": 326, "ぼ": 327, "ぱ": 328, "ぴ": 329,
+                "ぷ": 335, "ぺ": 336, "ぽ": 337, "ゔぁ": 338, "ゔぃ": 339, "ゔ": 340,
+                "ゔぇ": 346, "ゔぉ": 347, "。": 348, "、": 349, "：": 350, "・": 351, "！": 352,
+                "？": 353, "〜": 354, "ー": 355, "「": 356, "」": 357, "『": 358, "』": 359,
+                "［": 360, "］": 361, "（": 362, "）": 363, "｛": 364, "｝": 365, "　": 366,
+                "ゃ": 367, "ゅ": 368, "ょ": 369, "ぁ": 370, "ぃ": 371, "ぅ": 372, "ぇ": 373,
+                "ぉ": 374,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 202, "ゅ": 203, "ょ": 204, "ぃ": 205, "ぇ": 206},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 208, "ゅ": 209, "ょ": 210, "ぃ": 211, "ぇ": 212},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 217, "ゅ": 218, "ょ": 219, "ぃ": 220, "ぇ": 221},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 227, "ゅ": 228, "ょ": 229, "ぃ": 230, "ぇ": 231},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 237, "ゅ": 238, "ょ": 239, "ぃ": 240, "ぇ": 241},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 247, "ゅ": 248, "ょ": 249, "ぃ": 250, "ぇ": 251},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 253, "ゅ": 254, "ょ": 255, "ぃ": 256, "ぇ": 257},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 262, "ゅ": 263, "ょ": 264, "ぃ": 265, "ぇ": 266},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 272, "ゅ": 273, "ょ": 274, "ぃ": 275, "ぇ": 276},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 290, "ゅ": 291, "ょ": 292, "ぃ": 293, "ぇ": 294},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 300, "ゅ": 301, "ょ": 302, "ぃ": 303, "ぇ": 304},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 310, "ゅ": 311, "ょ": 312, "ぃ": 313, "ぇ": 314},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 320, "ゅ": 321, "ょ": 322, "ぃ": 323, "ぇ": 324},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 330, "ゅ": 331, "ょ": 332, "ぃ": 333, "ぇ": 334},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 341, "ゅ": 342, "ょ": 343, "ぃ": 344, "ぇ": 345},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+        ),
+        (
+            None, "a", "i", "u", "e", "o", "ka", "ki", "kya", "kyu", "kyo", "kyi",
+            "kye", "ku", "kya", "kyu", "kyo", "kyi", "kye", "ke", "ko", "sa", "shi",
+            "sha", "shu", "sho", "shyi", "she", "su", "se", "so", "ta", "chi", "cha",
+            "chu", "cho", "chyi", "che", "tsu", "te", "to", "na", "ni", "nya", "nyu",
+            "nyo", "nyi", "nye", "nu", "ne", "no", "ha", "hi", "hya", "hyu", "hyo",
+            "hyi", "hye", "fu", "fya", "fyu", "fyo", "fyi", "fye", "he", "ho", "ma",
+            "mi", "mya", "myu", "myo", "myi", "mye", "mu", "me", "mo", "ra", "ri",
+            "rya", "ryu", "ryo", "ryi", "rye", "ru", "re", "ro", "ya", "yu", "yo",
+            "wa", "wi", "we", "wo", "n", "n'a", "n'i", "n'u", "n'e", "n'o", "n'ya",
+            "n'yu", "n'yo", "n'na", "n'ni", "n'nu", "n'ne", "n'no", "ga", "gi", "gya",
+            "gyu", "gyo", "gyi", "gye", "gu", "ge", "go", "za", "ji", "ja", "ju", "jo",
+            "jyi", "je", "zu", "ze", "zo", "da", "dji", "dja", "dju", "djo", "djyi",
+            "dje", "dzu", "de", "do", "ba", "bi", "bya", "byu", "byo", "byi", "bye",
+            "bu", "be", "bo", "pa", "pi", "pya", "pyu", "pyo", "pyi", "pye", "pu",
+            "pe", "po", "va", "vi", "vu", "vya", "vyu", "vyo", "vyi", "vye", "ve",
+            "vo", ".", ",", ":", "/", "!", "?", "~", "-", "‘", "’", "“", "”", "[", "]",
+            "(", ")", "{", "}", " ", "ya", "yu", "yo", "a", "i", "u", "e", "o", "",
+            "a", "i", "u", "e", "o", "kka", "kki", "kkya", "kkyu", "kkyo", "kkyi",
+            "kkye", "kku", "kkya", "kkyu", "kkyo", "kkyi", "kkye", "kke", "kko", "ssa",
+            "sshi", "ssha", "sshu", "ssho", "sshyi", "sshe", "ssu", "sse", "sso",
+            "tta", "tchi", "tcha", "tchu", "tcho", "tchyi", "tche", "ttsu", "tte",
+            "tto", "na", "ni", "nya", "nyu", "nyo", "nyi", "nye", "nu", "ne", "no",
+            "hha", "hhi", "hhya", "hhyu", "hhyo", "hhyi", "hhye", "ffu", "ffya",
+            "ffyu", "ffyo", "ffyi", "ffye", "hhe", "hho", "mma", "mmi", "mmya", "mmyu",
+            "mmyo", "mmyi", "mmye", "mmu", "mme", "mmo", "rra", "rri", "rrya", "rryu",
+            "rryo", "rryi", "rrye", "rru", "rre", "rro", "ya", "yu", "yo", "wwa",
+            "wwi", "wwe", "wwo", "n", "gga", "ggi", "ggya", "ggyu", "ggyo", "ggyi",
+            "ggye", "ggu", "gge", "ggo", "zza", "jji", "jja", "jju", "jjo", "jjyi",
+            "jje", "zzu", "zze", "zzo", "dda", "ddji", "ddja", "ddju", "ddjo", "ddjyi",
+            "ddje", "ddzu", "dde", "ddo", "bba", "bbi", "bbya", "bbyu", "bbyo", "bbyi",
+            "bbye", "bbu", "bbe", "bbo", "ppa", "ppi", "ppya", "ppyu", "ppyo", "ppyi",
+            "ppye", "ppu", "ppe", "ppo", "vva", "vvi", "vvu", "vvya", "vvyu", "vvyo",
+            "vvyi", "vvye", "vve", "vvo", ".", ",", ":", "/", "!", "?", "~", "-", "‘",
+            "’", "“", "”", "[", "]", "(", ")", "{", "}", " ", "ya", "yu", "yo", "a",
+            "i", "u", "e", "o",
+        ),
+    )
+
+
+def kana_to_romaji_kunrei():
+    return MappingAutomaton.from_tables(
+        (
+            {
+                "あ": 1, "い": 2, "う": 3, "え": 4, "お": 5, "か": 6, "き": 7, "く": 13,
+                "け": 19, "こ": 20, "さ": 21, "し": 22, "す": 28, "せ": 29, "そ": 30, "た": 31,
+                "ち": 32, "つ": 38, "て": 39, "と": 40, "な": 41, "に": 42, "ぬ": 48, "ね": 49,
+                "の": 50, "は": 51, "ひ": 52, "ふ": 58, "へ": 64, "ほ": 65, "ま": 66, "み": 67,
+                "む": 73, "め": 74, "も": 75, "ら": 76, "り": 77, "る": 83, "れ": 84, "ろ": 85,
+                "や": 86, "ゆ": 87, "よ": 88, "わ": 89, "ゐ": 90, "ゑ": 91, "を": 92, "ん": 93,
+                "が": 107, "ぎ": 108, "ぐ": 114, "げ": 115, "ご": 116, "ざ": 117, "じ": 118,
+                "ず": 124, "ぜ": 125, "ぞ": 126, "だ": 127, "ぢ": 128, "づ": 134, "で": 135,
+                "ど": 136, "ば": 137, "び": 138, "ぶ": 144, "べ": 145, "ぼ": 146, "ぱ": 147,
+                "ぴ": 148, "ぷ": 154, "ぺ": 155, "ぽ": 156, "ゔぁ": 157, "ゔぃ": 158, "ゔ": 159,
+                "ゔぇ": 165, "ゔぉ": 166, "。": 167, "、": 168, "：": 169, "・": 170, "！": 171,
+                "？": 172, "〜": 173, "ー": 174, "「": 175, "」": 176, "『": 177, "』": 178,
+                "［": 179, "］": 180, "（": 181, "）": 182, "｛": 183, "｝": 184, "　": 185,
+                "ゃ": 186, "ゅ": 187, "ょ": 188, "ぁ": 189, "ぃ": 190, "ぅ": 191, "ぇ": 192,
+                "ぉ": 193, "っ": 194,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 8, "ゅ": 9, "ょ": 10, "ぃ": 11, "ぇ": 12},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 14, "ゅ": 15, "ょ": 16, "ぃ": 17, "ぇ": 18},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 23, "ゅ": 24, "ょ": 25, "ぃ": 26, "ぇ": 27},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 33, "ゅ": 34, "ょ": 35, "ぃ": 36, "ぇ": 37},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 43, "ゅ": 44, "ょ": 45, "ぃ": 46, "ぇ": 47},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 53, "ゅ": 54, "ょ": 55, "ぃ": 56, "ぇ": 57},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 59, "ゅ": 60, "ょ": 61, "ぃ": 62, "ぇ": 63},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 68, "ゅ": 69, "ょ": 70, "ぃ": 71, "ぇ": 72},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 78, "ゅ": 79, "ょ": 80, "ぃ": 81, "ぇ": 82},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "あ": 94, "い": 95, "う": 96, "え": 97, "お": 98, "や": 99, "ゆ": 100,
+                "よ": 101, "な": 102, "に": 103, "ぬ": 104, "ね": 105, "の": 106,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 109, "ゅ": 110, "ょ": 111, "ぃ": 112, "ぇ": 113},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 119, "ゅ": 120, "ょ": 121, "ぃ": 122, "ぇ": 123},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 129, "ゅ": 130, "ょ": 131, "ぃ": 132, "ぇ": 133},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 139, "ゅ": 140, "ょ": 141, "ぃ": 142, "ぇ": 143},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 149, "ゅ": 150, "ょ": 151, "ぃ": 152, "ぇ": 153},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 160, "ゅ": 161, "ょ": 162, "ぃ": 163, "ぇ": 164},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {
+                "あ": 195, "い": 196, "う": 197, "え": 198, "お": 199, "か": 200, "き": 201,
+                "く": 207, "け": 213, "こ": 214, "さ": 215, "し": 216, "す": 222, "せ": 223,
+                "そ": 224, "た": 225, "ち": 226, "つ": 232, "て": 233, "と": 234, "な": 235,
+                "に": 236, "ぬ": 242, "ね": 243, "の": 244, "は": 245, "ひ": 246, "ふ": 252,
+                "へ": 258, "ほ": 259, "ま": 260, "み": 261, "む": 267, "め": 268, "も": 269,
+                "ら": 270, "り": 271, "る": 277, "れ": 278, "ろ": 279, "や": 280, "ゆ": 281,
+                "よ": 282, "わ": 283, "ゐ": 284, "ゑ": 285, "を": 286, "ん": 287, "が": 288,
+                "ぎ": 289, "ぐ": 295, "げ": 296, "ご": 297, "ざ": 298, "じ": 299, "ず": 305,
+                "ぜ": 306, "ぞ": 307, "だ": 308, "ぢ": 309, "づ": 315, "で": 316, "ど": 317,
+                "ば": 318, "び": 319, "ぶ": 325, "べ": 326, "ぼ": 327, "ぱ": 328, "ぴ": 329,
+                "ぷ": 335, "ぺ": 336, "ぽ": 337, "ゔぁ": 338, "ゔぃ": 339, "ゔ": 340,
+                "ゔぇ": 346, "ゔぉ": 347, "。": 348, "、": 349, "：": 350, "・": 351, "！": 352,
+                "？": 353, "〜": 354, "ー": 355, "「": 356, "」": 357, "『": 358, "』": 359,
+                "［": 360, "］": 361, "（": 362, "）": 363, "｛": 364, "｝": 365, "　": 366,
+                "ゃ": 367, "ゅ": 368, "ょ": 369, "ぁ": 370, "ぃ": 371, "ぅ": 372, "ぇ": 373,
+                "ぉ": 374,
+            },
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 202, "ゅ": 203, "ょ": 204, "ぃ": 205, "ぇ": 206},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 208, "ゅ": 209, "ょ": 210, "ぃ": 211, "ぇ": 212},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 217, "ゅ": 218, "ょ": 219, "ぃ": 220, "ぇ": 221},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 227, "ゅ": 228, "ょ": 229, "ぃ": 230, "ぇ": 231},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 237, "ゅ": 238, "ょ": 239, "ぃ": 240, "ぇ": 241},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 247, "ゅ": 248, "ょ": 249, "ぃ": 250, "ぇ": 251},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 253, "ゅ": 254, "ょ": 255, "ぃ": 256, "ぇ": 257},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 262, "ゅ": 263, "ょ": 264, "ぃ": 265, "ぇ": 266},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 272, "ゅ": 273, "ょ": 274, "ぃ": 275, "ぇ": 276},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 290, "ゅ": 291, "ょ": 292, "ぃ": 293, "ぇ": 294},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 300, "ゅ": 301, "ょ": 302, "ぃ": 303, "ぇ": 304},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 310, "ゅ": 311, "ょ": 312, "ぃ": 313, "ぇ": 314},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 320, "ゅ": 321, "ょ": 322, "ぃ": 323, "ぇ": 324},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 330, "ゅ": 331, "ょ": 332, "ぃ": 333, "ぇ": 334},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {"ゃ": 341, "ゅ": 342, "ょ": 343, "ぃ": 344, "ぇ": 345},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+            {},
+        ),
+        (
+            None, "a", "i", "u", "e", "o", "ka", "ki", "kya", "kyu", "kyo", "kyi",
+            "kye", "ku", "kya", "kyu", "kyo", "kyi", "kye", "ke", "ko", "sa", "si",
+            "sya", "syu", "syo", "syi", "sye", "su", "se", "so", "ta", "ti", "tya",
+            "tyu", "tyo", "tyi", "tye", "tu", "te", "to", "na", "ni", "nya", "nyu",
+            "nyo", "nyi", "nye", "nu", "ne", "no", "ha", "hi", "hya", "hyu", "hyo",
+            "hyi", "hye", "hu", "hya", "hyu", "hyo", "hyi", "hye", "he", "ho", "ma",
+            "mi", "mya", "myu", "myo", "myi", "mye", "mu", "me", "mo", "ra", "ri",
+            "rya", "ryu", "ryo", "ryi", "rye", "ru", "re", "ro", "ya", "yu", "yo",
+            "wa", "i", "e", "o", "n", "n'a", "n'i", "n'u", "n'e", "n'o", "n'ya",
+            "n'yu", "n'yo", "n'na", "n'ni", "n'nu", "n'ne", "n'no", "ga", "gi", "gya",
+            "gyu", "gyo", "gyi", "gye", "gu", "ge", "go", "za", "zi", "zya", "zyu",
+            "zyo", "zyi", "zye", "zu", "ze", "zo", "da", "zi", "zya", "zyu", "zyo",
+            "zyi", "zye", "zu", "de", "do", "ba", "bi", "bya", "byu", "byo", "byi",
+            "bye", "bu", "be", "bo", "pa", "pi", "pya", "pyu", "pyo", "pyi", "pye",
+            "pu", "pe", "po", "va", "vi", "vu", "vya", "vyu", "vyo", "vyi", "vye",
+            "ve", "vo", ".", ",", ":", "/", "!", "?", "~", "-", "‘", "’", "“", "”",
+            "[", "]", "(", ")", "{", "}", " ", "ya", "yu", "yo", "a", "i", "u", "e",
+            "o", "", "a", "i", "u", "e", "o", "kka", "kki", "kkya", "kkyu", "kkyo",
+            "kkyi", "kkye", "kku", "kkya", "kkyu", "kkyo", "kkyi", "kkye", "kke",
+            "kko", "ssa", "ssi", "ssya", "ssyu", "ssyo", "ssyi", "ssye", "ssu", "sse",
+            "sso", "tta", "tti", "ttya", "ttyu", "ttyo", "ttyi", "ttye", "ttu", "tte",
+            "tto", "na", "ni", "nya", "nyu", "nyo", "nyi", "nye", "nu", "ne", "no",
+            "hha", "hhi", "hhya", "hhyu", "hhyo", "hhyi", "hhye", "hhu", "hhya",
+            "hhyu", "hhyo", "hhyi", "hhye", "hhe", "hho", "mma", "mmi", "mmya", "mmyu",
+            "mmyo", "mmyi", "mmye", "mmu", "mme", "mmo", "rra", "rri", "rrya", "rryu",
+            "rryo", "rryi", "rrye", "rru", "rre", "rro", "ya", "yu", "yo", "wwa", "i",
+            "e", "o", "n", "gga", "ggi", "ggya", "ggyu", "ggyo", "ggyi", "ggye", "ggu",
+            "gge", "ggo", "zza", "zzi", "zzya", "zzyu", "zzyo", "zzyi", "zzye", "zzu",
+            "zze", "zzo", "dda", "zzi", "zzya", "zzyu", "zzyo", "zzyi", "zzye", "zzu",
+            "dde", "ddo", "bba", "bbi", "bbya", "bbyu", "bbyo", "bbyi", "bbye", "bbu",
+            "bbe", "bbo", "ppa", "ppi", "ppya", "ppyu", "ppyo", "ppyi", "ppye", "ppu",
+            "ppe", "ppo", "vva", "vvi", "vvu", "vvya", "vvyu", "vvyo", "vvyi", "vvye",
+            "vve", "vvo", ".", ",", ":", "/", "!", "?", "~", "-", "‘", "’", "“", "”",
+            "[", "]", "(", ")", "{", "}", " ", "ya", "yu", "yo", "a", "i", "u", "e",
+            "o",
+        ),
+    )
+
+
+def kana_vowels():
+    return {
+        "あ": "a", "い": "i", "う": "u", "え": "e", "お": "o", "か": "a", "き": "i", "く": "u",
+        "け": "e", "こ": "o", "さ": "a", "し": "i", "す": "u", "せ": "e", "そ": "o", "た": "a",
+        "ち": "i", "つ": "u", "て": "e", "と": "o", "な": "a", "に": "i", "ぬ": "u", "ね": "e",
+        "の": "o", "は": "a", "ひ": "i", "ふ": "u", "へ": "e", "ほ": "o", "ま": "a", "み": "i",
+        "む": "u", "め": "e", "も": "o", "ら": "a", "り": "i", "る": "u", "れ": "e", "ろ": "o",
+        "や": "a", "ゆ": "u", "よ": "o", "わ": "a", "ゐ": "i", "ゑ": "e", "を": "o", "が": "a",
+        "ぎ": "i", "ぐ": "u", "げ": "e", "ご": "o", "ざ": "a", "じ": "i", "ず": "u", "ぜ": "e",
+        "ぞ": "o", "だ": "a", "ぢ": "i", "づ": "u", "で": "e", "ど": "o", "ば": "a", "び": "i",
+        "ぶ": "u", "べ": "e", "ぼ": "o", "ぱ": "a", "ぴ": "i", "ぷ": "u", "ぺ": "e", "ぽ": "o",
+        "ゔぁ": "a", "ゔぃ": "i", "ゔ": "u", "ゔぇ": "e", "ゔぉ": "o", "ゃ": "a", "ゅ": "u",
+        "ょ": "o", "ぁ": "a", "ぃ": "i", "ぅ": "u", "ぇ": "e", "ぉ": "o",
+    }
+
+
+SNAPSHOTS = {
+    ("romaji_to_kana", False, False): romaji_to_kana_false_false,
+    ("romaji_to_kana", False, True): romaji_to_kana_false_true,
+    ("romaji_to_kana", True, False): romaji_to_kana_true_false,
+    ("romaji_to_kana", True, True): romaji_to_kana_true_true,
+    ("kana_to_romaji", "hepburn"): kana_to_romaji_hepburn,
+    ("kana_to_romaji", "kunrei"): kana_to_romaji_kunrei,
+    ("kana_vowels",): kana_vowels,
+}
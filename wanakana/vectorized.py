@@ -0,0 +1,175 @@
+"""Whole-string classification with NumPy, for running the text checking utilities
+over large amounts of text.
+
+A string is turned into an array of code points, every character is classified
+with one table lookup, and the checks become array reductions. The results are the
+same as those of the functions in `wanakana`, which are used instead if NumPy isn't
+installed (install the `vectorized` extra to get it) or the input is too short for
+NumPy to pay off."""
+from typing import Iterable, List, Tuple, Union
+
+from . import common
+from .common import TOKEN_TYPES, _get_type_of_flags
+from .utils import (
+    CHAR_HIRAGANA,
+    CHAR_JAPANESE,
+    CHAR_KANA,
+    CHAR_KANJI,
+    CHAR_KATAKANA,
+    CHAR_ROMAJI,
+    is_empty,
+)
+from .utils.classification import (
+    BMP_SIZE,
+    CATEGORY_RANGES,
+    _bmp_flags,
+    _interval_flags,
+    _interval_starts,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+# below this many characters the pure Python functions are faster
+MIN_VECTOR_LENGTH = 32
+
+if NUMPY_AVAILABLE:
+    _bmp_flags_array = np.frombuffer(_bmp_flags, dtype=np.uint16)
+    _interval_starts_array = np.array(_interval_starts, dtype=np.uint32)
+    _interval_flags_array = np.array(_interval_flags, dtype=np.uint16)
+
+    # token types are looked up by category flags, so list every combination
+    _all_flags = 1 << len(CATEGORY_RANGES)
+    _type_names = list(TOKEN_TYPES.values())
+    _type_indices = [
+        np.array(
+            [
+                _type_names.index(_get_type_of_flags(flags, compact))
+                for flags in range(_all_flags)
+            ],
+            dtype=np.uint8,
+        )
+        for compact in [False, True]
+    ]
+
+
+def _use_numpy(input: str) -> bool:
+    return (
+        NUMPY_AVAILABLE and isinstance(input, str) and len(input) >= MIN_VECTOR_LENGTH
+    )
+
+
+def code_points(input: str) -> "np.ndarray":
+    """Returns the code points of `input` as an array of uint32"""
+    # surrogatepass keeps lone surrogates (e.g. from surrogateescape) as code points
+    return np.frombuffer(input.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+
+def _flags_of(codes: "np.ndarray") -> "np.ndarray":
+    flags = _bmp_flags_array[codes & (BMP_SIZE - 1)]
+    astral = codes >= BMP_SIZE
+    if astral.any():
+        intervals = np.searchsorted(_interval_starts_array, codes[astral], "right")
+        flags[astral] = _interval_flags_array[intervals - 1]
+    return flags
+
+
+def char_flags_array(input: str) -> "np.ndarray":
+    """Returns the categories (`CHAR_*` bit flags) of every character of `input`"""
+    return _flags_of(code_points(input))
+
+
+def _all_chars(input: str, category: int, augmented: Iterable = None) -> bool:
+    codes = code_points(input)
+    matches = (_flags_of(codes) & category) != 0
+    if augmented:
+        extra = [
+            ord(char) for char in augmented if isinstance(char, str) and len(char) == 1
+        ]
+        matches |= np.isin(codes, np.array(extra, dtype=np.uint32))
+    return bool(matches.all())
+
+
+def is_hiragana(input: str = "") -> bool:
+    """Tests if `input` is Hiragana"""
+    if not _use_numpy(input):
+        return common.is_hiragana(input)
+    return _all_chars(input, CHAR_HIRAGANA)
+
+
+def is_katakana(input: str = "") -> bool:
+    """Tests if `input` is Katakana"""
+    if not _use_numpy(input):
+        return common.is_katakana(input)
+    return _all_chars(input, CHAR_KATAKANA)
+
+
+def is_kana(input: str = "") -> bool:
+    """Tests if `input` is Kana (Katakana and/or Hiragana)"""
+    if not _use_numpy(input):
+        return common.is_kana(input)
+    return _all_chars(input, CHAR_KANA)
+
+
+def is_kanji(input: str = "") -> bool:
+    """Tests if `input` is Kanji (Japanese CJK Ideographs)"""
+    if not _use_numpy(input):
+        return common.is_kanji(input)
+    return _all_chars(input, CHAR_KANJI)
+
+
+def is_japanese(input: str = "", augmented: Iterable = None) -> bool:
+    """Tests if `input` includes only Kanji, Kana, zenkaku numbers, and
+    JA punctuation/symbols"""
+    if not _use_numpy(input):
+        return common.is_japanese(input, augmented)
+    return _all_chars(input, CHAR_JAPANESE, augmented)
+
+
+def is_romaji(input: str = "", augmented: Iterable = None) -> bool:
+    """Tests if `input` includes only Romaji characters (allowing Hepburn romanisation)"""
+    if not _use_numpy(input):
+        return common.is_romaji(input, augmented)
+    return _all_chars(input, CHAR_ROMAJI, augmented)
+
+
+def is_mixed(input: str = "", ignore_kanji: bool = True) -> bool:
+    """Tests if `input` contains a mix of Romaji *and* Kana, ignoring Kanji by default"""
+    if not _use_numpy(input):
+        return common.is_mixed(input, ignore_kanji)
+    flags = char_flags_array(input)
+    return (
+        bool((flags & CHAR_KANA).any())
+        and bool((flags & CHAR_ROMAJI).any())
+        and (ignore_kanji or not (flags & CHAR_KANJI).any())
+    )
+
+
+def tokenise(
+    input: str, compact: bool = False, detailed: bool = False, spans: bool = False
+) -> Union[List[str], List[List[str]], List[Tuple[str, int, int]]]:
+    """Splits input into list of strings separated by opinionated token types, like
+    `wanakana.tokenise`, finding the token boundaries with array operations"""
+    if not _use_numpy(input):
+        return common.tokenise(input, compact, detailed, spans)
+    if is_empty(input):
+        return []
+    types = _type_indices[bool(compact)][char_flags_array(input)]
+    # a token starts wherever the type changes
+    starts = np.flatnonzero(types[1:] != types[:-1]) + 1
+    bounds = [0, *starts.tolist(), len(input)]
+    if spans:
+        return [
+            (_type_names[types[start]], start, end)
+            for start, end in zip(bounds, bounds[1:])
+        ]
+    if not detailed:
+        return [input[start:end] for start, end in zip(bounds, bounds[1:])]
+    return [
+        [_type_names[types[start]], input[start:end]]
+        for start, end in zip(bounds, bounds[1:])
+    ]